@@ -3,7 +3,13 @@ import os
 import pickle
 import logging
 import asyncio
-from typing import Dict, Tuple, Optional
+from dataclasses import dataclass, fields
+from typing import Any, Dict, List, Tuple, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # heuristic mode must keep working without numpy
+    np = None
 
 # Import centralized error handling
 from core.error_handling import (
@@ -22,6 +28,7 @@ from core.circuit_breaker import (
     register_circuit_breaker,
 )
 from core.retry import Retry
+from config.config_loader import load_config_section
 from core.metrics import (
     ANOMALY_DETECTIONS_TOTAL,
     ANOMALY_MODEL_LOAD_ERRORS_TOTAL,
@@ -37,6 +44,61 @@ _MODEL: Optional[object] = None
 _MODEL_LOADED = False
 _USING_HEURISTIC_MODE = False
 
+THRESHOLDS_CONFIG_NAME = "fault_thresholds"
+
+
+@dataclass(frozen=True)
+class HeuristicThresholds:
+    """
+    Rules for heuristic (model-free) anomaly scoring.
+
+    Each violated rule adds its weight to the score; uniform noise in
+    ``[0, noise_max)`` is added and points scoring above
+    ``anomaly_threshold`` are anomalous.
+    """
+    voltage_min: float = 7.0
+    voltage_max: float = 9.0
+    temperature_max: float = 40.0
+    gyro_max: float = 0.1
+    voltage_weight: float = 0.4
+    temperature_weight: float = 0.3
+    gyro_weight: float = 0.3
+    invalid_score: float = 0.5
+    noise_max: float = 0.1
+    anomaly_threshold: float = 0.5
+
+    @classmethod
+    def from_dict(cls, config: Optional[Dict[str, Any]]) -> "HeuristicThresholds":
+        """Build thresholds from a config mapping, ignoring unknown keys."""
+        names = {f.name for f in fields(cls)}
+        return cls(**{k: float(v) for k, v in (config or {}).items() if k in names})
+
+    @classmethod
+    def from_config(cls, config_path: Optional[str] = None) -> "HeuristicThresholds":
+        """Load thresholds from the ``heuristic`` section of config/fault_thresholds.yaml."""
+        return cls.from_dict(load_config_section(THRESHOLDS_CONFIG_NAME, "heuristic", config_path))
+
+
+_HEURISTIC_THRESHOLDS: Optional[HeuristicThresholds] = None
+
+
+def get_heuristic_thresholds() -> HeuristicThresholds:
+    """Active heuristic thresholds (loaded from config on first use)."""
+    global _HEURISTIC_THRESHOLDS
+    if _HEURISTIC_THRESHOLDS is None:
+        try:
+            _HEURISTIC_THRESHOLDS = HeuristicThresholds.from_config()
+        except Exception as e:
+            logger.warning(f"Failed to load heuristic thresholds, using defaults: {e}")
+            _HEURISTIC_THRESHOLDS = HeuristicThresholds()
+    return _HEURISTIC_THRESHOLDS
+
+
+def set_heuristic_thresholds(thresholds: Optional[HeuristicThresholds]) -> None:
+    """Override the active heuristic thresholds (None reloads from config on next use)."""
+    global _HEURISTIC_THRESHOLDS
+    _HEURISTIC_THRESHOLDS = thresholds
+
 # Initialize circuit breaker for model loading
 _model_loader_cb = register_circuit_breaker(
     CircuitBreaker(
@@ -164,6 +226,65 @@ async def load_model() -> bool:
         return False
 
 
+def detect_anomaly_heuristic_arrays(
+    voltage: Sequence[float],
+    temperature: Sequence[float],
+    gyro: Sequence[float],
+    thresholds: Optional[HeuristicThresholds] = None,
+    noise: Optional[Sequence[float]] = None,
+    invalid: Optional[Sequence[bool]] = None,
+) -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    Heuristic anomaly detection over column arrays.
+
+    Args:
+        voltage: Battery voltage per point (V)
+        temperature: Temperature per point (°C)
+        gyro: Gyroscope reading per point (sign ignored)
+        thresholds: Scoring rules (active config if None)
+        noise: Per-point noise added to the score (drawn uniformly if None)
+        invalid: Per-point flag for unparseable telemetry, scored as
+            ``invalid_score`` regardless of the rules
+
+    Returns:
+        Tuple of (is_anomalous bool array, anomaly_score float array)
+    """
+    t = thresholds or get_heuristic_thresholds()
+    voltage = np.asarray(voltage, dtype=float)
+    temperature = np.asarray(temperature, dtype=float)
+    gyro = np.abs(np.asarray(gyro, dtype=float))
+    if noise is None:
+        noise = np.random.uniform(0, t.noise_max, voltage.shape)
+
+    # Same accumulation order as the scalar rules, so scores match exactly
+    score = np.zeros(voltage.shape)
+    score += np.where((voltage < t.voltage_min) | (voltage > t.voltage_max), t.voltage_weight, 0.0)
+    score += np.where(temperature > t.temperature_max, t.temperature_weight, 0.0)
+    score += np.where(gyro > t.gyro_max, t.gyro_weight, 0.0)
+    if invalid is not None:
+        score = np.where(np.asarray(invalid, dtype=bool), t.invalid_score, score)
+
+    score += np.asarray(noise, dtype=float)
+
+    # Conservative threshold: be more sensitive to potential issues
+    return score > t.anomaly_threshold, np.minimum(score, 1.0)
+
+
+def _parse_heuristic_input(data: Dict) -> Tuple[float, float, float, bool]:
+    """(voltage, temperature, gyro, invalid) for one telemetry dict."""
+    try:
+        return (
+            float(data.get("voltage", 8.0)),
+            float(data.get("temperature", 25.0)),
+            float(data.get("gyro", 0.0)),
+            False,
+        )
+    except (ValueError, TypeError):
+        # invalid data types in heuristic -> treat as anomalous
+        logger.warning(f"Heuristic mode encountered invalid data types: {data}")
+        return 0.0, 0.0, 0.0, True
+
+
 def _detect_anomaly_heuristic(data: Dict) -> Tuple[bool, float]:
     """
     Heuristic fallback anomaly detection.
@@ -180,31 +301,48 @@ def _detect_anomaly_heuristic(data: Dict) -> Tuple[bool, float]:
         logger.warning(f"Heuristic mode received non-dict input: {type(data)}")
         return False, 0.0
 
-    score = 0.0
+    t = get_heuristic_thresholds()
+    voltage, temperature, gyro, invalid = _parse_heuristic_input(data)
+    # Add small random noise for simulation realism
+    noise = random.uniform(0, t.noise_max)
 
-    # Conservative thresholds for heuristic mode
-    try:
-        voltage = float(data.get("voltage", 8.0))
-        temperature = float(data.get("temperature", 25.0))
-        gyro = abs(float(data.get("gyro", 0.0)))
-
-        if voltage < 7.0 or voltage > 9.0:
-            score += 0.4
-        if temperature > 40.0:
-            score += 0.3
-        if gyro > 0.1:
-            score += 0.3
-    except (ValueError, TypeError):
-        # invalid data types in heuristic -> treat as anomalous
-        logger.warning(f"Heuristic mode encountered invalid data types: {data}")
-        score += 0.5
+    if np is None:
+        score = t.invalid_score if invalid else (
+            (t.voltage_weight if voltage < t.voltage_min or voltage > t.voltage_max else 0.0)
+            + (t.temperature_weight if temperature > t.temperature_max else 0.0)
+            + (t.gyro_weight if abs(gyro) > t.gyro_max else 0.0)
+        )
+        score += noise
+        return score > t.anomaly_threshold, min(score, 1.0)
 
-    # Add small random noise for simulation realism
-    score += random.uniform(0, 0.1)
+    is_anomalous, score = detect_anomaly_heuristic_arrays(
+        [voltage], [temperature], [gyro], t, noise=[noise], invalid=[invalid]
+    )
+    return bool(is_anomalous[0]), float(score[0])
 
-    # Conservative threshold: be more sensitive to potential issues
-    is_anomalous = score > 0.5  # Lowered from 0.6 for more sensitivity
-    return is_anomalous, min(score, 1.0)  # Cap at 1.0
+
+def _detect_anomaly_heuristic_batch(data_list: List[Dict]) -> List[Tuple[bool, float]]:
+    """Heuristic detection for many telemetry dicts with one array evaluation."""
+    if np is None:
+        return [_detect_anomaly_heuristic(data) for data in data_list]
+
+    results: List[Tuple[bool, float]] = [(False, 0.0)] * len(data_list)
+    rows = []
+    parsed = []
+    for i, data in enumerate(data_list):
+        if not isinstance(data, dict):
+            logger.warning(f"Heuristic mode received non-dict input: {type(data)}")
+            continue
+        rows.append(i)
+        parsed.append(_parse_heuristic_input(data))
+    if not rows:
+        return results
+
+    voltage, temperature, gyro, invalid = zip(*parsed)
+    is_anomalous, scores = detect_anomaly_heuristic_arrays(voltage, temperature, gyro, invalid=invalid)
+    for i, flag, score in zip(rows, is_anomalous.tolist(), scores.tolist()):
+        results[i] = (flag, score)
+    return results
 
 
 @async_timeout(seconds=10.0, operation_name="anomaly_detection")
@@ -344,3 +482,138 @@ async def detect_anomaly(data: Dict) -> Tuple[bool, float]:
         )
         # Fall back to heuristic on any error
         return _detect_anomaly_heuristic(data)
+
+
+@async_timeout(seconds=30.0, operation_name="anomaly_detection_batch")
+async def detect_anomaly_batch(data_list: List[Dict]) -> List[Tuple[bool, float]]:
+    """
+    Detect anomalies in many telemetry points with one model call.
+
+    Performs the resource check and model load once, scores every valid
+    point with a single ``predict``/``score_samples`` call on the feature
+    matrix, and falls back to the heuristic per point exactly as
+    ``detect_anomaly`` does (invalid points, model errors, critical
+    resources).
+
+    Args:
+        data_list: Telemetry data dictionaries
+
+    Returns:
+        List of (is_anomalous, anomaly_score) tuples, aligned with data_list
+    """
+    global _USING_HEURISTIC_MODE
+    if not data_list:
+        return []
+
+    health_monitor = get_health_monitor()
+    resource_monitor = get_resource_monitor()
+
+    # Track latency
+    start_time = time.time()
+
+    try:
+        health_monitor.register_component("anomaly_detector")
+
+        # Check resource availability once for the whole batch
+        resource_status = resource_monitor.check_resource_health()
+        if resource_status['overall'] == 'critical':
+            logger.warning(
+                "System resources critical - using lightweight heuristic mode"
+            )
+            health_monitor.mark_degraded(
+                "anomaly_detector",
+                error_msg="Resource constraints - using heuristic mode",
+                fallback_active=True,
+                metadata={"resource_status": resource_status}
+            )
+            return _detect_anomaly_heuristic_batch(data_list)
+
+        # Ensure model is loaded once
+        if not _MODEL_LOADED:
+            await load_model()
+
+        results: List[Optional[Tuple[bool, float]]] = [None] * len(data_list)
+        valid_rows = []
+        invalid_rows = []
+        for i, data in enumerate(data_list):
+            try:
+                TelemetryData.validate(data)
+                valid_rows.append(i)
+            except ValidationError as e:
+                logger.warning(f"Telemetry validation failed: {e}")
+                invalid_rows.append(i)
+        for i, result in zip(invalid_rows, _detect_anomaly_heuristic_batch([data_list[i] for i in invalid_rows])):
+            results[i] = result
+
+        # Use model-based detection if available
+        if _MODEL and not _USING_HEURISTIC_MODE and valid_rows:
+            try:
+                # Prepare feature matrix (order matters for model consistency)
+                features = [
+                    [
+                        data_list[i].get("voltage", 8.0),
+                        data_list[i].get("temperature", 25.0),
+                        abs(data_list[i].get("gyro", 0.0)),
+                    ]
+                    for i in valid_rows
+                ]
+
+                labels = _MODEL.predict(features)
+                scores = (
+                    _MODEL.score_samples(features)
+                    if hasattr(_MODEL, "score_samples")
+                    else [0.5] * len(valid_rows)
+                )
+                for i, is_anomalous, score in zip(valid_rows, labels, scores):
+                    score = 0.5 if score is None else score
+                    results[i] = (bool(is_anomalous), max(0.0, min(float(score), 1.0)))
+
+                health_monitor.mark_healthy("anomaly_detector")
+
+                ANOMALY_DETECTIONS_TOTAL.labels(detector_type="model").inc(len(valid_rows))
+                ANOMALY_DETECTION_LATENCY.labels(detector_type="model").observe(
+                    time.time() - start_time
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Model prediction failed: {e}. Falling back to heuristic."
+                )
+                _USING_HEURISTIC_MODE = True
+                health_monitor.mark_degraded(
+                    "anomaly_detector",
+                    error_msg=f"Model prediction failed: {str(e)}",
+                    fallback_active=True,
+                )
+                # Fall through to heuristic
+
+        heuristic_rows = [i for i in valid_rows if results[i] is None]
+        if heuristic_rows:
+            heuristic_results = _detect_anomaly_heuristic_batch([data_list[i] for i in heuristic_rows])
+            for i, result in zip(heuristic_rows, heuristic_results):
+                results[i] = result
+            if _USING_HEURISTIC_MODE:
+                health_monitor.mark_degraded(
+                    "anomaly_detector",
+                    error_msg="Using heuristic detection",
+                    fallback_active=True,
+                    metadata={"mode": "heuristic"},
+                )
+            else:
+                health_monitor.mark_healthy("anomaly_detector")
+
+            ANOMALY_DETECTIONS_TOTAL.labels(detector_type="heuristic").inc(len(heuristic_rows))
+            ANOMALY_DETECTION_LATENCY.labels(detector_type="heuristic").observe(
+                time.time() - start_time
+            )
+
+        return results
+
+    except Exception as e:
+        logger.error(f"Unexpected error in batch anomaly detection: {e}")
+        health_monitor.mark_degraded(
+            "anomaly_detector",
+            error_msg=f"Unexpected error: {str(e)}",
+            fallback_active=True,
+        )
+        # Fall back to heuristic on any error
+        return _detect_anomaly_heuristic_batch(data_list)
@@ -54,8 +54,8 @@ from api.auth import get_api_key
 from state_machine.state_engine import StateMachine, MissionPhase
 from config.mission_phase_policy_loader import MissionPhasePolicyLoader
 from anomaly_agent.phase_aware_handler import PhaseAwareAnomalyHandler
-from anomaly.anomaly_detector import detect_anomaly, load_model
-from classifier.fault_classifier import classify
+from anomaly.anomaly_detector import detect_anomaly, detect_anomaly_batch, load_model
+from classifier.fault_classifier import classify, classify_batch
 from core.component_health import get_health_monitor
 from memory_engine.memory_store import AdaptiveMemoryStore
 from security_engine.predictive_maintenance import (
@@ -215,6 +215,8 @@ async def lifespan(app: FastAPI):
 
     # Initialize components
     await initialize_components()
+    if predictive_engine:
+        predictive_engine.start_training_scheduler()
     
     # Pre-load anomaly detection model async
     await load_model()
@@ -266,6 +268,8 @@ async def lifespan(app: FastAPI):
     yield
 
     # Cleanup
+    if predictive_engine:
+        await predictive_engine.shutdown()
     if memory_store:
         memory_store.save()
     if redis_client:
@@ -586,13 +590,7 @@ async def submit_telemetry(telemetry: TelemetryInput, current_user: User = Depen
 async def _process_telemetry(telemetry: TelemetryInput, request_start: float) -> AnomalyResponse:
     """Internal telemetry processing logic."""
     # Convert telemetry to dict
-    data = {
-        "voltage": telemetry.voltage,
-        "temperature": telemetry.temperature,
-        "gyro": telemetry.gyro,
-        "current": telemetry.current or 0.0,
-        "wheel_speed": telemetry.wheel_speed or 0.0,
-    }
+    data = _telemetry_to_dict(telemetry)
 
     # Update global latest telemetry
     global latest_telemetry_data
@@ -608,39 +606,14 @@ async def _process_telemetry(telemetry: TelemetryInput, request_start: float) ->
     anomaly_type = classify(data)
 
     # Predictive Maintenance: Add training data and check for predictions
-    predictive_actions = []
     if predictive_engine:
         try:
-            # Create time-series data point
-            ts_data = TimeSeriesData(
-                timestamp=datetime.now(),
-                cpu_usage=telemetry.cpu_usage or 0.0,
-                memory_usage=telemetry.memory_usage or 0.0,
-                network_latency=telemetry.network_latency or 0.0,
-                disk_io=telemetry.disk_io or 0.0,
-                error_rate=telemetry.error_rate or 0.0,
-                response_time=telemetry.response_time or 0.0,
-                active_connections=telemetry.active_connections or 0,
-                failure_occurred=is_anomaly
-            )
+            ts_data = _to_time_series(telemetry, is_anomaly)
 
             # Add training data
             await predictive_engine.add_training_data(ts_data)
 
-            # Check for failure predictions
-            predictions = await predictive_engine.predict_failures(ts_data)
-
-            if predictions:
-                logger.info(f"Predictive maintenance: {len(predictions)} failure predictions made")
-
-                # Trigger preventive actions
-                actions = await predictive_engine.trigger_preventive_actions(predictions)
-                predictive_actions = actions
-
-                # Log predictions for monitoring
-                for prediction in predictions:
-                    logger.warning(f"PREDICTED FAILURE: {prediction.failure_type.value} "
-                                 f"at {prediction.predicted_time} (prob: {prediction.probability:.2f})")
+            await _run_failure_predictions(ts_data)
 
         except Exception as e:
             logger.error(f"Predictive maintenance failed: {e}")
@@ -648,71 +621,20 @@ async def _process_telemetry(telemetry: TelemetryInput, request_start: float) ->
 
     # Get phase-aware decision if anomaly detected
     if is_anomaly:
-        decision = phase_aware_handler.handle_anomaly(
-            anomaly_type=anomaly_type,
-            severity_score=anomaly_score,
-            confidence=0.85,
-            anomaly_metadata={"telemetry": data}
-        )
-
-        response = AnomalyResponse(
-            is_anomaly=True,
-            anomaly_score=anomaly_score,
-            anomaly_type=decision['anomaly_type'],
-            severity_score=decision['severity_score'],
-            severity_level=decision['policy_decision']['severity'],
-            mission_phase=decision['mission_phase'],
-            recommended_action=decision['recommended_action'],
-            escalation_level=decision['policy_decision']['escalation_level'],
-            is_allowed=decision['policy_decision']['is_allowed'],
-            allowed_actions=decision['policy_decision']['allowed_actions'],
-            should_escalate_to_safe_mode=decision['should_escalate_to_safe_mode'],
-            confidence=decision['detection_confidence'],
-            reasoning=decision['reasoning'],
-            recurrence_count=decision['recurrence_info']['count'],
-            timestamp=telemetry.timestamp if telemetry.timestamp else datetime.now()
-        )
+        response, decision = _build_anomaly_response(telemetry, data, anomaly_type, anomaly_score)
 
         # Store in history
         anomaly_history.append(response)
 
         # Store in memory with embedding (simple feature vector)
-        embedding = np.array([
-            telemetry.voltage,
-            telemetry.temperature,
-            abs(telemetry.gyro),
-            telemetry.current or 0.0,
-            telemetry.wheel_speed or 0.0
-        ])
         memory_store.write(
-            embedding=embedding,
-            metadata={
-                "anomaly_type": anomaly_type,
-                "severity": anomaly_score,
-                "critical": decision['should_escalate_to_safe_mode']
-            },
+            embedding=_anomaly_embedding(telemetry),
+            metadata=_anomaly_memory_metadata(anomaly_type, anomaly_score, decision),
             timestamp=telemetry.timestamp
         )
 
     else:
-        # No anomaly
-        response = AnomalyResponse(
-            is_anomaly=False,
-            anomaly_score=anomaly_score,
-            anomaly_type="normal",
-            severity_score=0.0,
-            severity_level="LOW",
-            mission_phase=state_machine.get_current_phase().value,
-            recommended_action="NO_ACTION",
-            escalation_level="NO_ACTION",
-            is_allowed=True,
-            allowed_actions=[],
-            should_escalate_to_safe_mode=False,
-            confidence=0.9,
-            reasoning="All telemetry parameters within normal range",
-            recurrence_count=0,
-            timestamp=telemetry.timestamp if telemetry.timestamp else datetime.now()
-        )
+        response = _build_normal_response(telemetry, anomaly_score, state_machine.get_current_phase().value)
 
     # Record latency in observability (if enabled)
     if OBSERVABILITY_ENABLED:
@@ -722,6 +644,188 @@ async def _process_telemetry(telemetry: TelemetryInput, request_start: float) ->
     return response
 
 
+async def _process_telemetry_batch(telemetry_list: List[TelemetryInput], request_start: float) -> List[AnomalyResponse]:
+    """
+    Internal batch processing logic.
+
+    Scores the whole batch with one detector call and one vectorized
+    classification, feeds predictive maintenance in bulk and writes all
+    anomalies to memory in one call. Phase-aware decisions stay per point
+    and in order, since they track recurrence.
+    """
+    datas = [_telemetry_to_dict(telemetry) for telemetry in telemetry_list]
+
+    # Update global latest telemetry
+    global latest_telemetry_data
+    latest_telemetry_data = {
+        "data": datas[-1],
+        "timestamp": datetime.now()
+    }
+
+    detections = await detect_anomaly_batch(datas)
+    anomaly_types = classify_batch(datas)
+
+    # Predictive Maintenance: bulk training data, predictions on the latest state
+    if predictive_engine:
+        try:
+            ts_points = [
+                _to_time_series(telemetry, is_anomaly)
+                for telemetry, (is_anomaly, _) in zip(telemetry_list, detections)
+            ]
+            await predictive_engine.add_training_data_batch(ts_points)
+            await _run_failure_predictions(ts_points[-1])
+
+        except Exception as e:
+            logger.error(f"Predictive maintenance failed: {e}")
+            # Don't fail the request if predictive maintenance fails
+
+    mission_phase = state_machine.get_current_phase().value
+    responses = []
+    embeddings = []
+    memory_metadata = []
+    memory_timestamps = []
+
+    for telemetry, data, (is_anomaly, anomaly_score), anomaly_type in zip(
+        telemetry_list, datas, detections, anomaly_types
+    ):
+        if is_anomaly:
+            response, decision = _build_anomaly_response(telemetry, data, anomaly_type, anomaly_score)
+            anomaly_history.append(response)
+
+            embeddings.append(_anomaly_embedding(telemetry))
+            memory_metadata.append(_anomaly_memory_metadata(anomaly_type, anomaly_score, decision))
+            memory_timestamps.append(telemetry.timestamp)
+        else:
+            response = _build_normal_response(telemetry, anomaly_score, mission_phase)
+        responses.append(response)
+
+    if embeddings:
+        memory_store.write_batch(embeddings, memory_metadata, memory_timestamps)
+
+    # Record latency in observability (if enabled)
+    if OBSERVABILITY_ENABLED:
+        elapsed_ms = (time.time() - request_start) * 1000
+        DETECTION_LATENCY.observe(elapsed_ms / 1000.0)
+
+    return responses
+
+
+def _telemetry_to_dict(telemetry: TelemetryInput) -> dict:
+    """Detector/classifier input for a telemetry point."""
+    return {
+        "voltage": telemetry.voltage,
+        "temperature": telemetry.temperature,
+        "gyro": telemetry.gyro,
+        "current": telemetry.current or 0.0,
+        "wheel_speed": telemetry.wheel_speed or 0.0,
+    }
+
+
+def _to_time_series(telemetry: TelemetryInput, is_anomaly: bool) -> TimeSeriesData:
+    """Predictive-maintenance data point for a telemetry point."""
+    return TimeSeriesData(
+        timestamp=datetime.now(),
+        cpu_usage=telemetry.cpu_usage or 0.0,
+        memory_usage=telemetry.memory_usage or 0.0,
+        network_latency=telemetry.network_latency or 0.0,
+        disk_io=telemetry.disk_io or 0.0,
+        error_rate=telemetry.error_rate or 0.0,
+        response_time=telemetry.response_time or 0.0,
+        active_connections=telemetry.active_connections or 0,
+        failure_occurred=is_anomaly
+    )
+
+
+async def _run_failure_predictions(ts_data: TimeSeriesData) -> list:
+    """Check for failure predictions and trigger preventive actions."""
+    predictions = await predictive_engine.predict_failures(ts_data)
+    if not predictions:
+        return []
+
+    logger.info(f"Predictive maintenance: {len(predictions)} failure predictions made")
+
+    # Trigger preventive actions
+    actions = await predictive_engine.trigger_preventive_actions(predictions)
+
+    # Log predictions for monitoring
+    for prediction in predictions:
+        logger.warning(f"PREDICTED FAILURE: {prediction.failure_type.value} "
+                     f"at {prediction.predicted_time} (prob: {prediction.probability:.2f})")
+    return actions
+
+
+def _build_anomaly_response(
+    telemetry: TelemetryInput, data: dict, anomaly_type: str, anomaly_score: float
+) -> tuple:
+    """Run the phase-aware handler and build the response for an anomalous point."""
+    decision = phase_aware_handler.handle_anomaly(
+        anomaly_type=anomaly_type,
+        severity_score=anomaly_score,
+        confidence=0.85,
+        anomaly_metadata={"telemetry": data}
+    )
+
+    response = AnomalyResponse(
+        is_anomaly=True,
+        anomaly_score=anomaly_score,
+        anomaly_type=decision['anomaly_type'],
+        severity_score=decision['severity_score'],
+        severity_level=decision['policy_decision']['severity'],
+        mission_phase=decision['mission_phase'],
+        recommended_action=decision['recommended_action'],
+        escalation_level=decision['policy_decision']['escalation_level'],
+        is_allowed=decision['policy_decision']['is_allowed'],
+        allowed_actions=decision['policy_decision']['allowed_actions'],
+        should_escalate_to_safe_mode=decision['should_escalate_to_safe_mode'],
+        confidence=decision['detection_confidence'],
+        reasoning=decision['reasoning'],
+        recurrence_count=decision['recurrence_info']['count'],
+        timestamp=telemetry.timestamp if telemetry.timestamp else datetime.now()
+    )
+    return response, decision
+
+
+def _build_normal_response(telemetry: TelemetryInput, anomaly_score: float, mission_phase: str) -> AnomalyResponse:
+    """Response for a point with no anomaly."""
+    return AnomalyResponse(
+        is_anomaly=False,
+        anomaly_score=anomaly_score,
+        anomaly_type="normal",
+        severity_score=0.0,
+        severity_level="LOW",
+        mission_phase=mission_phase,
+        recommended_action="NO_ACTION",
+        escalation_level="NO_ACTION",
+        is_allowed=True,
+        allowed_actions=[],
+        should_escalate_to_safe_mode=False,
+        confidence=0.9,
+        reasoning="All telemetry parameters within normal range",
+        recurrence_count=0,
+        timestamp=telemetry.timestamp if telemetry.timestamp else datetime.now()
+    )
+
+
+def _anomaly_embedding(telemetry: TelemetryInput) -> np.ndarray:
+    """Memory-store embedding (simple feature vector) for an anomalous point."""
+    return np.array([
+        telemetry.voltage,
+        telemetry.temperature,
+        abs(telemetry.gyro),
+        telemetry.current or 0.0,
+        telemetry.wheel_speed or 0.0
+    ])
+
+
+def _anomaly_memory_metadata(anomaly_type: str, anomaly_score: float, decision: dict) -> dict:
+    """Memory-store metadata for an anomalous point."""
+    return {
+        "anomaly_type": anomaly_type,
+        "severity": anomaly_score,
+        "critical": decision['should_escalate_to_safe_mode']
+    }
+
+
 @app.get("/api/v1/telemetry/latest")
 async def get_latest_telemetry(api_key: APIKey = Depends(get_api_key)):
     """Get the most recent telemetry data point."""
@@ -740,14 +844,40 @@ async def submit_telemetry_batch(batch: TelemetryBatch, current_user: User = Dep
     Returns:
         BatchAnomalyResponse with aggregated results
     """
-    results = []
-    anomalies_detected = 0
+    request_start = time.time()
+
+    # CHAOS INJECTION HOOK (checked once per batch)
+    if check_chaos_injection("network_latency"):
+        time.sleep(2.0)  # Simulate 2s latency
+
+    if check_chaos_injection("model_loader"):
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Chaos Injection: Model Loader Failed"
+        )
+
+    try:
+        if OBSERVABILITY_ENABLED:
+            with track_request("anomaly_detection_batch"):
+                with span_anomaly_detection(data_size=len(batch.telemetry), model_name="detector_v1"):
+                    results = await _process_telemetry_batch(batch.telemetry, request_start)
+        else:
+            results = await _process_telemetry_batch(batch.telemetry, request_start)
+    except Exception as e:
+        if OBSERVABILITY_ENABLED:
+            logger = get_logger(__name__)
+            log_error(logger, e, {"endpoint": "/api/v1/telemetry/batch"})
 
-    for telemetry in batch.telemetry:
-        result = await submit_telemetry(telemetry)
-        results.append(result)
-        if result.is_anomaly:
-            anomalies_detected += 1
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Anomaly detection failed: {str(e)}"
+        ) from e
+
+    anomalies_detected = sum(1 for result in results if result.is_anomaly)
+    if OBSERVABILITY_ENABLED:
+        for result in results:
+            if result.is_anomaly:
+                ANOMALY_DETECTIONS.labels(severity=result.severity_level.lower()).inc()
 
     return BatchAnomalyResponse(
         total_processed=len(results),
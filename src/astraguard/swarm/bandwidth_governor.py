@@ -6,12 +6,16 @@ Issue #404: Communication protocols - bandwidth-aware messaging
 - Priority queues: CRITICAL(health) > HIGH(intent) > NORMAL(coord)
 - Congestion signals: 70%→90%→100% utilization thresholds
 - DoS prevention for 10-agent constellations
+- Async egress scheduler: send() waits for tokens instead of dropping,
+  strict priority across classes, weighted fair queueing across peers
 """
 
+from collections import deque
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
-from typing import Dict, Optional
+from typing import Deque, Dict, Optional
 import asyncio
+import math
+import time
 from enum import Enum
 
 from astraguard.swarm.models import AgentID, SwarmConfig
@@ -24,6 +28,13 @@ class MessagePriority(str, Enum):
     NORMAL = "NORMAL"      # Coordination messages
 
 
+# Scheduler service order (strict priority)
+PRIORITY_ORDER = (
+    MessagePriority.CRITICAL,
+    MessagePriority.HIGH,
+    MessagePriority.NORMAL,
+)
+
 # Priority allocation percentages (0.0-1.0)
 PRIORITY_ALLOCATION = {
     MessagePriority.CRITICAL: 0.80,
@@ -42,7 +53,7 @@ class TokenBucket:
     rate: float              # Tokens per second (bytes/s)
     burst: float             # Maximum burst size (bytes)
     _tokens: float = field(default=0.0, init=False)
-    _last_update: datetime = field(default_factory=datetime.utcnow, init=False)
+    _last_update: float = field(default_factory=time.monotonic, init=False)
     
     def __post_init__(self):
         """Initialize with full tokens."""
@@ -50,8 +61,8 @@ class TokenBucket:
     
     def _refill(self) -> None:
         """Add tokens based on elapsed time."""
-        now = datetime.utcnow()
-        elapsed = (now - self._last_update).total_seconds()
+        now = time.monotonic()
+        elapsed = now - self._last_update
         self._last_update = now
         
         # Add tokens: rate * elapsed time
@@ -77,6 +88,15 @@ class TokenBucket:
         
         return False
     
+    def time_until(self, tokens: float) -> float:
+        """Seconds until ``tokens`` can be acquired (inf if above burst)."""
+        self._refill()
+        if self._tokens >= tokens:
+            return 0.0
+        if tokens > self.burst or self.rate <= 0:
+            return math.inf
+        return (tokens - self._tokens) / self.rate
+    
     def tokens_available(self) -> float:
         """Get current available tokens."""
         self._refill()
@@ -98,6 +118,15 @@ class BandwidthStats:
     throttled_messages: int = 0
     congestion_events: int = 0
     peak_utilization: float = 0.0
+    queued_messages: int = 0       # Messages that went through send()
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+    
+    def average_wait_seconds(self) -> float:
+        """Average time send() callers waited for tokens."""
+        if self.queued_messages == 0:
+            return 0.0
+        return self.total_wait_seconds / self.queued_messages
     
     def average_message_size(self) -> float:
         """Average bytes per message."""
@@ -112,6 +141,17 @@ class BandwidthStats:
         return self.dropped_messages / self.total_messages
 
 
+@dataclass
+class _SendRequest:
+    """A send() call waiting in the egress scheduler."""
+    peer: AgentID
+    size: int
+    priority: MessagePriority
+    finish_tag: float        # WFQ virtual finish time within its class
+    future: asyncio.Future
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
 class BandwidthGovernor:
     """Bandwidth governor with per-peer rate limiting and priority queues.
     
@@ -120,6 +160,11 @@ class BandwidthGovernor:
     - Per-peer limit: 1KB/s (configurable)
     - Priority allocation: CRITICAL > HIGH > NORMAL
     - Burst allowance: 2KB global, 500B per-peer
+    
+    acquire_tokens() is a non-blocking check that refuses under
+    congestion. send() queues the message instead and returns once its
+    tokens have been taken. Classes are served in strict priority order,
+    and peers within a class share bandwidth by weighted fair queueing.
     """
     
     # Default rates (bytes/s)
@@ -146,9 +191,20 @@ class BandwidthGovernor:
             burst=self.DEFAULT_GLOBAL_BURST
         )
         self.stats = BandwidthStats()
-        self._priority_queues: Dict[MessagePriority, asyncio.Queue] = {
-            p: asyncio.Queue() for p in MessagePriority
+        
+        # Egress scheduler state: per class, per peer FIFO of pending sends
+        self.peer_weights: Dict[AgentID, float] = {}
+        self._queues: Dict[MessagePriority, Dict[AgentID, Deque[_SendRequest]]] = {
+            p: {} for p in MessagePriority
+        }
+        self._virtual_time: Dict[MessagePriority, float] = {
+            p: 0.0 for p in MessagePriority
+        }
+        self._last_finish: Dict[MessagePriority, Dict[AgentID, float]] = {
+            p: {} for p in MessagePriority
         }
+        self._wakeup: Optional[asyncio.Event] = None
+        self._scheduler_task: Optional[asyncio.Task] = None
     
     def _get_peer_bucket(self, peer: AgentID) -> TokenBucket:
         """Get or create token bucket for peer."""
@@ -201,12 +257,7 @@ class BandwidthGovernor:
         peer_ok = self._get_peer_bucket(peer).acquire(size)
         
         if global_ok and peer_ok:
-            self.stats.total_bytes_sent += size
-            self.stats.total_messages += 1
-            self.stats.peak_utilization = max(
-                self.stats.peak_utilization,
-                global_util
-            )
+            self._record_sent(size, global_util)
             return True
         
         # Refund tokens if partial failure
@@ -218,6 +269,167 @@ class BandwidthGovernor:
         self.stats.throttled_messages += 1
         return False
     
+    async def send(
+        self,
+        peer: AgentID,
+        size: int,
+        priority: MessagePriority = MessagePriority.NORMAL
+    ) -> None:
+        """Wait until bandwidth is available, then consume it.
+        
+        Unlike acquire_tokens(), nothing is dropped: the caller is queued
+        and released as soon as the global and peer buckets can cover
+        ``size``.
+        
+        Args:
+            peer: Target peer AgentID
+            size: Message size in bytes
+            priority: Message priority level
+        
+        Raises:
+            ValueError: If size exceeds the global or peer burst, so it
+                could never be sent
+        """
+        self._check_sendable(peer, size)
+        
+        loop = asyncio.get_running_loop()
+        weight = self.peer_weights.get(peer, 1.0)
+        last_finish = self._last_finish[priority]
+        start = max(self._virtual_time[priority], last_finish.get(peer, 0.0))
+        request = _SendRequest(
+            peer=peer,
+            size=size,
+            priority=priority,
+            finish_tag=start + size / weight,
+            future=loop.create_future(),
+        )
+        last_finish[peer] = request.finish_tag
+        self._queues[priority].setdefault(peer, deque()).append(request)
+        
+        if self._scheduler_task is None or self._scheduler_task.done():
+            self._wakeup = asyncio.Event()
+            self._scheduler_task = loop.create_task(self._run_scheduler())
+        else:
+            self._wakeup.set()
+        
+        await request.future
+    
+    def set_peer_weight(self, peer: AgentID, weight: float) -> None:
+        """Set a peer's WFQ weight (default 1.0) for future send() calls.
+        
+        Args:
+            peer: Target peer
+            weight: Relative share of bandwidth within a priority class
+        """
+        if weight <= 0:
+            raise ValueError("weight must be positive")
+        self.peer_weights[peer] = weight
+    
+    def queue_depths(self) -> Dict[str, int]:
+        """Pending send() calls per priority class."""
+        return {
+            priority.value: sum(len(q) for q in peers.values())
+            for priority, peers in self._queues.items()
+        }
+    
+    def _check_sendable(self, peer: AgentID, size: int) -> None:
+        """Reject sizes that no amount of waiting could satisfy."""
+        limit = min(self.global_bucket.burst, self._get_peer_bucket(peer).burst)
+        if size > limit:
+            raise ValueError(
+                f"Message of {size}B exceeds burst limit of {limit:.0f}B"
+            )
+    
+    def _record_sent(self, size: int, global_util: float) -> None:
+        """Account for a message that has been granted bandwidth."""
+        self.stats.total_bytes_sent += size
+        self.stats.total_messages += 1
+        self.stats.peak_utilization = max(
+            self.stats.peak_utilization,
+            global_util
+        )
+    
+    def _grant(self, request: _SendRequest) -> None:
+        """Consume tokens for a queued request and release its caller."""
+        global_util = self.global_bucket.utilization()
+        self.global_bucket.acquire(request.size)
+        self._get_peer_bucket(request.peer).acquire(request.size)
+        self._record_sent(request.size, global_util)
+        
+        waited = time.monotonic() - request.enqueued_at
+        self.stats.queued_messages += 1
+        self.stats.total_wait_seconds += waited
+        self.stats.max_wait_seconds = max(self.stats.max_wait_seconds, waited)
+        self._virtual_time[request.priority] = max(
+            self._virtual_time[request.priority], request.finish_tag
+        )
+        request.future.set_result(None)
+    
+    def _dispatch(self) -> Optional[float]:
+        """Release every queued request that can be sent now.
+        
+        Returns:
+            Seconds until the next request could be sent, 0.0 to run again
+            immediately, or None when nothing is queued
+        """
+        next_wait = math.inf
+        pending = False
+        
+        for priority in PRIORITY_ORDER:
+            peers = self._queues[priority]
+            heads = []
+            for peer, queue in list(peers.items()):
+                while queue and queue[0].future.done():
+                    queue.popleft()  # Caller was cancelled
+                if queue:
+                    heads.append(queue[0])
+                else:
+                    # Idle peers restart from the class virtual time
+                    del peers[peer]
+                    self._last_finish[priority].pop(peer, None)
+            if not heads:
+                continue
+            pending = True
+            
+            # Lowest virtual finish time goes first; a peer that is only
+            # held back by its own bucket does not block other peers
+            heads.sort(key=lambda r: r.finish_tag)
+            for request in heads:
+                global_wait = self.global_bucket.time_until(request.size)
+                peer_wait = self._get_peer_bucket(request.peer).time_until(
+                    request.size
+                )
+                if math.isinf(global_wait) or math.isinf(peer_wait):
+                    peers[request.peer].popleft()
+                    request.future.set_exception(ValueError(
+                        f"Message of {request.size}B exceeds burst limit"
+                    ))
+                    return 0.0
+                if global_wait == 0.0 and peer_wait == 0.0:
+                    peers[request.peer].popleft()
+                    self._grant(request)
+                    return 0.0
+                next_wait = min(next_wait, max(global_wait, peer_wait))
+                if global_wait > 0.0:
+                    # Global bandwidth is exhausted: lower classes wait too
+                    return next_wait
+        
+        return next_wait if pending else None
+    
+    async def _run_scheduler(self) -> None:
+        """Background task releasing queued send() calls as tokens refill."""
+        while True:
+            wait = self._dispatch()
+            if wait is None:
+                return
+            if wait == 0.0:
+                continue
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=wait)
+            except asyncio.TimeoutError:
+                pass
+    
     def set_peer_limit(self, peer: AgentID, kbps: int) -> None:
         """Dynamically adjust per-peer rate limit.
         
@@ -304,6 +516,10 @@ class BandwidthGovernor:
             "throttled_messages": stats.throttled_messages,
             "congestion_events": stats.congestion_events,
             "peak_utilization": stats.peak_utilization,
+            "queued_messages": stats.queued_messages,
+            "queue_depth": self.queue_depths(),
+            "average_wait_ms": stats.average_wait_seconds() * 1000,
+            "max_wait_ms": stats.max_wait_seconds * 1000,
             "average_message_size": stats.average_message_size(),
             "drop_rate": stats.drop_rate(),
             "global_utilization": self.get_global_utilization(),
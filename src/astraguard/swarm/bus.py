@@ -7,6 +7,8 @@ Issue #398: Message bus abstraction for distributed satellite constellation
 - ISL bandwidth constraints (10KB/s)
 - Latency simulation (50-200ms)
 - Deduplication and ordering (Issue #403 prep)
+- Topic trie subscription index with bounded concurrent callback dispatch
+- Bounded FIFO deduplication window shared with ReliableDelivery
 """
 
 import asyncio
@@ -29,6 +31,172 @@ from astraguard.swarm.types import (
 
 logger = logging.getLogger(__name__)
 
+# Callback dispatch limits
+DEFAULT_MAX_CONCURRENT_CALLBACKS = 64
+DEFAULT_CALLBACK_WAIT_MS = 100
+
+# Deduplication window size
+DEFAULT_DEDUP_WINDOW = 1000
+
+
+class _TopicNode:
+    """One topic level of a TopicTrie."""
+
+    __slots__ = ("children", "exact", "prefix")
+
+    def __init__(self):
+        self.children: Dict[str, "_TopicNode"] = {}
+        self.exact: Dict[SubscriptionID, int] = {}  # filter == path to this node
+        self.prefix: Dict[SubscriptionID, int] = {}  # filter == path + "/*"
+
+
+class TopicTrie:
+    """Subscription index keyed on '/'-separated topic levels.
+
+    Matches exactly what TopicFilter.matches does:
+    - "*" subscriptions match every topic
+    - "a/b/*" subscriptions live on node a/b and match any topic below it
+    - other filters live on their own node and match that topic only
+
+    Lookup walks one path of the trie, so matching costs
+    O(topic depth + matches) instead of O(subscriptions). Matches are
+    returned in subscription order.
+    """
+
+    def __init__(self):
+        """Initialize empty trie."""
+        self._root = _TopicNode()
+        self._match_all: Dict[SubscriptionID, int] = {}
+        self._sequence = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, topic_filter: str, sub_id: SubscriptionID) -> None:
+        """Index a subscription under its topic filter."""
+        self._sequence += 1
+        if topic_filter == "*":
+            bucket = self._match_all
+        else:
+            levels, wildcard = self._split_filter(topic_filter)
+            node = self._root
+            for level in levels:
+                node = node.children.setdefault(level, _TopicNode())
+            bucket = node.prefix if wildcard else node.exact
+        if sub_id not in bucket:
+            self._size += 1
+        bucket[sub_id] = self._sequence
+
+    def remove(self, topic_filter: str, sub_id: SubscriptionID) -> bool:
+        """Remove a subscription, pruning empty nodes.
+
+        Returns:
+            True if the subscription was indexed
+        """
+        if topic_filter == "*":
+            removed = self._match_all.pop(sub_id, None) is not None
+        else:
+            levels, wildcard = self._split_filter(topic_filter)
+            path = [self._root]
+            for level in levels:
+                node = path[-1].children.get(level)
+                if node is None:
+                    return False
+                path.append(node)
+            bucket = path[-1].prefix if wildcard else path[-1].exact
+            removed = bucket.pop(sub_id, None) is not None
+            if removed:
+                for depth in range(len(levels), 0, -1):
+                    node = path[depth]
+                    if node.children or node.exact or node.prefix:
+                        break
+                    del path[depth - 1].children[levels[depth - 1]]
+        if removed:
+            self._size -= 1
+        return removed
+
+    def match(self, topic: str) -> List[SubscriptionID]:
+        """Subscriptions whose filter matches ``topic``, in subscription order."""
+        found = dict(self._match_all)
+        levels = topic.split("/")
+        last = len(levels) - 1
+        node = self._root
+        for depth, level in enumerate(levels):
+            node = node.children.get(level)
+            if node is None:
+                break
+            if depth < last:
+                found.update(node.prefix)
+            else:
+                found.update(node.exact)
+        return sorted(found, key=found.__getitem__)
+
+    def clear(self) -> None:
+        """Remove all subscriptions."""
+        self._root = _TopicNode()
+        self._match_all = {}
+        self._size = 0
+
+    @staticmethod
+    def _split_filter(topic_filter: str):
+        """Split a filter into (levels, is "/*" wildcard)."""
+        if topic_filter.endswith("/*"):
+            return topic_filter[:-2].split("/"), True
+        return topic_filter.split("/"), False
+
+
+class DedupWindow:
+    """Bounded set of recently seen keys with oldest-first expiry.
+
+    Keys live in a fixed-size ring (insertion order) plus a hash set
+    (membership). Inserting into a full window overwrites the oldest ring
+    slot, so add, evict and lookup are all O(1) and memory never exceeds
+    ``capacity`` keys.
+    """
+
+    __slots__ = ("capacity", "_ring", "_keys", "_head")
+
+    def __init__(self, capacity: int = DEFAULT_DEDUP_WINDOW):
+        """Initialize empty window.
+
+        Args:
+            capacity: Maximum number of keys remembered
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._ring: List[Any] = [None] * capacity
+        self._keys: Set[Any] = set()
+        self._head = 0  # next slot to write == oldest key once full
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._keys
+
+    def add(self, key: Any) -> bool:
+        """Remember a key, evicting the oldest one if the window is full.
+
+        Returns:
+            True if the key is new, False if it is already in the window
+        """
+        if key in self._keys:
+            return False
+        if len(self._keys) == self.capacity:
+            self._keys.discard(self._ring[self._head])
+        self._ring[self._head] = key
+        self._keys.add(key)
+        self._head = (self._head + 1) % self.capacity
+        return True
+
+    def clear(self) -> None:
+        """Forget all keys."""
+        self._ring = [None] * self.capacity
+        self._keys.clear()
+        self._head = 0
+
 
 class SwarmMessageBus:
     """High-performance pub/sub message bus for satellite constellations.
@@ -40,6 +208,9 @@ class SwarmMessageBus:
     - Latency simulation (50-200ms typical)
     - Message deduplication and ordering
     - Subscription management with leak detection
+    - O(topic depth + matches) subscription lookup via TopicTrie
+    - Async callbacks run concurrently (bounded); the publisher waits at
+      most callback_wait_ms for them
     """
 
     def __init__(
@@ -48,6 +219,8 @@ class SwarmMessageBus:
         serializer: SwarmSerializer,
         isl_bandwidth_kbps: int = 10,
         latency_ms: int = 100,
+        max_concurrent_callbacks: int = DEFAULT_MAX_CONCURRENT_CALLBACKS,
+        callback_wait_ms: int = DEFAULT_CALLBACK_WAIT_MS,
     ):
         """Initialize message bus.
         
@@ -56,22 +229,33 @@ class SwarmMessageBus:
             serializer: SwarmSerializer for message encoding
             isl_bandwidth_kbps: ISL bandwidth limit (default 10 KB/s)
             latency_ms: ISL latency in milliseconds (default 100ms)
+            max_concurrent_callbacks: Async callbacks allowed to run at once
+            callback_wait_ms: How long a publish waits for its async
+                callbacks before leaving them running in the background
         """
+        if max_concurrent_callbacks <= 0:
+            raise ValueError("max_concurrent_callbacks must be positive")
         self.config = config
         self.serializer = serializer
         self.isl_bandwidth_kbps = isl_bandwidth_kbps
         self.latency_ms = latency_ms
+        self.callback_wait_ms = callback_wait_ms
 
         # Subscription management
         self.subscriptions: Dict[SubscriptionID, Callable] = {}
         self.topic_subscribers: Dict[str, List[SubscriptionID]] = defaultdict(list)
         self.topic_filters: Dict[str, TopicFilter] = {}
+        self.subscription_index = TopicTrie()
+
+        # Async callback dispatch
+        self._callback_slots = asyncio.Semaphore(max_concurrent_callbacks)
+        self._callback_tasks: Set[asyncio.Task] = set()
 
         # Message tracking
         self.message_sequence = 0
         self.pending_acks: Dict[str, asyncio.Event] = {}
-        self.received_messages: Set[str] = set()  # Deduplication
-        self.max_stored_messages = 1000
+        self.max_stored_messages = DEFAULT_DEDUP_WINDOW
+        self.received_messages = DedupWindow(self.max_stored_messages)
 
         # Metrics
         self.metrics = {
@@ -226,12 +410,6 @@ class SwarmMessageBus:
                 await self._deliver_message(message)
                 self.received_messages.add(msg_key)
 
-                # Cleanup old messages
-                if len(self.received_messages) > self.max_stored_messages:
-                    # Remove oldest (FIFO)
-                    oldest = list(self.received_messages)[0]
-                    self.received_messages.discard(oldest)
-
                 self.metrics["delivered"] += 1
                 self.metrics["acked"] += 1
                 return True
@@ -251,27 +429,44 @@ class SwarmMessageBus:
         return False
 
     async def _deliver_message(self, message: SwarmMessage) -> None:
-        """Deliver message to subscribers."""
-        # Find matching subscribers
-        matching_subs: List[SubscriptionID] = []
+        """Deliver message to subscribers.
 
-        for sub_id in list(self.subscriptions.keys()):
-            topic_filter = self.topic_filters.get(str(sub_id))
-            if topic_filter and topic_filter.matches(message.topic):
-                matching_subs.append(sub_id)
+        Sync callbacks run inline in subscription order. Coroutines returned
+        by async callbacks run as concurrent tasks (at most
+        max_concurrent_callbacks at once); the publisher waits up to
+        callback_wait_ms for them and leaves slower ones running.
+        """
+        pending: List[asyncio.Task] = []
 
-        # Deliver to all matching subscribers
-        for sub_id in matching_subs:
+        for sub_id in self.subscription_index.match(message.topic):
             callback = self.subscriptions.get(sub_id)
-            if callback:
-                try:
-                    result = callback(message)
-                    if asyncio.iscoroutine(result):
-                        await result
-                except Exception as e:
-                    logger.error(
-                        f"Error in subscription callback {sub_id}: {e}"
-                    )
+            if callback is None:
+                continue
+            try:
+                result = callback(message)
+            except Exception as e:
+                logger.error(
+                    f"Error in subscription callback {sub_id}: {e}"
+                )
+                continue
+            if asyncio.iscoroutine(result):
+                task = asyncio.create_task(self._run_callback(sub_id, result))
+                self._callback_tasks.add(task)
+                task.add_done_callback(self._callback_tasks.discard)
+                pending.append(task)
+
+        if pending:
+            await asyncio.wait(pending, timeout=self.callback_wait_ms / 1000.0)
+
+    async def _run_callback(self, sub_id: SubscriptionID, coro: Any) -> None:
+        """Await a callback coroutine within the concurrency limit."""
+        async with self._callback_slots:
+            try:
+                await coro
+            except Exception as e:
+                logger.error(
+                    f"Error in subscription callback {sub_id}: {e}"
+                )
 
     async def _simulate_latency(self) -> None:
         """Simulate ISL latency."""
@@ -307,6 +502,7 @@ class SwarmMessageBus:
             self.subscriptions[sub_id] = callback
             self.topic_filters[str(sub_id)] = filter_obj
             self.topic_subscribers[topic_filter].append(sub_id)
+            self.subscription_index.add(topic_filter, sub_id)
 
             logger.debug(f"Subscription {sub_id.id} created for {topic_filter}")
             return sub_id
@@ -328,6 +524,7 @@ class SwarmMessageBus:
             self.subscriptions.pop(subscription_id)
             topic_filter_str = subscription_id.topic_filter
             self.topic_filters.pop(str(subscription_id), None)
+            self.subscription_index.remove(topic_filter_str, subscription_id)
 
             if topic_filter_str in self.topic_subscribers:
                 try:
@@ -375,6 +572,7 @@ class SwarmMessageBus:
             "subscriptions": len(self.subscriptions),
             "pending_acks": len(self.pending_acks),
             "deduplication_cache": len(self.received_messages),
+            "callbacks_in_flight": len(self._callback_tasks),
             "message_sequence": self.message_sequence,
         }
 
@@ -394,6 +592,7 @@ class SwarmMessageBus:
         self.subscriptions.clear()
         self.topic_filters.clear()
         self.topic_subscribers.clear()
+        self.subscription_index.clear()
         self.pending_acks.clear()
         self.received_messages.clear()
         self.metrics = {
@@ -6,14 +6,17 @@ Issue #399: State compression for bandwidth-constrained ISL links
 - Stage 2: 8-bit quantization (25% reduction)
 - Stage 3: LZ4 compression (12% reduction)
 - Target: 4.2KB → <800B (85% compression)
+- Batch API: many peers' summaries per call, delta references kept per peer
 """
 
 import struct
 import logging
 import datetime
-from typing import Optional
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
 from dataclasses import dataclass
 
+import numpy as np
+
 from astraguard.swarm.models import HealthSummary
 
 logger = logging.getLogger(__name__)
@@ -23,6 +26,9 @@ QUANTIZATION_SCALE = 128  # 8-bit range: -128 to 127 (~±0.01 accuracy)
 QUANTIZATION_OFFSET = 128
 MIN_FLOAT = -1.0
 MAX_FLOAT = 1.0
+SIGNATURE_DIM = 32
+SCALAR_BYTES = 8  # risk_score + recurrence_score as float32
+HEADER_FORMAT = "<BBH"  # version, flags, original_size
 
 try:
     import lz4.frame
@@ -55,6 +61,9 @@ class StateCompressor:
             prev_state.anomaly_signature if prev_state else None
         )
         self.stats = None
+        # Per-peer delta references for compress_batch / decompress_batch
+        self.peer_encode_refs: Dict[Hashable, np.ndarray] = {}
+        self.peer_decode_refs: Dict[Hashable, np.ndarray] = {}
 
     def compress_health(
         self, summary: HealthSummary, use_lz4: bool | None = None
@@ -94,7 +103,7 @@ class StateCompressor:
             original_size = self._calculate_original_size(summary)
 
             output = struct.pack(
-                "<BBH", version, flags, original_size
+                HEADER_FORMAT, version, flags, original_size
             ) + compressed_data
 
             # Update statistics
@@ -125,7 +134,7 @@ class StateCompressor:
             if len(data) < 6:
                 raise ValueError("Data too short for header")
 
-            version, flags, original_size = struct.unpack("<BBH", data[:4])
+            version, flags, original_size = struct.unpack(HEADER_FORMAT, data[:4])
             compressed_data = data[4:]
 
             if version != 1:
@@ -152,6 +161,144 @@ class StateCompressor:
             logger.error(f"Decompression failed: {e}")
             raise ValueError(f"State decompression pipeline error: {e}")
 
+    # ===== Batch API =====
+
+    def compress_batch(
+        self,
+        summaries: Sequence[Tuple[Hashable, HealthSummary]],
+        use_lz4: bool | None = None,
+    ) -> List[bytes]:
+        """Compress many peers' HealthSummaries in one vectorized pass.
+
+        Each peer keeps its own delta reference, so a frame for peer P is
+        delta encoded against the last summary compressed for P (by this
+        or an earlier batch). Frames use the compress_health wire format.
+
+        Args:
+            summaries: (peer_key, HealthSummary) pairs; a peer may repeat
+            use_lz4: Enable LZ4 compression (stage 3). If None, auto-detect
+
+        Returns:
+            One compressed frame per input pair, in input order
+
+        Raises:
+            ValueError: If compression pipeline fails
+        """
+        if use_lz4 is None:
+            use_lz4 = HAS_LZ4
+        use_lz4 = use_lz4 and HAS_LZ4
+        if not summaries:
+            return []
+
+        try:
+            count = len(summaries)
+            signatures = np.empty((count, SIGNATURE_DIM), dtype=np.float64)
+            scalars = np.empty((count, 2), dtype="<f4")
+            refs = np.zeros((count, SIGNATURE_DIM), dtype=np.float64)
+            for row, (peer, summary) in enumerate(summaries):
+                signatures[row] = summary.anomaly_signature
+                scalars[row] = (summary.risk_score, summary.recurrence_score)
+                ref = self.peer_encode_refs.get(peer)
+                if ref is not None:
+                    refs[row] = ref
+                self.peer_encode_refs[peer] = signatures[row].copy()
+
+            # Stages 1 + 2 for the whole batch (deltas pass through float32
+            # exactly as in the single-summary wire format)
+            quantized = self._quantize((signatures - refs).astype("<f4"))
+
+            header = struct.pack(
+                HEADER_FORMAT,
+                1,
+                0x01 if use_lz4 else 0x00,
+                self._calculate_original_size(summaries[0][1]),
+            )
+            rows = np.concatenate(
+                [scalars.view(np.uint8), quantized], axis=1
+            )
+            if use_lz4:
+                return [
+                    header + self._stage3_lz4_compress(row.tobytes())
+                    for row in rows
+                ]
+            return [header + row.tobytes() for row in rows]
+
+        except Exception as e:
+            logger.error(f"Batch compression failed: {e}")
+            raise ValueError(f"State compression pipeline error: {e}")
+
+    def decompress_batch(
+        self, frames: Sequence[Tuple[Hashable, bytes]]
+    ) -> List[HealthSummary]:
+        """Decompress many peers' frames in one vectorized pass.
+
+        Inverse of compress_batch: each frame is delta decoded against the
+        last summary decompressed for the same peer.
+
+        Args:
+            frames: (peer_key, compressed frame) pairs; a peer may repeat
+
+        Returns:
+            Restored HealthSummaries, in input order
+
+        Raises:
+            ValueError: If decompression fails or data is invalid
+        """
+        if not frames:
+            return []
+
+        try:
+            count = len(frames)
+            payload_size = SCALAR_BYTES + SIGNATURE_DIM
+            payloads = np.empty((count, payload_size), dtype=np.uint8)
+            for row, (_, data) in enumerate(frames):
+                if len(data) < 6:
+                    raise ValueError("Data too short for header")
+                version, flags, _ = struct.unpack_from(HEADER_FORMAT, data)
+                if version != 1:
+                    raise ValueError(
+                        f"Unsupported compression version: {version}"
+                    )
+                body = data[4:]
+                if flags & 0x01:
+                    if not HAS_LZ4:
+                        raise ValueError("LZ4 decompression not available")
+                    body = self._stage3_lz4_decompress(body)
+                payloads[row] = np.frombuffer(
+                    body, dtype=np.uint8, count=payload_size
+                )
+
+            scalars = (
+                payloads[:, :SCALAR_BYTES].copy().view("<f4").astype(np.float64)
+            )
+            deltas = self._dequantize(payloads[:, SCALAR_BYTES:]).astype(
+                np.float64
+            )
+
+            # Apply deltas; repeats of a peer chain on its previous row
+            signatures = np.empty_like(deltas)
+            for row, (peer, _) in enumerate(frames):
+                ref = self.peer_decode_refs.get(peer)
+                signatures[row] = deltas[row] if ref is None else ref + deltas[row]
+                self.peer_decode_refs[peer] = signatures[row].copy()
+
+            timestamp = datetime.datetime.utcnow()
+            return [
+                HealthSummary(
+                    anomaly_signature=sig,
+                    risk_score=risk,
+                    recurrence_score=recurrence,
+                    timestamp=timestamp,
+                )
+                for sig, (risk, recurrence) in zip(
+                    signatures.tolist(), scalars.tolist()
+                )
+            ]
+
+        except Exception as e:
+            logger.error(f"Batch decompression failed: {e}")
+            raise ValueError(f"State decompression pipeline error: {e}")
+
     # ===== Stage 1: Delta Encoding =====
 
     def _stage1_delta_encode(self, summary: HealthSummary) -> bytes:
@@ -163,25 +310,20 @@ class StateCompressor:
         
         if self.prev_anomaly_sig is None:
             # First message: store full signature
-            delta_values = anomaly_sig
+            delta_values = np.asarray(anomaly_sig, dtype=np.float64)
         else:
             # Store deltas relative to previous signature
-            delta_values = [
-                curr - prev
-                for curr, prev in zip(anomaly_sig, self.prev_anomaly_sig)
-            ]
-
-        # Encode as binary: each float32 is 4 bytes × 32 values = 128 bytes per signature
-        # Plus metadata: scalar fields (risk_score, recurrence_score)
-        output = struct.pack("<f", summary.risk_score)
-        output += struct.pack("<f", summary.recurrence_score)
-        
-        # Skip timestamp to avoid serialization issues
-        # Timestamp will be set to current time on deserialization
+            delta_values = np.subtract(
+                anomaly_sig, self.prev_anomaly_sig, dtype=np.float64
+            )
 
-        # Encode anomaly signature deltas
-        for delta_val in delta_values:
-            output += struct.pack("<f", delta_val)
+        # Encode as binary: scalar fields (risk_score, recurrence_score)
+        # then each float32 delta, 4 bytes × 32 values = 128 bytes per signature.
+        # Timestamp is skipped to avoid serialization issues; it is set to
+        # current time on deserialization.
+        output = struct.pack(
+            "<2f", summary.risk_score, summary.recurrence_score
+        ) + delta_values.astype("<f4").tobytes()
 
         # Update state for next delta
         self.prev_anomaly_sig = anomaly_sig
@@ -192,31 +334,20 @@ class StateCompressor:
         self, delta_data: bytes, original_size: int
     ) -> HealthSummary:
         """Stage 1 (reverse): Restore from delta encoding."""
-        offset = 0
-
         # Unpack scalar fields
-        risk_score = struct.unpack_from("<f", delta_data, offset)[0]
-        offset += 4
-
-        recurrence_score = struct.unpack_from("<f", delta_data, offset)[0]
-        offset += 4
+        risk_score, recurrence_score = struct.unpack_from("<2f", delta_data)
 
         # Timestamp skipped during encoding, use current time
         timestamp = datetime.datetime.utcnow()
 
-        # Unpack anomaly signature deltas
-        anomaly_sig = []
-        for _ in range(32):
-            delta_val = struct.unpack_from("<f", delta_data, offset)[0]
-            offset += 4
-
-            # Apply delta if we have previous signature
-            if self.prev_anomaly_sig:
-                value = self.prev_anomaly_sig[len(anomaly_sig)] + delta_val
-            else:
-                value = delta_val
-
-            anomaly_sig.append(value)
+        # Unpack anomaly signature deltas, applying them to the previous
+        # signature if we have one
+        deltas = np.frombuffer(
+            delta_data, dtype="<f4", count=SIGNATURE_DIM, offset=SCALAR_BYTES
+        ).astype(np.float64)
+        if self.prev_anomaly_sig:
+            deltas += self.prev_anomaly_sig
+        anomaly_sig = deltas.tolist()
 
         # Update state for next delta
         self.prev_anomaly_sig = anomaly_sig
@@ -228,8 +359,6 @@ class StateCompressor:
             timestamp=timestamp,
         )
 
-        return summary
-
     # ===== Stage 2: 8-bit Quantization =====
 
     def _stage2_quantize(self, delta_data: bytes) -> bytes:
@@ -238,52 +367,31 @@ class StateCompressor:
         Maps [-1.0, 1.0] to [0, 255] with ±0.01 accuracy.
         Only quantizes anomaly signature, preserves scalar fields.
         """
-        offset = 0
-        output = b""
-
         # Keep scalar fields unquantized (8 bytes: risk_score (4) + recurrence_score (4))
-        # No timestamp in delta_data anymore
-        output += delta_data[:8]
-        offset = 8
-
-        # Quantize anomaly signature (32 values)
-        while offset < len(delta_data):
-            float_val = struct.unpack_from("<f", delta_data, offset)[0]
-            offset += 4
-
-            # Map to 8-bit range: [-1.0, 1.0] → [0, 255]
-            # Clamp to valid range
-            clamped = max(MIN_FLOAT, min(MAX_FLOAT, float_val))
-
-            # Normalize to [0, 1] then scale to [0, 255]
-            normalized = (clamped - MIN_FLOAT) / (MAX_FLOAT - MIN_FLOAT)
-            quantized = int(round(normalized * 255))
-
-            output += struct.pack("<B", quantized)
-
-        return output
+        deltas = np.frombuffer(delta_data, dtype="<f4", offset=SCALAR_BYTES)
+        return delta_data[:SCALAR_BYTES] + self._quantize(deltas).tobytes()
 
     def _stage2_dequantize(self, quantized_data: bytes) -> bytes:
         """Stage 2 (reverse): Dequantize uint8 back to float32."""
-        offset = 0
-        output = b""
-
         # Copy scalar fields (8 bytes)
-        output += quantized_data[:8]
-        offset = 8
-
-        # Dequantize anomaly signature (32 values)
-        while offset < len(quantized_data):
-            quantized = struct.unpack_from("<B", quantized_data, offset)[0]
-            offset += 1
-
-            # Map back: [0, 255] → [-1.0, 1.0]
-            normalized = quantized / 255.0
-            float_val = MIN_FLOAT + normalized * (MAX_FLOAT - MIN_FLOAT)
+        quantized = np.frombuffer(
+            quantized_data, dtype=np.uint8, offset=SCALAR_BYTES
+        )
+        return quantized_data[:SCALAR_BYTES] + self._dequantize(quantized).tobytes()
 
-            output += struct.pack("<f", float_val)
+    @staticmethod
+    def _quantize(values: np.ndarray) -> np.ndarray:
+        """Map float values in [-1.0, 1.0] to uint8 [0, 255], clamping outliers."""
+        clamped = np.clip(values.astype(np.float64), MIN_FLOAT, MAX_FLOAT)
+        normalized = (clamped - MIN_FLOAT) / (MAX_FLOAT - MIN_FLOAT)
+        # np.rint rounds half to even, like the built-in round()
+        return np.rint(normalized * 255).astype(np.uint8)
 
-        return output
+    @staticmethod
+    def _dequantize(quantized: np.ndarray) -> np.ndarray:
+        """Map uint8 [0, 255] back to little-endian float32 in [-1.0, 1.0]."""
+        normalized = quantized / 255.0
+        return (MIN_FLOAT + normalized * (MAX_FLOAT - MIN_FLOAT)).astype("<f4")
 
     # ===== Stage 3: LZ4 Compression =====
 
@@ -6,13 +6,18 @@ Issue #402: Communication protocols - intent signal exchange
 - QoS=2 reliable delivery (prep for Issue #403)
 - Conflict scoring: geometric overlap + temporal overlap + priority
 - Integration: Registry (#400), Bus (#398), Compressor (#399)
+- Active intents indexed per action type (time intervals, attitude angles)
+  with lazy heap-based expiry
 """
 
 import asyncio
+import bisect
+import heapq
 import json
 import logging
+from collections import deque
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Deque, Dict, Iterator, List, Optional, Tuple
 from datetime import datetime, timedelta
 import math
 
@@ -29,6 +34,101 @@ INTENT_HISTORY_SIZE = 100  # Keep last N intents per agent
 INTENT_TIMEOUT = 300  # Intent expires after 5 minutes
 CONFLICT_THRESHOLD = 0.6  # 0.0-1.0, flag if >= this value
 
+# Pairwise conflict bounds used to prune candidates (see _compute_pairwise_conflict)
+DIFFERENT_ACTION_CONFLICT = 0.2
+NO_TIME_OVERLAP_MAX_CONFLICT = 0.1  # geometric (<=1.0) x 0.1 temporal multiplier
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+@dataclass
+class _IndexedIntent:
+    """An active intent with its precomputed index keys."""
+    
+    key: int
+    intent: IntentMessage
+    expires_at: datetime
+    start: float                   # seconds since epoch
+    end: Optional[float]           # None if duration is not numeric
+    angle: Optional[float]         # None unless a target_angle in [0, 360)
+
+
+class _IntentIndex:
+    """Active intents of one action type.
+    
+    - Interval index: entries sorted by start time plus the longest
+      duration seen, so intervals overlapping [start, end] are found by
+      bisecting starts in [start - max_duration, end].
+    - Angle index: attitude angles in [0, 360) sorted on the circle and
+      walked outward from a query angle (nearest first).
+    Entries the indexes cannot order (non-numeric duration or angle, or
+    angles outside [0, 360)) are kept in side tables and always checked.
+    """
+    
+    def __init__(self):
+        self.entries: Dict[int, _IndexedIntent] = {}
+        self.untimed: Dict[int, _IndexedIntent] = {}
+        self.unangled: Dict[int, _IndexedIntent] = {}
+        self._starts: List[Tuple[float, int]] = []
+        self._max_duration = 0.0
+        self._angles: List[Tuple[float, int]] = []
+    
+    def __len__(self) -> int:
+        return len(self.entries)
+    
+    def add(self, entry: _IndexedIntent) -> None:
+        self.entries[entry.key] = entry
+        if entry.end is None:
+            self.untimed[entry.key] = entry
+        else:
+            bisect.insort(self._starts, (entry.start, entry.key))
+            self._max_duration = max(self._max_duration, entry.end - entry.start)
+        if entry.angle is None:
+            self.unangled[entry.key] = entry
+        else:
+            bisect.insort(self._angles, (entry.angle, entry.key))
+    
+    def remove(self, entry: _IndexedIntent) -> None:
+        del self.entries[entry.key]
+        if entry.end is None:
+            del self.untimed[entry.key]
+        else:
+            self._starts.pop(bisect.bisect_left(self._starts, (entry.start, entry.key)))
+        if entry.angle is None:
+            del self.unangled[entry.key]
+        else:
+            self._angles.pop(bisect.bisect_left(self._angles, (entry.angle, entry.key)))
+        if not self._starts:
+            self._max_duration = 0.0
+    
+    def overlapping(self, start: float, end: float) -> Iterator[_IndexedIntent]:
+        """Timed entries whose interval touches [start, end] (inclusive)."""
+        lo = bisect.bisect_left(self._starts, (start - self._max_duration, -1))
+        hi = bisect.bisect_right(self._starts, (end, math.inf))
+        for _, key in self._starts[lo:hi]:
+            entry = self.entries[key]
+            if entry.end >= start:
+                yield entry
+    
+    def nearest_angles(self, angle: float) -> Iterator[Tuple[float, _IndexedIntent]]:
+        """(circular distance, entry) for indexed angles, nearest first."""
+        angles = self._angles
+        count = len(angles)
+        right = bisect.bisect_left(angles, (angle, -1))
+        left = right - 1
+        for _ in range(count):
+            right_diff = (angles[right % count][0] - angle) % 360
+            left_diff = (angle - angles[left % count][0]) % 360
+            if right_diff <= left_diff:
+                key = angles[right % count][1]
+                right += 1
+                diff = right_diff
+            else:
+                key = angles[left % count][1]
+                left -= 1
+                diff = left_diff
+            yield min(diff, 360 - diff), self.entries[key]
+
 
 @dataclass
 class IntentStats:
@@ -62,10 +162,18 @@ class IntentBroadcaster:
         self.compressor = compressor
         
         # Track known intents per agent
-        self.intent_history: Dict[AgentID, List[IntentMessage]] = {}
+        self.intent_history: Dict[AgentID, Deque[IntentMessage]] = {}
         self.stats = IntentStats()
         self.sequence_counter = 0
         
+        # Active intents: per action type index, expiry heap, and the entry
+        # for each stored intent (by identity, oldest first per agent)
+        self._active_by_type: Dict[str, _IntentIndex] = {}
+        self._expiry_heap: List[Tuple[datetime, int, _IndexedIntent]] = []
+        self._entries_by_agent: Dict[AgentID, Deque[_IndexedIntent]] = {}
+        self._active_count = 0
+        self._next_key = 0
+        
         logger.info("IntentBroadcaster initialized")
     
     async def publish_intent(self, intent: IntentMessage) -> bool:
@@ -138,23 +246,90 @@ class IntentBroadcaster:
         Returns:
             Float 0.0-1.0 where 1.0 = complete conflict
         """
-        if not self.intent_history:
+        self._expire_intents()
+        if not self._active_count:
             return 0.0
         
-        # Collect all non-expired intents
-        known_intents = self._get_active_intents()
+        best = 0.0
+        index = self._active_by_type.get(new_intent.action_type)
+        same_type = len(index) if index else 0
+        if self._active_count > same_type:
+            best = DIFFERENT_ACTION_CONFLICT
+        if not same_type:
+            return best
         
-        if not known_intents:
-            return 0.0
+        # Score candidates that can still beat `best`: same type and
+        # overlapping in time (and, for attitude, close in angle)
+        new_entry = self._make_entry(new_intent, key=-1)
+        best = self._score_candidates(index, new_entry, best)
         
-        # Compute scores against each known intent
-        scores = []
-        for known in known_intents:
-            score = self._compute_pairwise_conflict(new_intent, known)
-            scores.append(score)
+        # Intents that do not overlap in time score at most 0.1
+        if best < NO_TIME_OVERLAP_MAX_CONFLICT:
+            for entry in index.entries.values():
+                best = max(
+                    best, self._compute_pairwise_conflict(new_intent, entry.intent)
+                )
         
-        # Return max conflict (worst case)
-        return max(scores) if scores else 0.0
+        return best
+    
+    def _score_candidates(
+        self, index: _IntentIndex, new_entry: _IndexedIntent, best: float
+    ) -> float:
+        """Max conflict vs same-type intents that may score above `best`.
+        
+        Intents that do not overlap new_entry in time are skipped (they
+        score at most NO_TIME_OVERLAP_MAX_CONFLICT; the caller rescans if
+        nothing better is found). For attitude_adjust, unless the time
+        window alone is narrow, the angle index is walked nearest first and
+        stops once 1 - distance/180, an upper bound on the pairwise score,
+        cannot beat `best`. Attitude intents without an indexable angle are
+        always scored.
+        """
+        new_intent = new_entry.intent
+        
+        def overlaps(entry: _IndexedIntent) -> bool:
+            return (
+                new_entry.end is None
+                or entry.end is None
+                or (entry.start <= new_entry.end and entry.end >= new_entry.start)
+            )
+        
+        def score(entries) -> float:
+            return max(
+                (self._compute_pairwise_conflict(new_intent, e.intent) for e in entries),
+                default=0.0,
+            )
+        
+        if new_intent.action_type == "attitude_adjust":
+            if new_entry.angle is None:
+                # Angles outside [0, 360) can score above the 0.1 bound
+                return max(best, score(index.entries.values()))
+            best = max(best, score(index.unangled.values()))
+            if new_entry.end is not None:
+                in_window = list(index.overlapping(new_entry.start, new_entry.end))
+                if 4 * (len(in_window) + len(index.untimed)) <= len(index):
+                    # Time window is the narrower index
+                    return max(
+                        best,
+                        score(in_window),
+                        score(index.untimed.values()),
+                    )
+            for distance, entry in index.nearest_angles(new_entry.angle):
+                if 1.0 - distance / 180.0 + 1e-9 <= best:
+                    break
+                if overlaps(entry):
+                    best = max(
+                        best, self._compute_pairwise_conflict(new_intent, entry.intent)
+                    )
+            return best
+        
+        if new_entry.end is None:
+            return max(best, score(index.entries.values()))
+        return max(
+            best,
+            score(index.untimed.values()),
+            score(index.overlapping(new_entry.start, new_entry.end)),
+        )
     
     def _compute_pairwise_conflict(
         self, intent_a: IntentMessage, intent_b: IntentMessage
@@ -267,28 +442,71 @@ class IntentBroadcaster:
     
     def _store_intent(self, intent: IntentMessage):
         """Store intent in local history."""
-        if intent.sender not in self.intent_history:
-            self.intent_history[intent.sender] = []
+        history = self.intent_history.get(intent.sender)
+        if history is None:
+            history = deque(maxlen=INTENT_HISTORY_SIZE)
+            self.intent_history[intent.sender] = history
+            self._entries_by_agent[intent.sender] = deque()
+        entries = self._entries_by_agent[intent.sender]
         
-        history = self.intent_history[intent.sender]
+        # Trim to size limit: the oldest intent leaves history and the index
+        if len(history) == INTENT_HISTORY_SIZE:
+            self._deactivate(entries.popleft())
         history.append(intent)
         
-        # Trim to size limit
-        if len(history) > INTENT_HISTORY_SIZE:
-            self.intent_history[intent.sender] = history[-INTENT_HISTORY_SIZE:]
+        entry = self._make_entry(intent, key=self._next_key)
+        self._next_key += 1
+        entries.append(entry)
+        self._active_by_type.setdefault(intent.action_type, _IntentIndex()).add(entry)
+        self._active_count += 1
+        heapq.heappush(self._expiry_heap, (entry.expires_at, entry.key, entry))
     
     def _get_active_intents(self) -> List[IntentMessage]:
         """Get all non-expired intents from history."""
-        now = datetime.utcnow()
-        active = []
+        self._expire_intents()
+        return [
+            entry.intent
+            for index in self._active_by_type.values()
+            for entry in index.entries.values()
+        ]
+    
+    @staticmethod
+    def _make_entry(intent: IntentMessage, key: int) -> _IndexedIntent:
+        """Compute index keys for an intent."""
+        start = (intent.timestamp - _EPOCH).total_seconds()
+        duration = intent.parameters.get("duration", 0)
+        end = start + duration if isinstance(duration, (int, float)) else None
         
-        for agent_id, intents in self.intent_history.items():
-            for intent in intents:
-                age = (now - intent.timestamp).total_seconds()
-                if age < INTENT_TIMEOUT:
-                    active.append(intent)
+        angle = intent.parameters.get("target_angle", 0)
+        if not isinstance(angle, (int, float)) or not 0 <= angle < 360:
+            angle = None
         
-        return active
+        return _IndexedIntent(
+            key=key,
+            intent=intent,
+            expires_at=intent.timestamp + timedelta(seconds=INTENT_TIMEOUT),
+            start=start,
+            end=end,
+            angle=angle,
+        )
+    
+    def _deactivate(self, entry: _IndexedIntent) -> None:
+        """Drop an entry from the active indexes if still present."""
+        index = self._active_by_type.get(entry.intent.action_type)
+        if index is None or entry.key not in index.entries:
+            return
+        index.remove(entry)
+        self._active_count -= 1
+        if not index:
+            del self._active_by_type[entry.intent.action_type]
+    
+    def _expire_intents(self) -> None:
+        """Lazily drop intents older than INTENT_TIMEOUT."""
+        now = datetime.utcnow()
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            _, _, entry = heapq.heappop(heap)
+            self._deactivate(entry)
     
     def _update_average_conflict(self, new_score: float):
         """Update running average conflict score."""
@@ -11,13 +11,13 @@ Issue #403: Communication protocols - reliable message delivery
 
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, Set
+from typing import Dict, Any, Optional
 import asyncio
 import logging
 from enum import IntEnum
 
 from astraguard.swarm.types import SwarmMessage, QoSLevel, SwarmTopic
-from astraguard.swarm.bus import SwarmMessageBus
+from astraguard.swarm.bus import SwarmMessageBus, DedupWindow
 from astraguard.swarm.models import AgentID
 
 logger = logging.getLogger(__name__)
@@ -111,7 +111,7 @@ class ReliableDelivery:
         self.sender_id = sender_id
         self.pending: Dict[int, SentMsg] = {}  # seq → SentMsg
         self.next_seq = 0
-        self.received_seqs: Set[int] = set()  # For deduplication
+        self.received_seqs = DedupWindow(1000)  # For deduplication
         self.stats = DeliveryStats()
         self._ack_events: Dict[int, asyncio.Event] = {}
         self._ack_status: Dict[int, AckStatus] = {}
@@ -305,17 +305,11 @@ class ReliableDelivery:
         Returns:
             True if new, False if duplicate
         """
-        if seq in self.received_seqs:
+        # Window keeps the last 1000 sequences, oldest evicted first
+        if not self.received_seqs.add(seq):
             self.stats.duplicates_rejected += 1
             return False
         
-        self.received_seqs.add(seq)
-        # Keep window of last 1000 sequences
-        if len(self.received_seqs) > 1000:
-            # Remove oldest
-            oldest = min(self.received_seqs)
-            self.received_seqs.discard(oldest)
-        
         return True
     
     def get_stats(self) -> DeliveryStats:
@@ -5,11 +5,18 @@ Implements LZ4 compression + orjson fast serialization for <1KB HealthSummary
 payloads on ISL links with 10KB/s bandwidth limit.
 
 Issue #399 integration: Compression metrics and LZ4 optimization.
+
+Schema definitions are compiled once into plain predicates (with a cached
+Draft7Validator for error reporting). HealthSummary also has a fixed-layout
+binary codec that skips JSON entirely.
 """
 
 import json
-from typing import Any, Dict, Union
-from datetime import datetime
+import struct
+from typing import Any, Callable, Dict, Optional, Union
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
 
 try:
     import lz4.frame
@@ -26,6 +33,112 @@ except ImportError:
 import jsonschema
 from astraguard.swarm.models import HealthSummary, SwarmConfig, AgentID
 
+# Binary HealthSummary layout:
+#   magic (1s) | version (B) | flags (B) | compressed_size (H)
+#   | timestamp µs since epoch (q) | risk_score (f) | recurrence_score (f)
+#   | anomaly_signature: 32 × float32, or 32 × uint8 if BINARY_FLAG_QUANTIZED
+BINARY_MAGIC = b"H"
+BINARY_VERSION = 1
+BINARY_HEADER = struct.Struct("<1sBBHqff")
+BINARY_FLAG_QUANTIZED = 0x01
+SIGNATURE_DIM = 32
+QUANTIZE_MIN = -1.0
+QUANTIZE_MAX = 1.0
+_EPOCH = datetime(1970, 1, 1)
+
+# Draft-7 keywords _compile_schema understands; "format" and "description"
+# are annotations only (Draft7Validator does not check format by default)
+_COMPILED_KEYWORDS = {
+    "type", "properties", "required", "additionalProperties", "items",
+    "minItems", "maxItems", "minimum", "maximum", "enum", "$ref",
+    "format", "description", "definitions",
+}
+
+_TYPE_CHECKS: Dict[str, Callable[[Any], bool]] = {
+    "object": lambda v: isinstance(v, dict),
+    "array": lambda v: isinstance(v, list),
+    "string": lambda v: isinstance(v, str),
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    "integer": lambda v: (
+        isinstance(v, int) and not isinstance(v, bool)
+    ) or (isinstance(v, float) and v.is_integer()),
+}
+
+
+def _compile_schema(
+    schema: Dict[str, Any], definitions: Dict[str, Any]
+) -> Optional[Callable[[Any], bool]]:
+    """Compile a schema into a plain predicate.
+
+    Returns None if the schema uses a keyword outside _COMPILED_KEYWORDS,
+    in which case callers should rely on Draft7Validator alone.
+    """
+    if not set(schema) <= _COMPILED_KEYWORDS:
+        return None
+    if "$ref" in schema:
+        name = schema["$ref"].rsplit("/", 1)[-1]
+        return _compile_schema(definitions[name], definitions)
+
+    checks = []
+    if "type" in schema:
+        checks.append(_TYPE_CHECKS[schema["type"]])
+    if "enum" in schema:
+        allowed = schema["enum"]
+        checks.append(lambda v: v in allowed)
+
+    number = _TYPE_CHECKS["number"]
+    if "minimum" in schema:
+        low = schema["minimum"]
+        checks.append(lambda v: not number(v) or v >= low)
+    if "maximum" in schema:
+        high = schema["maximum"]
+        checks.append(lambda v: not number(v) or v <= high)
+
+    if "minItems" in schema:
+        min_items = schema["minItems"]
+        checks.append(lambda v: not isinstance(v, list) or len(v) >= min_items)
+    if "maxItems" in schema:
+        max_items = schema["maxItems"]
+        checks.append(lambda v: not isinstance(v, list) or len(v) <= max_items)
+    if "items" in schema:
+        item_check = _compile_schema(schema["items"], definitions)
+        if item_check is None:
+            return None
+        checks.append(
+            lambda v: not isinstance(v, list) or all(map(item_check, v))
+        )
+
+    if "properties" in schema:
+        properties = {}
+        for name, subschema in schema["properties"].items():
+            properties[name] = _compile_schema(subschema, definitions)
+            if properties[name] is None:
+                return None
+        closed = schema.get("additionalProperties", True) is False
+
+        def check_properties(v: Any) -> bool:
+            if not isinstance(v, dict):
+                return True
+            for key, value in v.items():
+                check = properties.get(key)
+                if check is None:
+                    if closed:
+                        return False
+                elif not check(value):
+                    return False
+            return True
+
+        checks.append(check_properties)
+    elif "additionalProperties" in schema:
+        return None
+    if "required" in schema:
+        required = schema["required"]
+        checks.append(
+            lambda v: not isinstance(v, dict) or all(k in v for k in required)
+        )
+
+    return lambda v: all(check(v) for check in checks)
+
 
 class SwarmSerializer:
     """
@@ -34,7 +147,9 @@ class SwarmSerializer:
     Features:
     - LZ4 frame compression for 80%+ ratio on typical HealthSummary
     - orjson for faster JSON encoding/decoding (optional, fallback to json)
-    - JSONSchema v1.0 validation
+    - JSONSchema v1.0 validation compiled once per type
+    - Sampled validation for trusted peers
+    - Fixed-layout binary HealthSummary codec (no JSON)
     - <50ms roundtrip serialization
     - <1KB compressed HealthSummary payloads
     """
@@ -136,14 +251,25 @@ class SwarmSerializer:
         },
     }
 
-    def __init__(self, validate: bool = True):
+    # Draft7Validator and compiled predicate per schema type, shared by
+    # all instances
+    _validators: Dict[str, "jsonschema.Draft7Validator"] = {}
+    _fast_checks: Dict[str, Optional[Callable[[Any], bool]]] = {}
+
+    def __init__(self, validate: bool = True, trusted_sample_every: int = 100):
         """
         Initialize serializer.
         
         Args:
             validate: Enable JSONSchema validation on serialize/deserialize
+            trusted_sample_every: Validate one in N messages deserialized
+                with trusted=True (1 validates all of them)
         """
+        if trusted_sample_every < 1:
+            raise ValueError("trusted_sample_every must be >= 1")
         self.validate = validate
+        self.trusted_sample_every = trusted_sample_every
+        self._trusted_count = 0
         self._use_orjson = HAS_ORJSON
         self._use_lz4 = HAS_LZ4
 
@@ -186,13 +312,16 @@ class SwarmSerializer:
         else:
             return json_bytes
 
-    def deserialize_health(self, data: bytes, compressed: bool = True) -> HealthSummary:
+    def deserialize_health(
+        self, data: bytes, compressed: bool = True, trusted: bool = False
+    ) -> HealthSummary:
         """
         Deserialize bytes to HealthSummary with optional LZ4 decompression.
         
         Args:
             data: Serialized bytes
             compressed: Whether data is LZ4 compressed (default True)
+            trusted: Sender is a trusted peer; validate only a sample
             
         Returns:
             HealthSummary instance
@@ -217,11 +346,107 @@ class SwarmSerializer:
             json_str = json_bytes.decode("utf-8")
             json_data = json.loads(json_str)
 
-        if self.validate:
+        if self._should_validate(trusted):
             self.validate_schema(json_data, "HealthSummary")
 
         return HealthSummary.from_dict(json_data)
 
+    def serialize_health_binary(
+        self, summary: HealthSummary, quantize: bool = False
+    ) -> bytes:
+        """
+        Serialize HealthSummary to the fixed binary layout (no JSON).
+        
+        The signature is stored as float32 (149 bytes total), or as uint8
+        over [-1.0, 1.0] when quantize is set (53 bytes total). Timestamps
+        are stored as UTC microseconds and restored as naive UTC.
+        
+        Args:
+            summary: HealthSummary instance
+            quantize: Store the signature as 8-bit quantized values
+            
+        Returns:
+            Serialized bytes
+        """
+        timestamp = summary.timestamp
+        if timestamp.tzinfo is not None:
+            timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+        micros = (timestamp - _EPOCH) // timedelta(microseconds=1)
+
+        signature = np.asarray(summary.anomaly_signature, dtype="<f4")
+        if quantize:
+            clamped = np.clip(signature, QUANTIZE_MIN, QUANTIZE_MAX)
+            scaled = (clamped - QUANTIZE_MIN) / (QUANTIZE_MAX - QUANTIZE_MIN) * 255
+            signature = np.rint(scaled).astype(np.uint8)
+
+        header = BINARY_HEADER.pack(
+            BINARY_MAGIC,
+            BINARY_VERSION,
+            BINARY_FLAG_QUANTIZED if quantize else 0,
+            summary.compressed_size,
+            micros,
+            summary.risk_score,
+            summary.recurrence_score,
+        )
+        return header + signature.tobytes()
+
+    def deserialize_health_binary(self, data: bytes) -> HealthSummary:
+        """
+        Deserialize the fixed binary layout to HealthSummary.
+        
+        The layout fixes field types and the signature length, so only the
+        header and value ranges are checked (by HealthSummary itself).
+        
+        Args:
+            data: Bytes from serialize_health_binary
+            
+        Returns:
+            HealthSummary instance
+            
+        Raises:
+            ValueError: If the frame is malformed or values are out of range
+        """
+        if len(data) < BINARY_HEADER.size:
+            raise ValueError("Binary HealthSummary too short for header")
+
+        (
+            magic,
+            version,
+            flags,
+            compressed_size,
+            micros,
+            risk_score,
+            recurrence_score,
+        ) = BINARY_HEADER.unpack_from(data)
+        if magic != BINARY_MAGIC or version != BINARY_VERSION:
+            raise ValueError(
+                f"Unsupported binary HealthSummary frame: {magic!r} v{version}"
+            )
+
+        quantized = bool(flags & BINARY_FLAG_QUANTIZED)
+        dtype = np.uint8 if quantized else np.dtype("<f4")
+        expected = BINARY_HEADER.size + SIGNATURE_DIM * np.dtype(dtype).itemsize
+        if len(data) != expected:
+            raise ValueError(
+                f"Binary HealthSummary must be {expected} bytes, got {len(data)}"
+            )
+
+        signature = np.frombuffer(
+            data, dtype=dtype, count=SIGNATURE_DIM, offset=BINARY_HEADER.size
+        )
+        if quantized:
+            signature = QUANTIZE_MIN + signature / 255.0 * (
+                QUANTIZE_MAX - QUANTIZE_MIN
+            )
+
+        return HealthSummary(
+            anomaly_signature=signature.astype(np.float64).tolist(),
+            risk_score=risk_score,
+            recurrence_score=recurrence_score,
+            timestamp=_EPOCH + timedelta(microseconds=micros),
+            compressed_size=compressed_size,
+        )
+
     def serialize_swarm_config(self, config: SwarmConfig) -> bytes:
         """
         Serialize SwarmConfig to JSON bytes.
@@ -281,14 +506,41 @@ class SwarmSerializer:
         if not self.validate:
             return True
 
-        validator = jsonschema.Draft7Validator(self.SCHEMA)
-        schema_def = self.SCHEMA["definitions"].get(schema_type)
+        validator = self._get_validator(schema_type)
+        fast_check = self._fast_checks[schema_type]
+        if fast_check is None or not fast_check(data):
+            # Draft7Validator is authoritative and raises a detailed error
+            validator.validate(data)
+        return True
 
-        if not schema_def:
-            raise ValueError(f"Unknown schema type: {schema_type}")
+    @classmethod
+    def _get_validator(cls, schema_type: str) -> "jsonschema.Draft7Validator":
+        """Return the compiled validator for a schema type, building it once."""
+        validator = cls._validators.get(schema_type)
+        if validator is None:
+            schema_def = cls.SCHEMA["definitions"].get(schema_type)
+            if not schema_def:
+                raise ValueError(f"Unknown schema type: {schema_type}")
+            # Keep definitions alongside so "#/definitions/..." refs resolve
+            validator = jsonschema.Draft7Validator(
+                {**schema_def, "definitions": cls.SCHEMA["definitions"]}
+            )
+            cls._fast_checks[schema_type] = _compile_schema(
+                schema_def, cls.SCHEMA["definitions"]
+            )
+            cls._validators[schema_type] = validator
+        return validator
 
-        validator.validate(data, schema_def)
-        return True
+    def _should_validate(self, trusted: bool) -> bool:
+        """Decide whether to validate an incoming message."""
+        if not self.validate:
+            return False
+        if not trusted:
+            return True
+        # Validate the first trusted message, then one in every N
+        sample = self._trusted_count % self.trusted_sample_every == 0
+        self._trusted_count += 1
+        return sample
 
     @staticmethod
     def get_compression_stats(original_size: int, compressed_size: int) -> Dict[str, Any]:
@@ -11,6 +11,8 @@ Target: 85% cache hit rate (vs 50% single-agent)
 Features:
   - Local cache as authoritative source
   - Async replication to 3 nearest peers  
+  - Batched replication: per-peer outbound queues coalesced into one
+    compressed frame, flushed on a size or time threshold
   - RSSI-based peer selection
   - Bandwidth-aware eviction (bus.utilization > 0.7)
   - Graceful degradation on network partition
@@ -18,10 +20,13 @@ Features:
 """
 
 import asyncio
+import heapq
+import json
 import logging
+import zlib
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Dict, Optional, List, Set
+from typing import Dict, Optional, List, Set, Tuple
 from pathlib import Path
 
 from memory_engine.memory_store import AdaptiveMemoryStore, MemoryEvent
@@ -93,6 +98,7 @@ class SwarmMemoryMetrics:
     peer_cache_size_bytes: int = 0
     local_cache_size_bytes: int = 0
     bandwidth_evictions: int = 0
+    replication_batches: int = 0
 
     def to_dict(self) -> dict:
         """Export metrics for Prometheus."""
@@ -106,6 +112,7 @@ class SwarmMemoryMetrics:
             "eviction_count_local": self.eviction_count_local,
             "eviction_count_peer": self.eviction_count_peer,
             "bandwidth_evictions": self.bandwidth_evictions,
+            "replication_batches": self.replication_batches,
         }
 
 
@@ -137,6 +144,8 @@ class SwarmAdaptiveMemory:
     MEMORY_REPLICATION_QOS = 1  # ACK level
     BANDWIDTH_EVICTION_THRESHOLD = 0.7  # bus.utilization > 70%
     EVICTION_PERCENTAGE = 0.2  # Evict oldest 20% when congested
+    REPLICATION_BATCH_MAX_BYTES = 8192  # Raw batch size, stays under 10KB ISL limit
+    REPLICATION_FLUSH_INTERVAL = 0.05  # seconds, max time a pattern waits in a queue
 
     def __init__(
         self,
@@ -182,6 +191,16 @@ class SwarmAdaptiveMemory:
         # Local cache tracking (in-memory for fast lookups)
         self._local_pattern_cache: Dict[str, AnomalyPattern] = {}
 
+        # Replication pipeline: per-peer outbound queues of encoded patterns
+        self._outbound: Dict[AgentID, Dict[str, str]] = {}
+        self._outbound_bytes: Dict[AgentID, int] = {}
+        self._flush_event = asyncio.Event()
+
+        # Nearest-peer ordering, recomputed when alive peers or RSSI change
+        self._nearest_peers: List[AgentID] = []
+        self._nearest_peers_key: Optional[Tuple] = None
+        self._rssi_version = 0
+
     async def start(self) -> None:
         """Start background replication and cache sync."""
         self._running = True
@@ -198,13 +217,16 @@ class SwarmAdaptiveMemory:
             self._handle_replication,
             qos=self.MEMORY_REPLICATION_QOS,
         )
+        self._ensure_replication_task()
 
     async def stop(self) -> None:
-        """Stop replication and save local cache."""
+        """Stop replication, drain outbound queues and save local cache."""
         self._running = False
         self.local_cache.save()
         if self._replication_task:
             self._replication_task.cancel()
+            self._replication_task = None
+        await self._flush_replication()
         logger.info("SwarmAdaptiveMemory stopped")
 
     async def get(self, key: str) -> Optional[AnomalyPattern]:
@@ -247,7 +269,8 @@ class SwarmAdaptiveMemory:
 
         Algorithm:
         1. Store in local cache (synchronous, authoritative)
-        2. Async replicate to 3 nearest peers (fire-and-forget)
+        2. Queue for the 3 nearest peers; the replication task sends each
+           peer's queue as one batch on a size or time threshold
         3. Track replication success for metrics
 
         Args:
@@ -258,16 +281,35 @@ class SwarmAdaptiveMemory:
         self._local_pattern_cache[key] = pattern
         logger.debug(f"Stored pattern locally: {key}")
 
-        # Async replicate to peers (non-blocking)
+        # Queue for batched replication (non-blocking)
         if self._running:
-            asyncio.create_task(self._replicate_to_peers(key, pattern))
+            self._enqueue_replication(key, pattern)
+            self._ensure_replication_task()
+
+    def update_peer_rssi(self, peer_id: AgentID, rssi_strength: float) -> None:
+        """
+        Record a new RSSI reading for a peer.
+
+        Args:
+            peer_id: Peer agent ID
+            rssi_strength: Signal strength in dBm (higher = nearer)
+        """
+        if peer_id not in self.peer_caches:
+            self.peer_caches[peer_id] = PeerCacheInfo(agent_id=peer_id)
+        self.peer_caches[peer_id].rssi_strength = rssi_strength
+        self._rssi_version += 1
 
     # Private methods
 
+    @staticmethod
+    def _encode_pattern(pattern: AnomalyPattern) -> str:
+        """Serialize pattern once; the result is reused for sizing and batching."""
+        return json.dumps(pattern.to_dict())
+
     def _estimate_pattern_size(self, pattern: AnomalyPattern) -> int:
         """Estimate pattern size in bytes for bandwidth tracking."""
-        import json
-        return len(json.dumps(pattern.to_dict()).encode())
+        # json.dumps escapes non-ASCII, so characters == bytes
+        return len(self._encode_pattern(pattern))
 
     async def _fetch_from_peers(self, key: str) -> Optional[AnomalyPattern]:
         """
@@ -338,54 +380,159 @@ class SwarmAdaptiveMemory:
 
     async def _replicate_to_peers(self, key: str, pattern: AnomalyPattern) -> None:
         """
-        Replicate pattern to 3 nearest peers asynchronously.
+        Replicate pattern to 3 nearest peers immediately.
+
+        Queues the pattern like put() and flushes all outbound queues
+        without waiting for the replication task.
+
+        Args:
+            key: Pattern key
+            pattern: AnomalyPattern to replicate
+        """
+        if self._enqueue_replication(key, pattern):
+            await self._flush_replication()
+
+    def _enqueue_replication(self, key: str, pattern: AnomalyPattern) -> bool:
+        """
+        Add an encoded pattern to the outbound queue of each nearest peer.
+
+        A newer version of a queued key replaces the older one, so bursts of
+        updates to the same pattern are coalesced.
 
         Args:
             key: Pattern key
             pattern: AnomalyPattern to replicate
+
+        Returns:
+            True if the pattern was queued for at least one peer
         """
         nearest_peers = self._get_nearest_peers()
         if not nearest_peers:
+            return False
+
+        encoded = self._encode_pattern(pattern)
+        for peer_id in nearest_peers:
+            queue = self._outbound.setdefault(peer_id, {})
+            previous = queue.get(key)
+            queue[key] = encoded
+            size = self._outbound_bytes.get(peer_id, 0) + len(encoded)
+            if previous is not None:
+                size -= len(previous)
+            self._outbound_bytes[peer_id] = size
+            if size >= self.REPLICATION_BATCH_MAX_BYTES:
+                self._flush_event.set()
+        return True
+
+    def _ensure_replication_task(self) -> None:
+        """Start the replication task if it is not already running."""
+        if self._replication_task is None or self._replication_task.done():
+            self._replication_task = asyncio.create_task(self._replication_loop())
+
+    async def _replication_loop(self) -> None:
+        """Flush outbound queues every flush interval, or sooner when one fills."""
+        while self._running:
+            try:
+                await asyncio.wait_for(
+                    self._flush_event.wait(), timeout=self.REPLICATION_FLUSH_INTERVAL
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._flush_event.clear()
+            try:
+                await self._flush_replication()
+            except Exception as e:
+                logger.error(f"Replication flush failed: {e}")
+
+    async def _flush_replication(self) -> None:
+        """Send every non-empty outbound queue as batched replication frames."""
+        if not self._outbound:
             return
 
-        pattern_size = self._estimate_pattern_size(pattern)
+        outbound = self._outbound
+        self._outbound = {}
+        self._outbound_bytes = {}
 
         # Check bandwidth before replicating
         if await self._is_congested():
-            logger.debug(f"Skipping replication for {key} due to congestion")
+            dropped = sum(len(queue) for queue in outbound.values())
+            logger.debug(f"Skipping replication of {dropped} patterns due to congestion")
             return
 
-        for peer_id in nearest_peers:
-            try:
-                # Publish replication message
-                await self.bus.publish(
-                    self.CACHE_REPLICATE_TOPIC,
-                    {
-                        "source": self.registry.config.agent_id.satellite_serial,
-                        "pattern_key": key,
-                        "pattern": pattern.to_dict(),
-                    },
-                    qos=self.MEMORY_REPLICATION_QOS,
-                )
+        for peer_id, queue in outbound.items():
+            await self._send_batches(peer_id, queue)
 
-                self.metrics.replication_count += 1
-                self.metrics.replication_success_rate = (
-                    self.metrics.replication_count
-                    / max(1, self.metrics.replication_count + self.metrics.replication_failures)
-                )
+    async def _send_batches(self, peer_id: AgentID, queue: Dict[str, str]) -> None:
+        """
+        Publish a peer's queued patterns in frames of at most
+        REPLICATION_BATCH_MAX_BYTES (before compression).
+
+        Args:
+            peer_id: Receiving peer
+            queue: Pattern key -> encoded pattern
+        """
+        batch: List[Tuple[str, str]] = []
+        batch_size = 0
+        for key, encoded in queue.items():
+            if batch and batch_size + len(encoded) > self.REPLICATION_BATCH_MAX_BYTES:
+                await self._send_batch(peer_id, batch)
+                batch, batch_size = [], 0
+            batch.append((key, encoded))
+            batch_size += len(encoded)
+        if batch:
+            await self._send_batch(peer_id, batch)
+
+    def _build_batch_frame(self, batch: List[Tuple[str, str]]) -> bytes:
+        """
+        Build a compressed replication frame from already-encoded patterns.
 
-                # Track peer cache
-                if peer_id not in self.peer_caches:
-                    self.peer_caches[peer_id] = PeerCacheInfo(agent_id=peer_id)
+        Args:
+            batch: (pattern key, encoded pattern) pairs
 
-                self.peer_caches[peer_id].pattern_ids.add(key)
-                self.peer_caches[peer_id].cache_size_bytes += pattern_size
-                self.peer_caches[peer_id].replication_success += 1
-                self.peer_caches[peer_id].last_sync = datetime.utcnow()
+        Returns:
+            zlib-compressed JSON {source, patterns: {key: pattern}}
+        """
+        patterns = ",".join(f"{json.dumps(key)}:{encoded}" for key, encoded in batch)
+        source = json.dumps(self.registry.config.agent_id.satellite_serial)
+        frame = f'{{"source":{source},"patterns":{{{patterns}}}}}'
+        return zlib.compress(frame.encode("utf-8"))
 
-            except Exception as e:
-                logger.error(f"Replication to {peer_id.satellite_serial} failed: {e}")
-                self.metrics.replication_failures += 1
+    async def _send_batch(self, peer_id: AgentID, batch: List[Tuple[str, str]]) -> None:
+        """
+        Publish one replication frame to a peer and update tracking.
+
+        Args:
+            peer_id: Receiving peer
+            batch: (pattern key, encoded pattern) pairs
+        """
+        try:
+            await self.bus.publish(
+                self.CACHE_REPLICATE_TOPIC,
+                self._build_batch_frame(batch),
+                qos=self.MEMORY_REPLICATION_QOS,
+                receiver=peer_id,
+            )
+        except Exception as e:
+            logger.error(f"Replication to {peer_id.satellite_serial} failed: {e}")
+            self.metrics.replication_failures += len(batch)
+            return
+
+        self.metrics.replication_batches += 1
+        self.metrics.replication_count += len(batch)
+        self.metrics.replication_success_rate = (
+            self.metrics.replication_count
+            / max(1, self.metrics.replication_count + self.metrics.replication_failures)
+        )
+
+        # Track peer cache
+        if peer_id not in self.peer_caches:
+            self.peer_caches[peer_id] = PeerCacheInfo(agent_id=peer_id)
+
+        cache_info = self.peer_caches[peer_id]
+        for key, encoded in batch:
+            cache_info.pattern_ids.add(key)
+            cache_info.cache_size_bytes += len(encoded)
+        cache_info.replication_success += len(batch)
+        cache_info.last_sync = datetime.utcnow()
 
     def _get_nearest_peers(self) -> List[AgentID]:
         """
@@ -393,8 +540,9 @@ class SwarmAdaptiveMemory:
 
         Algorithm:
         1. Get all alive peers from registry
-        2. Sort by RSSI (strongest signal first = nearest)
-        3. Return top peer_cache_size
+        2. Reuse the cached ordering if the alive set, RSSI readings and
+           peer_cache_size are unchanged
+        3. Otherwise select top peer_cache_size by RSSI (strongest first)
 
         Returns:
             List of up to peer_cache_size nearest AgentIDs
@@ -403,18 +551,21 @@ class SwarmAdaptiveMemory:
         if not alive_peers:
             return []
 
-        # Sort by RSSI (nearest first)
+        cache_key = (tuple(alive_peers), self._rssi_version, self.peer_cache_size)
+        if cache_key == self._nearest_peers_key:
+            return list(self._nearest_peers)
+
         # In real implementation, would get RSSI from registry or health_summary
-        peers_with_strength = [
-            (peer, self.peer_caches.get(peer, PeerCacheInfo(agent_id=peer)).rssi_strength)
-            for peer in alive_peers
-        ]
+        default_rssi = PeerCacheInfo.rssi_strength
 
-        # Sort by RSSI descending (stronger = nearer)
-        peers_with_strength.sort(key=lambda x: x[1], reverse=True)
+        def strength(peer: AgentID) -> float:
+            info = self.peer_caches.get(peer)
+            return info.rssi_strength if info else default_rssi
 
-        # Return top peer_cache_size
-        return [peer for peer, _ in peers_with_strength[:self.peer_cache_size]]
+        # nlargest is stable, matching a descending sort (stronger = nearer)
+        self._nearest_peers = heapq.nlargest(self.peer_cache_size, alive_peers, key=strength)
+        self._nearest_peers_key = cache_key
+        return list(self._nearest_peers)
 
     async def _is_congested(self) -> bool:
         """
@@ -494,24 +645,30 @@ class SwarmAdaptiveMemory:
         except Exception as e:
             logger.error(f"Error handling cache query: {e}")
 
-    async def _handle_replication(self, message: dict) -> None:
+    async def _handle_replication(self, message) -> None:
         """
         Handle incoming pattern replication from peer.
 
         Args:
-            message: Replication message with {source, pattern_key, pattern}
+            message: Compressed batch frame {source, patterns: {key: pattern}},
+                or a single-pattern dict {source, pattern_key, pattern}
         """
         try:
+            if isinstance(message, (bytes, bytearray)):
+                message = json.loads(zlib.decompress(message))
+
             source = message.get("source")
-            pattern_key = message.get("pattern_key")
-            pattern_data = message.get("pattern")
+            patterns = message.get("patterns")
+            if patterns is None:
+                patterns = {message.get("pattern_key"): message.get("pattern")}
 
-            if pattern_data:
-                # Deserialize and cache pattern
-                pattern = AnomalyPattern.from_dict(pattern_data)
-                self._local_pattern_cache[pattern_key] = pattern
+            for pattern_key, pattern_data in patterns.items():
+                if pattern_data:
+                    # Deserialize and cache pattern
+                    pattern = AnomalyPattern.from_dict(pattern_data)
+                    self._local_pattern_cache[pattern_key] = pattern
 
-                logger.debug(f"Cached pattern from peer {source}: {pattern_key}")
+                    logger.debug(f"Cached pattern from peer {source}: {pattern_key}")
 
         except Exception as e:
             logger.error(f"Error handling replication: {e}")
@@ -530,3 +687,4 @@ class SwarmAdaptiveMemory:
         self.metrics = SwarmMemoryMetrics()
         self.peer_caches.clear()
         self._local_pattern_cache.clear()
+        self._rssi_version += 1
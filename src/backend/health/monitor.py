@@ -321,7 +321,7 @@ class HealthMonitor:
         """Get resource monitoring status."""
         try:
             resource_status = self.resource_monitor.check_resource_health()
-            current_metrics = self.resource_monitor.get_current_metrics()
+            current_metrics = self.resource_monitor.get_latest_metrics()
 
             return {
                 "status": resource_status,
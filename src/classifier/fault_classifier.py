@@ -1,4 +1,128 @@
-from typing import Dict
+import logging
+from dataclasses import dataclass, fields
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from config.config_loader import load_config_section
+
+logger = logging.getLogger(__name__)
+
+# Fault labels in priority order; classification codes index into this array
+FAULT_LABELS = np.array(["power_fault", "thermal_fault", "attitude_fault", "normal"], dtype=object)
+
+THRESHOLDS_CONFIG_NAME = "fault_thresholds"
+
+# Telemetry defaults used when a field is missing
+DEFAULT_VOLTAGE = 8.0
+DEFAULT_TEMPERATURE = 25.0
+DEFAULT_GYRO = 0.0
+
+
+@dataclass(frozen=True)
+class FaultThresholds:
+    """
+    Thresholds for rule-based fault classification.
+
+    Attributes:
+        voltage_min: Battery voltage (V) below which a power fault is reported
+        temperature_max: Temperature (°C) above which a thermal fault is reported
+        gyro_max: Absolute rotation rate (rad/s) above which an attitude fault is reported
+    """
+    voltage_min: float = 7.3
+    temperature_max: float = 32.0
+    gyro_max: float = 0.05
+
+    @classmethod
+    def from_dict(cls, config: Optional[Dict[str, Any]]) -> "FaultThresholds":
+        """Build thresholds from a config mapping, ignoring unknown keys."""
+        names = {f.name for f in fields(cls)}
+        return cls(**{k: float(v) for k, v in (config or {}).items() if k in names})
+
+    @classmethod
+    def from_config(cls, config_path: Optional[str] = None) -> "FaultThresholds":
+        """
+        Load thresholds from the ``classifier`` section of a config file.
+
+        Args:
+            config_path: YAML/JSON file (defaults to config/fault_thresholds.yaml)
+
+        Returns:
+            Configured thresholds; missing keys keep their defaults
+        """
+        return cls.from_dict(load_config_section(THRESHOLDS_CONFIG_NAME, "classifier", config_path))
+
+
+_thresholds: Optional[FaultThresholds] = None
+
+
+def get_fault_thresholds() -> FaultThresholds:
+    """Active classification thresholds (loaded from config on first use)."""
+    global _thresholds
+    if _thresholds is None:
+        try:
+            _thresholds = FaultThresholds.from_config()
+        except Exception as e:
+            logger.warning(f"Failed to load fault thresholds, using defaults: {e}")
+            _thresholds = FaultThresholds()
+    return _thresholds
+
+
+def set_fault_thresholds(thresholds: Optional[FaultThresholds]) -> None:
+    """Override the active thresholds (None reloads from config on next use)."""
+    global _thresholds
+    _thresholds = thresholds
+
+
+def classify_arrays(
+    voltage: Sequence[float],
+    temperature: Sequence[float],
+    gyro: Sequence[float],
+    thresholds: Optional[FaultThresholds] = None,
+) -> np.ndarray:
+    """
+    Classify telemetry given as column arrays.
+
+    Args:
+        voltage: Battery voltage per point (V)
+        temperature: System temperature per point (°C)
+        gyro: Gyroscope reading per point (rad/s, sign ignored)
+        thresholds: Classification thresholds (active config if None)
+
+    Returns:
+        Object array of fault labels, one per point
+    """
+    t = thresholds or get_fault_thresholds()
+    voltage = np.asarray(voltage, dtype=float)
+    temperature = np.asarray(temperature, dtype=float)
+    gyro = np.abs(np.asarray(gyro, dtype=float))
+
+    # Power faults have the highest priority, then thermal, then attitude
+    codes = np.select(
+        [voltage < t.voltage_min, temperature > t.temperature_max, gyro > t.gyro_max],
+        [0, 1, 2],
+        default=3,
+    )
+    return FAULT_LABELS[codes]
+
+
+def classify_structured(telemetry: np.ndarray, thresholds: Optional[FaultThresholds] = None) -> np.ndarray:
+    """
+    Classify a NumPy structured array with ``voltage``/``temperature``/``gyro`` fields.
+
+    Missing fields take the same defaults as ``classify``.
+    """
+    names = telemetry.dtype.names or ()
+
+    def column(name: str, default: float) -> np.ndarray:
+        return telemetry[name] if name in names else np.full(telemetry.shape, default)
+
+    return classify_arrays(
+        column("voltage", DEFAULT_VOLTAGE),
+        column("temperature", DEFAULT_TEMPERATURE),
+        column("gyro", DEFAULT_GYRO),
+        thresholds,
+    )
 
 
 def classify(data: Dict) -> str:
@@ -6,30 +130,28 @@ def classify(data: Dict) -> str:
     Classify the type of fault based on telemetry data.
     Returns: 'normal', 'power_fault', 'thermal_fault', 'attitude_fault', or 'unknown_fault'
     """
-    # Extract key telemetry parameters from the input data dictionary
-    # Use default values if keys are missing to ensure robustness
-    voltage = data.get("voltage", 8.0)  # Battery voltage in volts
-    temperature = data.get("temperature", 25.0)  # System temperature in Celsius
-    gyro = abs(data.get("gyro", 0.0))  # Absolute gyroscope reading in rad/s
-
-    # Fault classification logic based on predefined thresholds
-    # Check for power-related faults first (highest priority)
-    if voltage < 7.3:
-        # Critical voltage threshold: below 7.3V indicates battery/power system failure
-        return "power_fault"
-    
-    # Check for thermal faults (overheating)
-    if temperature > 32.0:
-        # Temperature safety limit: above 32°C suggests cooling system issues
-        return "thermal_fault"
-    
-    # Check for attitude/orientation faults (excessive rotation)
-    if gyro > 0.05:
-        # Gyroscopic threshold: above 0.05 rad/s indicates unstable attitude
-        return "attitude_fault"
-
-    # If no faults detected, system is operating normally
-    return "normal"
+    return classify_arrays(
+        [data.get("voltage", DEFAULT_VOLTAGE)],
+        [data.get("temperature", DEFAULT_TEMPERATURE)],
+        [data.get("gyro", DEFAULT_GYRO)],
+    )[0]
+
+
+def classify_batch(records: Sequence[Dict]) -> List[str]:
+    """
+    Classify many telemetry dictionaries at once.
+
+    Returns:
+        Fault type per record, in input order
+    """
+    if not records:
+        return []
+    count = len(records)
+    return classify_arrays(
+        np.fromiter((r.get("voltage", DEFAULT_VOLTAGE) for r in records), dtype=float, count=count),
+        np.fromiter((r.get("temperature", DEFAULT_TEMPERATURE) for r in records), dtype=float, count=count),
+        np.fromiter((r.get("gyro", DEFAULT_GYRO) for r in records), dtype=float, count=count),
+    ).tolist()
 
 
 def get_fault_severity(fault_type: str) -> str:
@@ -108,6 +108,25 @@ def find_config_file(base_name: str, search_paths: Optional[list] = None) -> Opt
     return None
 
 
+def load_config_section(base_name: str, section: str, config_path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Load one top-level section of a configuration file.
+
+    Args:
+        base_name: Base name of the config file, searched in ./config and this package
+        section: Top-level key to return
+        config_path: Explicit file path (skips the search)
+
+    Returns:
+        The section mapping, or an empty dict if the file or section is missing
+    """
+    if config_path is None:
+        config_path = find_config_file(base_name, ['config', str(Path(__file__).parent)])
+        if config_path is None:
+            return {}
+    return load_config_file(config_path).get(section) or {}
+
+
 def save_config_file(file_path: str, config: Dict[str, Any], format: Optional[str] = None) -> None:
     """
     Save configuration to a file in YAML or JSON format.
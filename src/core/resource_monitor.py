@@ -11,6 +11,7 @@ Features:
 - Integration with health monitor
 - Automatic alerts when thresholds exceeded
 - Non-blocking CPU monitoring
+- Background sampler with cached, staleness-bounded snapshots
 """
 
 import psutil
@@ -18,6 +19,8 @@ import logging
 import os
 import threading
 import functools
+import time
+from collections import deque
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Callable, Any, TypeVar
 from datetime import datetime, timedelta
@@ -30,13 +33,19 @@ T = TypeVar('T')
 
 logger = logging.getLogger(__name__)
 
+# Background sampler defaults
+DEFAULT_SAMPLE_INTERVAL_SECONDS = 1.0
+STALENESS_FACTOR = 2.0
+
 
 def monitor_operation_resources(operation_name: Optional[str] = None):
     """
     Decorator to monitor CPU and memory usage during operation execution.
 
     Logs resource usage before and after the operation, and warns if usage
-    exceeds thresholds during the operation.
+    exceeds thresholds during the operation. Reads the monitor's cached
+    snapshot, so operations shorter than the sampling interval report a
+    zero delta instead of paying for a fresh sample.
 
     Args:
         operation_name: Optional name for the operation (defaults to function name)
@@ -57,7 +66,7 @@ def monitor_operation_resources(operation_name: Optional[str] = None):
             monitor = get_resource_monitor()
 
             # Get initial metrics
-            initial_metrics = monitor.get_current_metrics()
+            initial_metrics = monitor.get_latest_metrics()
 
             logger.debug(
                 f"Starting operation '{op_name}' - "
@@ -71,7 +80,7 @@ def monitor_operation_resources(operation_name: Optional[str] = None):
                 result = func(*args, **kwargs)
 
                 # Get final metrics
-                final_metrics = monitor.get_current_metrics()
+                final_metrics = monitor.get_latest_metrics()
 
                 # Calculate resource usage during operation
                 cpu_used = final_metrics.cpu_percent - initial_metrics.cpu_percent
@@ -100,7 +109,7 @@ def monitor_operation_resources(operation_name: Optional[str] = None):
 
             except Exception as e:
                 # Log resource usage even on failure
-                final_metrics = monitor.get_current_metrics()
+                final_metrics = monitor.get_latest_metrics()
                 cpu_used = final_metrics.cpu_percent - initial_metrics.cpu_percent
                 memory_used = final_metrics.process_memory_mb - initial_metrics.process_memory_mb
 
@@ -182,6 +191,10 @@ class ResourceMonitor:
     
     Tracks CPU, memory, and disk usage with configurable thresholds.
     Maintains history for trend analysis and diagnostics.
+
+    A background sampler thread (see ``start_sampler``) refreshes a cached
+    snapshot at a fixed rate; health checks read that snapshot in O(1) and
+    only sample inline when it is older than ``max_staleness``.
     """
     
     def __init__(
@@ -189,7 +202,9 @@ class ResourceMonitor:
         thresholds: Optional[ResourceThresholds] = None,
         history_size: int = 100,
         history_time_window_hours: int = 1,
-        monitoring_enabled: bool = True
+        monitoring_enabled: bool = True,
+        sample_interval: float = DEFAULT_SAMPLE_INTERVAL_SECONDS,
+        max_staleness: Optional[float] = None
     ):
         """
         Initialize resource monitor.
@@ -199,15 +214,33 @@ class ResourceMonitor:
             history_size: Number of metric snapshots to retain
             history_time_window_hours: Time window in hours to retain metrics
             monitoring_enabled: Whether monitoring is active
+            sample_interval: Seconds between background samples
+            max_staleness: Maximum age in seconds of a cached snapshot before
+                readers sample inline (defaults to twice ``sample_interval``)
         """
+        if sample_interval <= 0:
+            raise ValueError("sample_interval must be positive")
+
         self.thresholds = thresholds or ResourceThresholds()
         self.history_size = history_size
         self.history_time_window_hours = history_time_window_hours
         self.monitoring_enabled = monitoring_enabled
+        self.sample_interval = sample_interval
+        self.max_staleness = (
+            max_staleness if max_staleness is not None else sample_interval * STALENESS_FACTOR
+        )
 
-        self._metrics_history: List[ResourceMetrics] = []
+        self._metrics_history: deque = deque(maxlen=max(1, history_size))
+        self._history_lock = threading.Lock()
         self._process = psutil.Process()
 
+        # Latest snapshot and its monotonic sample time
+        self._latest: Optional[ResourceMetrics] = None
+        self._latest_at = 0.0
+
+        self._sampler_thread: Optional[threading.Thread] = None
+        self._sampler_stop = threading.Event()
+
         logger.info(
             f"ResourceMonitor initialized: "
             f"cpu_warning={self.thresholds.cpu_warning}%, "
@@ -215,140 +248,159 @@ class ResourceMonitor:
             f"history_size={self.history_size}, "
             f"history_time_window={self.history_time_window_hours}h"
         )
+
+    @property
+    def sampler_running(self) -> bool:
+        """Whether the background sampler thread is alive."""
+        return self._sampler_thread is not None and self._sampler_thread.is_alive()
+
+    def start_sampler(self) -> None:
+        """
+        Start the background sampler thread (idempotent).
+
+        The thread refreshes the cached snapshot and history every
+        ``sample_interval`` seconds until ``stop_sampler`` is called.
+        """
+        if not self.monitoring_enabled or self.sampler_running:
+            return
+        self._sampler_stop.clear()
+        # Prime psutil's CPU counters so the first sample covers a real interval
+        psutil.cpu_percent(interval=None)
+        self._sampler_thread = threading.Thread(
+            target=self._sampler_loop,
+            name="resource-monitor-sampler",
+            daemon=True
+        )
+        self._sampler_thread.start()
+        logger.debug(f"Resource sampler started (interval={self.sample_interval}s)")
+
+    def stop_sampler(self, timeout: Optional[float] = None) -> None:
+        """Stop the background sampler thread and wait for it to exit."""
+        self._sampler_stop.set()
+        thread = self._sampler_thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        self._sampler_thread = None
+
+    def get_latest_metrics(self) -> ResourceMetrics:
+        """
+        Return the cached resource snapshot.
+
+        O(1) when the snapshot is younger than ``max_staleness``; otherwise a
+        fresh (non-blocking) sample is taken and cached first.
+
+        Returns:
+            Most recent ResourceMetrics snapshot
+        """
+        latest = self._latest
+        if latest is not None and time.monotonic() - self._latest_at <= self.max_staleness:
+            return latest
+        return self.get_current_metrics()
     
     def get_current_metrics(self) -> ResourceMetrics:
         """
         Collect current resource metrics.
 
-        Uses interval=0 for CPU to ensure non-blocking operation.
+        Uses interval=None for CPU to ensure non-blocking operation: psutil
+        reports utilisation since the previous call. The sample is recorded
+        in history and becomes the cached snapshot.
 
         Returns:
             ResourceMetrics snapshot of current system state
         """
         if not self.monitoring_enabled:
-            return ResourceMetrics(
-                cpu_percent=0.0,
-                memory_percent=0.0,
-                memory_available_mb=0.0,
-                disk_usage_percent=0.0,
-                process_memory_mb=0.0
-            )
+            return self._empty_metrics()
 
         try:
-            # CPU usage (interval=0 for non-blocking return)
-            # This returns usage since last call, which is ideal for periodic monitoring
-            cpu_percent = psutil.cpu_percent(interval=0)
-            # CPU usage (1 second interval for accuracy)
-            cpu_percent = psutil.cpu_percent(interval=0.1)
-
-            # Memory usage
-            memory = psutil.virtual_memory()
-            memory_percent = memory.percent if memory.percent is not None else 0.0
-            memory_available_mb = memory.available / (1024 * 1024) if memory.available is not None else 0.0
-
-            # Disk usage - with fallback for CI environments
-            try:
-                disk = psutil.disk_usage('/')
-                disk_usage_percent = disk.percent if disk.percent is not None else 0.0
-            except (OSError, PermissionError):
-                disk_usage_percent = 0.0
-
-            # Process memory
-            process_info = self._process.memory_info()
-            process_memory_mb = process_info.rss / (1024 * 1024) if process_info.rss is not None else 0.0
-
-            metrics = ResourceMetrics(
-                cpu_percent=float(cpu_percent) if cpu_percent is not None else 0.0,
-                memory_percent=float(memory_percent) if memory_percent is not None else 0.0,
-                memory_available_mb=float(memory_available_mb) if memory_available_mb is not None else 0.0,
-                disk_usage_percent=float(disk_usage_percent) if disk_usage_percent is not None else 0.0,
-                process_memory_mb=float(process_memory_mb) if process_memory_mb is not None else 0.0,
-                timestamp=datetime.now()
-            )
-
-            # Add to history
-            self._add_to_history(metrics)
-
-            return metrics
-
+            metrics = self._sample()
         except Exception as e:
             logger.error(f"Error collecting resource metrics: {e}")
-            return ResourceMetrics(
-                cpu_percent=0.0,
-                memory_percent=0.0,
-                memory_available_mb=0.0,
-                disk_usage_percent=0.0,
-                process_memory_mb=0.0
-            )
+            return self._empty_metrics()
+
+        self._latest = metrics
+        self._latest_at = time.monotonic()
+        self._add_to_history(metrics)
+        return metrics
 
     def get_current_metrics_no_history(self) -> ResourceMetrics:
         """
         Collect current resource metrics without adding to history.
 
-        Used by operation monitoring decorator to avoid polluting history.
-
         Returns:
             ResourceMetrics snapshot of current system state
         """
         if not self.monitoring_enabled:
-            return ResourceMetrics(
-                cpu_percent=0.0,
-                memory_percent=0.0,
-                memory_available_mb=0.0,
-                disk_usage_percent=0.0,
-                process_memory_mb=0.0
-            )
+            return self._empty_metrics()
 
         try:
-            # CPU usage (interval=0 for non-blocking return)
-            cpu_percent = psutil.cpu_percent(interval=0.1)
+            return self._sample()
+        except Exception as e:
+            logger.error(f"Error collecting resource metrics: {e}")
+            return self._empty_metrics()
+
+    def _sample(self) -> ResourceMetrics:
+        """Read psutil counters into a ResourceMetrics snapshot (non-blocking)."""
+        # CPU usage since the previous call (interval=None never sleeps)
+        cpu_percent = psutil.cpu_percent(interval=None)
 
-            # Memory usage
-            memory = psutil.virtual_memory()
-            memory_percent = memory.percent
-            memory_available_mb = memory.available / (1024 * 1024)
+        # Memory usage
+        memory = psutil.virtual_memory()
+        memory_percent = memory.percent if memory.percent is not None else 0.0
+        memory_available_mb = memory.available / (1024 * 1024) if memory.available is not None else 0.0
 
-            # Disk usage
+        # Disk usage - with fallback for CI environments
+        try:
             disk = psutil.disk_usage('/')
-            disk_usage_percent = disk.percent
-
-            # Process memory
-            process_info = self._process.memory_info()
-            process_memory_mb = process_info.rss / (1024 * 1024)
-
-            return ResourceMetrics(
-                cpu_percent=cpu_percent,
-                memory_percent=memory_percent,
-                memory_available_mb=memory_available_mb,
-                disk_usage_percent=disk_usage_percent,
-                process_memory_mb=process_memory_mb,
-                timestamp=datetime.now()
-            )
+            disk_usage_percent = disk.percent if disk.percent is not None else 0.0
+        except (OSError, PermissionError):
+            disk_usage_percent = 0.0
+
+        # Process memory
+        process_info = self._process.memory_info()
+        process_memory_mb = process_info.rss / (1024 * 1024) if process_info.rss is not None else 0.0
+
+        return ResourceMetrics(
+            cpu_percent=float(cpu_percent) if cpu_percent is not None else 0.0,
+            memory_percent=float(memory_percent),
+            memory_available_mb=float(memory_available_mb),
+            disk_usage_percent=float(disk_usage_percent),
+            process_memory_mb=float(process_memory_mb),
+            timestamp=datetime.now()
+        )
 
-        except Exception as e:
-            logger.error(f"Error collecting resource metrics: {e}")
-            return ResourceMetrics(
-                cpu_percent=0.0,
-                memory_percent=0.0,
-                memory_available_mb=0.0,
-                disk_usage_percent=0.0,
-                process_memory_mb=0.0
-            )
+    @staticmethod
+    def _empty_metrics() -> ResourceMetrics:
+        """Zeroed metrics used when monitoring is disabled or sampling fails."""
+        return ResourceMetrics(
+            cpu_percent=0.0,
+            memory_percent=0.0,
+            memory_available_mb=0.0,
+            disk_usage_percent=0.0,
+            process_memory_mb=0.0
+        )
+
+    def _sampler_loop(self) -> None:
+        """Background thread body: refresh the snapshot until stopped."""
+        while not self._sampler_stop.wait(self.sample_interval):
+            try:
+                self.get_current_metrics()
+            except Exception as e:  # never let the sampler thread die
+                logger.error(f"Resource sampler error: {e}")
     
     def _add_to_history(self, metrics: ResourceMetrics):
-        """Add metrics to history, maintaining size and time limits"""
-        self._metrics_history.append(metrics)
-
-        # Clean up old entries based on time window
+        """Add metrics to the history ring buffer, expiring old entries"""
         cutoff_time = datetime.now() - timedelta(hours=self.history_time_window_hours)
-        self._metrics_history = [
-            m for m in self._metrics_history
-            if m.timestamp >= cutoff_time
-        ]
-
-        # Trim history if exceeded size (after time-based cleanup)
-        if len(self._metrics_history) > self.history_size:
-            self._metrics_history = self._metrics_history[-self.history_size:]
+        with self._history_lock:
+            # deque(maxlen) drops the oldest entry once history_size is reached
+            self._metrics_history.append(metrics)
+            # Entries are in timestamp order, so expired ones sit at the left
+            while self._metrics_history and self._metrics_history[0].timestamp < cutoff_time:
+                self._metrics_history.popleft()
+
+    def _history_snapshot(self) -> List[ResourceMetrics]:
+        """Copy of the history, safe against concurrent sampler appends."""
+        with self._history_lock:
+            return list(self._metrics_history)
     
     def check_resource_health(self) -> Dict[str, str]:
         """
@@ -363,7 +415,7 @@ class ResourceMonitor:
                 'overall': 'healthy' | 'warning' | 'critical'
             }
         """
-        metrics = self.get_current_metrics()
+        metrics = self.get_latest_metrics()
         
         status = {
             'cpu': ResourceStatus.HEALTHY,
@@ -432,7 +484,7 @@ class ResourceMonitor:
         Returns:
             True if resources are available, False otherwise
         """
-        metrics = self.get_current_metrics()
+        metrics = self.get_latest_metrics()
         
         cpu_free = 100.0 - metrics.cpu_percent
         memory_available = metrics.memory_available_mb
@@ -463,7 +515,7 @@ class ResourceMonitor:
         """
         cutoff_time = datetime.now() - timedelta(minutes=duration_minutes)
         recent_metrics = [
-            m for m in self._metrics_history 
+            m for m in self._history_snapshot()
             if m.timestamp >= cutoff_time
         ]
         
@@ -486,7 +538,7 @@ class ResourceMonitor:
                 'max': max(memory_values),
                 'avg': sum(memory_values) / len(memory_values)
             },
-            'current': self.get_current_metrics().to_dict()
+            'current': self.get_latest_metrics().to_dict()
         }
     
     def get_history(self, count: Optional[int] = None) -> List[Dict]:
@@ -499,7 +551,9 @@ class ResourceMonitor:
         Returns:
             List of metric dictionaries
         """
-        history = self._metrics_history[-count:] if count else self._metrics_history
+        history = self._history_snapshot()
+        if count:
+            history = history[-count:]
         return [m.to_dict() for m in history]
 
 
@@ -512,7 +566,8 @@ def get_resource_monitor() -> ResourceMonitor:
     """
     Get global resource monitor singleton.
 
-    Initializes with configuration from environment variables if not already created.
+    Initializes with configuration from environment variables if not already created
+    and starts its background sampler.
     Thread-safe using double-checked locking pattern.
 
     Returns:
@@ -550,9 +605,14 @@ def get_resource_monitor() -> ResourceMonitor:
 
                 monitoring_enabled = get_secret('resource_monitoring_enabled')
 
+                sample_interval = get_secret('resource_sample_interval') or os.environ.get('RESOURCE_SAMPLE_INTERVAL')
+                sample_interval = float(sample_interval) if sample_interval else DEFAULT_SAMPLE_INTERVAL_SECONDS
+
                 _resource_monitor = ResourceMonitor(
                     thresholds=thresholds,
-                    monitoring_enabled=monitoring_enabled
+                    monitoring_enabled=monitoring_enabled,
+                    sample_interval=sample_interval
                 )
+                _resource_monitor.start_sampler()
 
     return _resource_monitor
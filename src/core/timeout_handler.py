@@ -5,7 +5,9 @@ Provides decorator-based timeout enforcement for both synchronous and
 asynchronous operations to prevent hanging processes.
 
 Features:
-- @with_timeout decorator for sync functions
+- @with_timeout decorator for sync functions (bounded worker pool, or an
+  inline deadline check for operations known to be short)
+- Per-operation call, timeout and overhead metrics
 - @async_timeout decorator for async functions
 - Cross-platform support (Windows, Linux, macOS)
 - Graceful timeout exceptions with context
@@ -16,7 +18,9 @@ import asyncio
 import threading
 import functools
 import logging
-from typing import Callable, Any, Optional, TypeVar, cast
+import time
+from concurrent import futures
+from typing import Callable, Any, Dict, Optional, TypeVar, cast
 from datetime import datetime
 
 # Import centralized secrets management
@@ -27,6 +31,9 @@ logger = logging.getLogger(__name__)
 # Type variable for generic function returns
 T = TypeVar('T')
 
+# Default size of the shared worker pool used by @with_timeout
+DEFAULT_TIMEOUT_POOL_WORKERS = 8
+
 
 class TimeoutError(Exception):
     """
@@ -52,16 +59,113 @@ class TimeoutError(Exception):
         super().__init__(msg)
 
 
-def with_timeout(seconds: float, operation_name: Optional[str] = None):
+class TimeoutMetrics:
+    """
+    Per-operation statistics for @with_timeout.
+
+    Overhead is the wall time spent in the decorator itself (pool
+    hand-off, queueing and join) on top of the wrapped function.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._operations: Dict[str, Dict[str, float]] = {}
+
+    def record(self, operation: str, elapsed: float, overhead: float, timed_out: bool = False) -> None:
+        """Record one call of ``operation`` (times in seconds)."""
+        with self._lock:
+            stats = self._operations.get(operation)
+            if stats is None:
+                stats = {
+                    "calls": 0,
+                    "timeouts": 0,
+                    "total_seconds": 0.0,
+                    "max_seconds": 0.0,
+                    "total_overhead_seconds": 0.0,
+                    "max_overhead_seconds": 0.0,
+                }
+                self._operations[operation] = stats
+            stats["calls"] += 1
+            stats["timeouts"] += int(timed_out)
+            stats["total_seconds"] += elapsed
+            stats["max_seconds"] = max(stats["max_seconds"], elapsed)
+            stats["total_overhead_seconds"] += overhead
+            stats["max_overhead_seconds"] = max(stats["max_overhead_seconds"], overhead)
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Copy of the statistics with per-call averages."""
+        with self._lock:
+            result = {}
+            for operation, stats in self._operations.items():
+                calls = stats["calls"] or 1
+                result[operation] = {
+                    **stats,
+                    "avg_seconds": stats["total_seconds"] / calls,
+                    "avg_overhead_seconds": stats["total_overhead_seconds"] / calls,
+                }
+            return result
+
+    def reset(self) -> None:
+        """Clear all statistics."""
+        with self._lock:
+            self._operations.clear()
+
+
+_timeout_metrics = TimeoutMetrics()
+
+# Shared worker pool, created on first use
+_timeout_pool: Optional[futures.ThreadPoolExecutor] = None
+_timeout_pool_lock = threading.Lock()
+
+# Marks pool worker threads so nested @with_timeout calls run inline
+_worker_state = threading.local()
+
+
+def get_timeout_metrics() -> Dict[str, Dict[str, float]]:
+    """Get per-operation @with_timeout statistics."""
+    return _timeout_metrics.snapshot()
+
+
+def reset_timeout_metrics() -> None:
+    """Reset per-operation @with_timeout statistics."""
+    _timeout_metrics.reset()
+
+
+def _get_timeout_pool() -> futures.ThreadPoolExecutor:
+    """Get the shared, bounded worker pool for @with_timeout."""
+    global _timeout_pool
+    if _timeout_pool is None:
+        with _timeout_pool_lock:
+            if _timeout_pool is None:
+                workers = int(
+                    get_secret('timeout_pool_workers', default=str(DEFAULT_TIMEOUT_POOL_WORKERS))
+                    or DEFAULT_TIMEOUT_POOL_WORKERS
+                )
+                _timeout_pool = futures.ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix="with_timeout"
+                )
+    return _timeout_pool
+
+
+def with_timeout(seconds: float, operation_name: Optional[str] = None, inline: bool = False):
     """
     Decorator to enforce timeout on synchronous functions.
     
-    Uses threading.Timer for cross-platform compatibility.
-    When timeout is reached, raises TimeoutError.
+    By default the function runs on a shared, bounded worker pool and the
+    caller waits at most ``seconds`` for it; on timeout the caller gets
+    TimeoutError while the worker finishes in the background (a call still
+    queued behind busy workers is cancelled instead).
+
+    With ``inline=True`` the function runs on the calling thread with no
+    thread hand-off at all; it cannot be interrupted, so the deadline is
+    checked when it returns and TimeoutError is raised if it was exceeded.
+    Use this for operations known to be short. Nested @with_timeout calls
+    made from a pool worker also run inline, so they cannot starve the pool.
     
     Args:
         seconds: Maximum execution time in seconds
         operation_name: Optional name for logging (defaults to function name)
+        inline: Run on the calling thread with a deadline check
     
     Returns:
         Decorated function that raises TimeoutError on timeout
@@ -73,45 +177,63 @@ def with_timeout(seconds: float, operation_name: Optional[str] = None):
             pass
     """
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        op_name = operation_name or func.__name__
+
+        def run_inline(args: Any, kwargs: Any) -> T:
+            start_time = datetime.now()
+            started = time.perf_counter()
+            try:
+                result = func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - started
+                _timeout_metrics.record(op_name, elapsed, 0.0, timed_out=elapsed > seconds)
+
+            if elapsed > seconds:
+                logger.warning(
+                    f"Timeout: {op_name} exceeded {seconds}s (elapsed: {elapsed:.2f}s)"
+                )
+                raise TimeoutError(op_name, seconds, start_time)
+            return result
+
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> T:
-            op_name = operation_name or func.__name__
+            if inline or getattr(_worker_state, "active", False):
+                return run_inline(args, kwargs)
+
             start_time = datetime.now()
-            
-            # Container to hold result or exception
-            result_container: dict = {'exception': None, 'result': None, 'completed': False}
-            timeout_triggered = threading.Event()
-            
-            def target():
-                """Execute function in thread"""
+            started = time.perf_counter()
+            func_elapsed = [0.0]
+
+            def target() -> T:
+                """Execute function on a pool worker"""
+                _worker_state.active = True
+                func_started = time.perf_counter()
                 try:
-                    result_container['result'] = func(*args, **kwargs)
-                    result_container['completed'] = True
-                except Exception as e:
-                    result_container['exception'] = e
-                    result_container['completed'] = True
-            
-            # Start function in separate thread
-            thread = threading.Thread(target=target, daemon=True)
-            thread.start()
-            
-            # Wait for completion or timeout
-            thread.join(timeout=seconds)
-            
-            if not result_container['completed']:
+                    return func(*args, **kwargs)
+                finally:
+                    func_elapsed[0] = time.perf_counter() - func_started
+                    _worker_state.active = False
+
+            future = _get_timeout_pool().submit(target)
+            try:
+                result = future.result(timeout=seconds)
+            except futures.TimeoutError:
                 # Timeout occurred
-                timeout_triggered.set()
-                elapsed = (datetime.now() - start_time).total_seconds()
+                future.cancel()
+                elapsed = time.perf_counter() - started
+                _timeout_metrics.record(op_name, elapsed, 0.0, timed_out=True)
                 logger.warning(
                     f"Timeout: {op_name} exceeded {seconds}s (elapsed: {elapsed:.2f}s)"
                 )
                 raise TimeoutError(op_name, seconds, start_time)
-            
-            # Check for exception in thread
-            if result_container['exception']:
-                raise result_container['exception']
-            
-            return cast(T, result_container['result'])
+            except Exception:
+                elapsed = time.perf_counter() - started
+                _timeout_metrics.record(op_name, elapsed, max(0.0, elapsed - func_elapsed[0]))
+                raise
+
+            elapsed = time.perf_counter() - started
+            _timeout_metrics.record(op_name, elapsed, max(0.0, elapsed - func_elapsed[0]))
+            return cast(T, result)
         
         return wrapper
     
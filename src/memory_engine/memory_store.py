@@ -6,6 +6,8 @@ Self-updating the memory that prioritizes recent and recurring events.
 
 try:
     import numpy as np
+    from .vector_index import EmbeddingMatrix, IVFIndex
+    from .segment_store import SegmentStore
 except ImportError:
     np = None
 
@@ -13,12 +15,14 @@ import math
 import threading
 import tempfile
 from datetime import datetime, timedelta
-from typing import List, Dict, Tuple, Optional, Union, Any, TYPE_CHECKING
+from typing import List, Dict, Tuple, Optional, Union, Any, Iterator, Sequence, TYPE_CHECKING
 import pickle
 import os
 import logging
 import fasteners
 
+from .time_index import TimeIndex
+
 if TYPE_CHECKING:
     import numpy as np
 
@@ -26,8 +30,6 @@ if TYPE_CHECKING:
 from core.timeout_handler import with_timeout
 from core.resource_monitor import monitor_operation_resources
 
-from core.timeout_handler import with_timeout
-
 logger = logging.getLogger(__name__)
 
 # Security: Base directory for memory store persistence
@@ -43,6 +45,19 @@ DEFAULT_MAX_CAPACITY = 10000
 DEFAULT_SIMILARITY_THRESHOLD = 0.85
 DEFAULT_MAX_AGE_HOURS = 24
 DEFAULT_TOP_K = 5
+DEFAULT_REPLAY_CHUNK_SIZE = 1000
+DEFAULT_ANN_THRESHOLD = 50000
+DEFAULT_ANN_NPROBE = 8
+
+# Retrain the approximate index once the store has grown by this factor
+ANN_RETRAIN_GROWTH = 2.0
+
+# Persistence: segment directory, and the pickle file used by earlier releases
+DEFAULT_STORAGE_PATH = "memory_engine/memory_store"
+LEGACY_PICKLE_SUFFIX = ".pkl"
+
+# Compact the segment store once this fraction of its rows is pruned
+COMPACTION_DEAD_FRACTION = 0.5
 
 # Weighting constants for scoring
 SIMILARITY_WEIGHT = 0.5
@@ -55,20 +70,120 @@ EPSILON = 1e-10
 
 
 class MemoryEvent:
-    """Represents a stored memory event."""
+    """
+    Represents a stored memory event.
+
+    Events loaded from a segment store decode their embedding, metadata and
+    timestamp lazily on first access.
+    """
 
     def __init__(self, embedding: Union[List[float], "np.ndarray"], metadata: Dict, timestamp: datetime):
-        self.embedding = embedding
-        self.metadata = metadata
-        self.timestamp = timestamp
-        self.base_importance = metadata.get("severity", 0.5)
+        self._embedding = embedding
+        self._metadata = metadata
+        self._timestamp = timestamp
+        self._epoch: Optional[float] = None
         self.recurrence_count = 1
         self.is_critical = metadata.get("critical", False)
+        self.segment_row: Optional[int] = None
+        self._segments: Optional["SegmentStore"] = None
+
+    @classmethod
+    def from_segment(
+        cls,
+        segments: "SegmentStore",
+        row: int,
+        epoch: float,
+        recurrence_count: int,
+        is_critical: bool,
+    ) -> "MemoryEvent":
+        """Create a lazily decoded event backed by a segment row."""
+        event = cls.__new__(cls)
+        event._embedding = None
+        event._metadata = None
+        event._timestamp = None
+        event._epoch = epoch
+        event.recurrence_count = recurrence_count
+        event.is_critical = is_critical
+        event.segment_row = row
+        event._segments = segments
+        return event
+
+    @property
+    def embedding(self) -> Union[List[float], "np.ndarray"]:
+        if self._embedding is None:
+            self._embedding = self._segments.read_embedding(self.segment_row)
+        return self._embedding
+
+    @embedding.setter
+    def embedding(self, value: Union[List[float], "np.ndarray"]) -> None:
+        self._embedding = value
+
+    @property
+    def metadata(self) -> Dict:
+        if self._metadata is None:
+            self._metadata = self._segments.read_metadata(self.segment_row)
+        return self._metadata
+
+    @metadata.setter
+    def metadata(self, value: Dict) -> None:
+        self._metadata = value
+
+    @property
+    def timestamp(self) -> datetime:
+        if self._timestamp is None:
+            self._timestamp = datetime.fromtimestamp(self._epoch)
+        return self._timestamp
+
+    @timestamp.setter
+    def timestamp(self, value: datetime) -> None:
+        self._timestamp = value
+        self._epoch = None
+
+    @property
+    def epoch(self) -> float:
+        """Timestamp as seconds since the epoch."""
+        if self._epoch is None:
+            self._epoch = self._timestamp.timestamp()
+        return self._epoch
+
+    @property
+    def base_importance(self) -> float:
+        return self.metadata.get("severity", 0.5)
 
     def age_seconds(self) -> float:
         """Calculate age in seconds."""
         return (datetime.now() - self.timestamp).total_seconds()
 
+    def detach(self) -> None:
+        """Decode any lazy fields and drop the link to the segment store."""
+        if self._segments is not None:
+            self._embedding = self.embedding
+            self._metadata = self.metadata
+            self._segments = None
+        self._timestamp = self.timestamp
+        self.segment_row = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Materialize lazy fields; segment handles are process-local
+        return {
+            "embedding": self.embedding,
+            "metadata": self.metadata,
+            "timestamp": self.timestamp,
+            "recurrence_count": self.recurrence_count,
+            "is_critical": self.is_critical,
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        # Also accepts the attribute layout of legacy pickles
+        self._embedding = state["embedding"]
+        self._metadata = state["metadata"]
+        self._timestamp = state["timestamp"]
+        self._epoch = None
+        self.recurrence_count = state.get("recurrence_count", 1)
+        self.is_critical = state.get("is_critical", False)
+        self.segment_row = None
+        self._segments = None
+
 
 class AdaptiveMemoryStore:
     """
@@ -81,28 +196,76 @@ class AdaptiveMemoryStore:
     - Clean interfaces: write, retrieve, prune, replay
     """
 
-    def __init__(self, decay_lambda: float = DEFAULT_DECAY_LAMBDA, max_capacity: int = DEFAULT_MAX_CAPACITY):
+    def __init__(
+        self,
+        decay_lambda: float = DEFAULT_DECAY_LAMBDA,
+        max_capacity: int = DEFAULT_MAX_CAPACITY,
+        ann_threshold: int = DEFAULT_ANN_THRESHOLD,
+        ann_nprobe: int = DEFAULT_ANN_NPROBE,
+        ann_background: bool = True,
+    ):
         """
         Initialize adaptive memory store.
 
         Args:
             decay_lambda: Decay rate for temporal weighting (default: 0.1)
             max_capacity: Maximum number of events to store
+            ann_threshold: Store size above which similarity search uses the
+                approximate IVF index instead of an exact scan
+            ann_nprobe: Number of IVF cells scanned per approximate query
+            ann_background: Train the IVF index on a background thread (exact
+                search is used until it is ready); False trains inline
 
         Raises:
-            ValueError: If decay_lambda is negative or max_capacity is not positive
+            ValueError: If decay_lambda is negative or max_capacity/ann_threshold is not positive
         """
         if decay_lambda < 0:
             raise ValueError("decay_lambda must be non-negative")
         if max_capacity <= 0:
             raise ValueError("max_capacity must be positive")
+        if ann_threshold <= 0:
+            raise ValueError("ann_threshold must be positive")
         self.decay_lambda = decay_lambda
         self.max_capacity = max_capacity
-        self.memory: List[MemoryEvent] = []
-        self.storage_path = "memory_engine/memory_store.pkl"
+        self.ann_threshold = ann_threshold
+        self.ann_nprobe = ann_nprobe
+        self.ann_background = ann_background
+        self.storage_path = DEFAULT_STORAGE_PATH
         self._lock = threading.RLock()  # Reentrant lock for thread safety
 
-    @with_timeout(seconds=3.0, operation_name="memory_write")
+        # Row i of the embedding matrix always mirrors self.memory[i]
+        self._matrix = EmbeddingMatrix() if np is not None else None
+        self._events: List[MemoryEvent] = []
+
+        # Approximate index state; the generation is bumped whenever row ids
+        # shift so that a stale background training result is discarded
+        self._ann: Optional["IVFIndex"] = None
+        self._ann_generation = 0
+        self._ann_training = False
+
+        # Attached on save()/load(); new events are then appended incrementally
+        self._segments: Optional["SegmentStore"] = None
+
+        # Timestamp-ordered view for prune/replay, and incident_id lookup
+        # (built on first incident query so lazily loaded metadata stays undecoded)
+        self._timeline = TimeIndex()
+        self._incidents: Optional[Dict[str, List[MemoryEvent]]] = None
+
+    @property
+    def memory(self) -> List[MemoryEvent]:
+        """Stored events, aligned with the rows of the embedding matrix."""
+        return self._events
+
+    @memory.setter
+    def memory(self, events: List[MemoryEvent]) -> None:
+        with self._lock:
+            self._events = list(events)
+            self._rebuild_index()
+            # The on-disk segment no longer mirrors memory; next save() rewrites it
+            self._detach_segments()
+
+    # write/retrieve are short vectorized operations: deadline check, no thread hand-off
+    @with_timeout(seconds=3.0, operation_name="memory_write", inline=True)
     def write(
         self,
         embedding: Union[List[float], "np.ndarray"],
@@ -127,23 +290,65 @@ class AdaptiveMemoryStore:
         if timestamp is None:
             timestamp = datetime.now()
 
-        # Check for similar existing events (recurrence)
-        similar = self._find_similar(embedding, threshold=0.85)
+        with self._lock:
+            self._write_locked(embedding, metadata, timestamp)
+            over_capacity = len(self._events) > self.max_capacity
 
-        if similar:
-            # Boost recurrence count for existing event
-            similar.recurrence_count += 1
-            similar.metadata["last_seen"] = timestamp
-        else:
-            # Add new event
-            event = MemoryEvent(embedding, metadata, timestamp)
-            self.memory.append(event)
+        # Auto-prune if capacity exceeded (outside the lock: prune runs on a timeout pool worker)
+        if over_capacity:
+            self.prune(keep_critical=True)
+
+    @with_timeout(seconds=30.0, operation_name="memory_write_batch", inline=True)
+    def write_batch(
+        self,
+        embeddings: Sequence[Union[List[float], "np.ndarray"]],
+        metadatas: Sequence[Dict],
+        timestamps: Optional[Sequence[Optional[datetime]]] = None,
+    ) -> None:
+        """
+        Store several events under a single lock acquisition.
+
+        Equivalent to calling ``write`` for each item in order (later items
+        may recur against earlier ones), with one capacity check at the end.
+
+        Args:
+            embeddings: Vector representations of the events
+            metadatas: Event metadata, aligned with ``embeddings``
+            timestamps: Optional event timestamps (None entries default to now)
+
+        Raises:
+            ValueError: If the inputs are misaligned, or any embedding is
+                empty or metadata is not a dict (nothing is written)
+        """
+        if len(metadatas) != len(embeddings) or (timestamps is not None and len(timestamps) != len(embeddings)):
+            raise ValueError("embeddings, metadatas and timestamps must have the same length")
+        dims = set()
+        for embedding, metadata in zip(embeddings, metadatas):
+            if embedding is None or len(embedding) == 0:
+                raise ValueError("Embedding cannot be empty")
+            if not isinstance(metadata, dict):
+                raise ValueError("Metadata must be a dictionary")
+            dims.add(len(embedding))
+        if not embeddings:
+            return
+
+        now = datetime.now()
+        if timestamps is None:
+            timestamps = [now] * len(embeddings)
 
-        # Auto-prune if capacity exceeded
-        if len(self.memory) > self.max_capacity:
+        with self._lock:
+            if self._matrix is not None and (
+                len(dims) > 1 or (self._matrix.dim is not None and dims != {self._matrix.dim})
+            ):
+                raise ValueError("Embeddings must have the same length for cosine similarity")
+            for embedding, metadata, timestamp in zip(embeddings, metadatas, timestamps):
+                self._write_locked(embedding, metadata, timestamp if timestamp is not None else now)
+            over_capacity = len(self._events) > self.max_capacity
+
+        if over_capacity:
             self.prune(keep_critical=True)
 
-    @with_timeout(seconds=5.0, operation_name="memory_retrieve")
+    @with_timeout(seconds=5.0, operation_name="memory_retrieve", inline=True)
     def retrieve(
         self, query_embedding: Union[List[float], "np.ndarray"], top_k: int = DEFAULT_TOP_K
     ) -> List[Tuple[float, Dict, datetime]]:
@@ -169,6 +374,9 @@ class AdaptiveMemoryStore:
             if not self.memory:
                 return []
 
+            if self._matrix is not None:
+                return self._retrieve_vectorized(query_embedding, top_k)
+
             scores = []
             for event in self.memory:
                 # Calculate similarity
@@ -178,7 +386,7 @@ class AdaptiveMemoryStore:
                 temporal_weight = self._temporal_weight(event)
 
                 # Apply recurrence boost
-                recurrence_boost = 1 + RECURRENCE_BOOST_FACTOR * (np.log(1 + event.recurrence_count) if np is not None else math.log(1 + event.recurrence_count))
+                recurrence_boost = 1 + RECURRENCE_BOOST_FACTOR * math.log(1 + event.recurrence_count)
 
                 # Combined weighted score
                 weighted_score = (
@@ -215,21 +423,37 @@ class AdaptiveMemoryStore:
             return 0
         with self._lock:
             cutoff = datetime.now() - timedelta(hours=max_age_hours)
-            initial_count = len(self.memory)
-
-            if keep_critical:
-                # Keep critical events and recent events
-                self.memory = [
-                    event
-                    for event in self.memory
-                    if event.is_critical or event.timestamp > cutoff
-                ]
+
+            # Only the expired prefix of the time index is examined
+            removed = self._timeline.prune_prefix(
+                cutoff.timestamp(), keep=(lambda event: event.is_critical) if keep_critical else None
+            )
+            if not removed:
+                return 0
+
+            if self._matrix is not None:
+                keep_mask = self._matrix.timestamps > cutoff.timestamp()
+                if keep_critical:
+                    # Keep critical events and recent events
+                    keep_mask |= self._matrix.critical
+                self._events = [self._events[i] for i in np.flatnonzero(keep_mask)]
+                self._matrix.compact(keep_mask)
+                self._invalidate_ann()
             else:
-                # Only keep recent events
-                self.memory = [event for event in self.memory if event.timestamp > cutoff]
+                removed_ids = {id(event) for event in removed}
+                self._events = [event for event in self._events if id(event) not in removed_ids]
+
+            if self._incidents is not None:
+                self._unindex_incidents(removed)
+
+            if self._segments is not None:
+                self._segments.delete(
+                    [event.segment_row for event in removed if event.segment_row is not None]
+                )
+                if self._segments.dead_fraction > COMPACTION_DEAD_FRACTION:
+                    self._compact_segments()
 
-            pruned_count = initial_count - len(self.memory)
-            return pruned_count
+            return len(removed)
 
     @with_timeout(seconds=30.0)
     @monitor_operation_resources()
@@ -250,44 +474,88 @@ class AdaptiveMemoryStore:
         if start_time > end_time:
             raise ValueError("start_time must be before or equal to end_time")
         with self._lock:
-            # Filter events in time range and sort by timestamp
-            filtered_events = [
-                event
-                for event in self.memory
-                if start_time <= event.timestamp <= end_time
-            ]
+            events = self._timeline.range(start_time.timestamp(), end_time.timestamp())
+            return [event.metadata for event in events]
+
+    def iter_replay(
+        self, start_time: datetime, end_time: datetime, chunk_size: int = DEFAULT_REPLAY_CHUNK_SIZE
+    ) -> Iterator[Dict]:
+        """
+        Stream event metadata within a time range in chronological order.
 
-            # Sort chronologically by event timestamp
-            filtered_events.sort(key=lambda event: event.timestamp)
+        Unlike replay(), the window is read in chunks of ``chunk_size`` events,
+        so huge time ranges never materialize into a single list. Events
+        written or pruned while iterating may or may not be included.
 
-            # Extract metadata
-            return [event.metadata for event in filtered_events]
+        Args:
+            start_time: Start of time range
+            end_time: End of time range
+            chunk_size: Number of events fetched per lock acquisition
+
+        Yields:
+            Event metadata
+
+        Raises:
+            ValueError: If start_time is after end_time or chunk_size is not positive
+        """
+        if start_time > end_time:
+            raise ValueError("start_time must be before or equal to end_time")
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        start, end = start_time.timestamp(), end_time.timestamp()
+        cursor = None
+        while True:
+            with self._lock:
+                events, cursor = self._timeline.range_chunk(start, end, cursor, chunk_size)
+            if not events:
+                return
+            for event in events:
+                yield event.metadata
+
+    def get_incident_events(self, incident_id: str) -> List[MemoryEvent]:
+        """
+        Events tagged with ``incident_id`` in chronological order.
+
+        Args:
+            incident_id: Unique incident identifier
+
+        Returns:
+            Matching events (empty if the incident is unknown)
+        """
+        with self._lock:
+            if self._incidents is None:
+                self._incidents = {}
+                for event in self._timeline.range(-math.inf, math.inf):
+                    iid = event.metadata.get("incident_id")
+                    if iid is not None:
+                        self._incidents.setdefault(iid, []).append(event)
+            events = list(self._incidents.get(incident_id, ()))
+        events.sort(key=lambda event: event.epoch)
+        return events
 
     @with_timeout(seconds=60.0)
     @monitor_operation_resources()
     def save(self) -> None:
-        """Persist memory to disk with path validation."""
+        """
+        Persist memory to disk with path validation.
+
+        The first save writes every event to a segment directory; later saves
+        only flush rows appended by write() and compact pruned rows.
+        """
         with self._lock:
             try:
-                # Security: Validate storage path is within base directory (prevents path traversal)
-                resolved_path = os.path.abspath(self.storage_path)
-                # Allow paths starting with MEMORY_STORE_BASE_DIR, /tmp, or system temp dir (for testing)
-                is_safe = (
-                    resolved_path.startswith(MEMORY_STORE_BASE_DIR) or
-                    resolved_path.startswith("/tmp") or
-                    resolved_path.startswith(SYSTEM_TEMP_DIR)
-                )
-                if not is_safe:
-                    logger.error(
-                        f"⚠️  Storage path traversal attempt blocked: {self.storage_path}"
-                    )
-                    raise ValueError(
-                        f"Storage path must be within {MEMORY_STORE_BASE_DIR}, /tmp, or system temp directory"
-                    )
-
-                os.makedirs(os.path.dirname(resolved_path), exist_ok=True)
-                with open(resolved_path, "wb") as f:
-                    pickle.dump(self.memory, f)
+                resolved_path = self._resolve_storage_path()
+                if self._matrix is None:
+                    self._save_pickle(resolved_path)
+                    return
+
+                lock_path = resolved_path + ".lock"
+                with fasteners.InterProcessLock(lock_path):
+                    if self._segments is None or self._segments.path != resolved_path:
+                        self._attach_new_segments(resolved_path)
+                    elif self._segments.dead_fraction > COMPACTION_DEAD_FRACTION:
+                        self._compact_segments()
+                    self._segments.flush()
                 logger.debug(f"Memory store saved to {resolved_path}")
             except Exception as e:
                 logger.error(f"Failed to save memory store: {e}", exc_info=True)
@@ -299,30 +567,23 @@ class AdaptiveMemoryStore:
         """Load memory from disk with validation, error handling, and file locking."""
         with self._lock:
             try:
-                # Security: Validate storage path is within base directory (prevents path traversal)
-                resolved_path = os.path.abspath(self.storage_path)
-                # Allow paths starting with MEMORY_STORE_BASE_DIR, /tmp, or system temp dir (for testing)
-                is_safe = (
-                    resolved_path.startswith(MEMORY_STORE_BASE_DIR) or
-                    resolved_path.startswith("/tmp") or
-                    resolved_path.startswith(SYSTEM_TEMP_DIR)
-                )
-                if not is_safe:
-                    logger.error(
-                        f"⚠️  Storage path traversal attempt blocked: {self.storage_path}"
-                    )
-                    raise ValueError(
-                        f"Storage path must be within {MEMORY_STORE_BASE_DIR}, /tmp, or system temp directory"
-                    )
-
-                if os.path.exists(resolved_path):
+                resolved_path = self._resolve_storage_path()
+
+                if self._matrix is not None and SegmentStore.exists(resolved_path):
                     # Use inter-process file lock to prevent concurrent access corruption
-                    lock_path = resolved_path + ".lock"
-                    with fasteners.InterProcessLock(lock_path):
-                        with open(resolved_path, "rb") as f:
-                            self.memory = pickle.load(f)  # nosec B301 - trusted internal persistence format
+                    with fasteners.InterProcessLock(resolved_path + ".lock"):
+                        self._load_segments(resolved_path)
                     logger.debug(f"Memory store loaded from {resolved_path}")
                     return True
+
+                # Fall back to the pickle format written by earlier releases
+                for legacy_path in (resolved_path, resolved_path + LEGACY_PICKLE_SUFFIX):
+                    if os.path.isfile(legacy_path):
+                        with fasteners.InterProcessLock(legacy_path + ".lock"):
+                            with open(legacy_path, "rb") as f:
+                                self.memory = pickle.load(f)  # nosec B301 - trusted internal persistence format
+                        logger.debug(f"Memory store loaded from legacy pickle {legacy_path}")
+                        return True
                 return False
             except (pickle.UnpicklingError, EOFError, ValueError) as e:
                 logger.error(f"Failed to load memory store: {e}", exc_info=True)
@@ -343,12 +604,21 @@ class AdaptiveMemoryStore:
                 "max_recurrence": 0,
             }
 
+        if self._matrix is not None:
+            ages = (datetime.now().timestamp() - self._matrix.timestamps) / 3600
+            return {
+                "total_events": len(self.memory),
+                "critical_events": int(self._matrix.critical.sum()),
+                "avg_age_hours": float(ages.mean()),
+                "max_recurrence": int(self._matrix.recurrence.max()),
+            }
+
         ages = [event.age_seconds() / 3600 for event in self.memory]
 
         return {
             "total_events": len(self.memory),
             "critical_events": sum(1 for e in self.memory if e.is_critical),
-            "avg_age_hours": np.mean(ages) if np is not None else sum(ages) / len(ages),
+            "avg_age_hours": sum(ages) / len(ages),
             "max_recurrence": max(e.recurrence_count for e in self.memory),
         }
 
@@ -379,10 +649,282 @@ class AdaptiveMemoryStore:
             return dot_product / (norm_a * norm_b + EPSILON)
 
     def _find_similar(
-        self, embedding: Union[List[float], "np.ndarray"], threshold: float = DEFAULT_SIMILARITY_THRESHOLD
+        self,
+        embedding: Union[List[float], "np.ndarray"],
+        threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+        unit: Optional["np.ndarray"] = None,
     ) -> Optional[MemoryEvent]:
-        """Find similar event in memory."""
-        for event in self.memory:
-            if self._cosine_similarity(embedding, event.embedding) > threshold:
-                return event
-        return None
+        """Find the earliest-stored event whose similarity exceeds threshold."""
+        if self._matrix is None:
+            for event in self.memory:
+                if self._cosine_similarity(embedding, event.embedding) > threshold:
+                    return event
+            return None
+
+        if unit is None:
+            unit = self._prepare_query(embedding)
+        row = self._find_similar_row(unit, threshold)
+        return None if row is None else self._events[row]
+
+    def _find_similar_row(self, unit: "np.ndarray", threshold: float) -> Optional[int]:
+        """Row index of the earliest-stored event whose similarity exceeds threshold."""
+        if self._matrix.size == 0:
+            return None
+        rows = self._candidate_rows(unit)
+        sims = self._matrix.similarities(unit, rows)
+        hits = np.flatnonzero(sims > threshold)
+        if hits.size == 0:
+            return None
+        return int(hits[0]) if rows is None else int(rows[hits[0]])
+
+    def _prepare_query(self, embedding: Union[List[float], "np.ndarray"]) -> Optional["np.ndarray"]:
+        """Normalize a query embedding and validate its dimension."""
+        if self._matrix is None:
+            return None
+        unit = EmbeddingMatrix.normalize(embedding)
+        self._matrix.check_dim(unit)
+        return unit
+
+    def _retrieve_vectorized(
+        self, query_embedding: Union[List[float], "np.ndarray"], top_k: int
+    ) -> List[Tuple[float, Dict, datetime]]:
+        """Score all (or ANN-candidate) rows in one batch and select top_k."""
+        unit = self._prepare_query(query_embedding)
+        rows = self._candidate_rows(unit)
+        if rows is None:
+            timestamps = self._matrix.timestamps
+            recurrence = self._matrix.recurrence
+        else:
+            if rows.size == 0:
+                return []
+            timestamps = self._matrix.timestamps[rows]
+            recurrence = self._matrix.recurrence[rows]
+
+        similarity = self._matrix.similarities(unit, rows)
+        age_hours = (datetime.now().timestamp() - timestamps) / 3600
+        temporal_weight = np.exp(-self.decay_lambda * age_hours)
+        recurrence_boost = 1 + RECURRENCE_BOOST_FACTOR * np.log1p(recurrence)
+        weighted = (
+            SIMILARITY_WEIGHT * similarity +
+            TEMPORAL_WEIGHT * temporal_weight +
+            RECURRENCE_WEIGHT * recurrence_boost
+        )
+
+        k = min(top_k, weighted.shape[0])
+        top = np.argpartition(-weighted, k - 1)[:k]
+        top = top[np.argsort(-weighted[top], kind="stable")]
+        results = []
+        for pos in top.tolist():
+            event = self._events[pos if rows is None else int(rows[pos])]
+            results.append((float(weighted[pos]), event.metadata, event.timestamp))
+        return results
+
+    def _write_locked(
+        self, embedding: Union[List[float], "np.ndarray"], metadata: Dict, timestamp: datetime
+    ) -> None:
+        """Store one validated event, or bump the recurrence of a similar one (lock held)."""
+        unit = self._prepare_query(embedding)
+
+        # Check for similar existing events (recurrence)
+        if self._matrix is not None:
+            row = self._find_similar_row(unit, DEFAULT_SIMILARITY_THRESHOLD)
+            similar = None if row is None else self._events[row]
+        else:
+            similar = self._find_similar(embedding, threshold=DEFAULT_SIMILARITY_THRESHOLD)
+
+        if similar:
+            # Boost recurrence count for existing event
+            similar.recurrence_count += 1
+            similar.metadata["last_seen"] = timestamp
+            if self._matrix is not None:
+                self._matrix.recurrence[row] = similar.recurrence_count
+            if self._segments is not None and similar.segment_row is not None:
+                self._segments.update(similar.segment_row, similar.recurrence_count, similar.metadata)
+        else:
+            # Add new event
+            event = MemoryEvent(embedding, metadata, timestamp)
+            self._events.append(event)
+            self._index_event(event, unit)
+            self._timeline.insert(event.epoch, event)
+            if self._incidents is not None and "incident_id" in metadata:
+                self._incidents.setdefault(metadata["incident_id"], []).append(event)
+            if self._segments is not None:
+                event.segment_row = self._segments.append(
+                    unit, timestamp.timestamp(), event.recurrence_count, event.is_critical, metadata
+                )
+
+    def _candidate_rows(self, unit: "np.ndarray") -> Optional["np.ndarray"]:
+        """Rows to score for a query: None (all rows) unless the ANN index is active."""
+        if self._ann is None or self._matrix.size < self.ann_threshold:
+            return None
+        return self._ann.candidates(unit)
+
+    def _index_event(self, event: MemoryEvent, unit: Optional["np.ndarray"]) -> None:
+        """Append a newly stored event to the embedding matrix and ANN index."""
+        if self._matrix is None:
+            return
+        row = self._matrix.append(
+            unit, event.timestamp.timestamp(), event.recurrence_count, event.is_critical
+        )
+        if self._ann is not None:
+            self._ann.add(row, unit)
+        self._refresh_ann()
+
+    def _invalidate_ann(self) -> None:
+        """Drop the ANN index after row ids have shifted (prune, reload)."""
+        self._ann = None
+        self._ann_generation += 1
+        self._refresh_ann()
+
+    def _refresh_ann(self) -> None:
+        """Train the ANN index when crossing the threshold or after enough growth."""
+        size = self._matrix.size
+        if size < self.ann_threshold:
+            self._ann = None
+            return
+        if self._ann_training:
+            return
+        if self._ann is not None and size < self._ann.trained_size * ANN_RETRAIN_GROWTH:
+            return
+
+        self._ann_training = True
+        args = (self._matrix.vectors, self._ann_generation)
+        if self.ann_background:
+            threading.Thread(target=self._train_ann, args=args, daemon=True).start()
+        else:
+            self._train_ann(*args)
+
+    def _train_ann(self, vectors: "np.ndarray", generation: int) -> None:
+        """Fit a fresh IVF index on a snapshot of rows and swap it in."""
+        index = IVFIndex(nprobe=self.ann_nprobe)
+        try:
+            index.train(vectors)
+        except Exception as e:
+            logger.error(f"Failed to train ANN index: {e}", exc_info=True)
+            with self._lock:
+                self._ann_training = False
+            return
+
+        with self._lock:
+            self._ann_training = False
+            if generation != self._ann_generation:
+                # Rows moved while training; start over on the current layout
+                self._refresh_ann()
+                return
+            # Catch up on rows appended while training ran
+            index.add_batch(index.trained_size, self._matrix.vectors[index.trained_size :])
+            self._ann = index
+
+    def _rebuild_index(self) -> None:
+        """Rebuild the time, incident, embedding and ANN indexes from self._events."""
+        self._timeline.rebuild(self._events, [event.epoch for event in self._events])
+        self._incidents = None
+        if self._matrix is None:
+            return
+        self._matrix = EmbeddingMatrix()
+        for event in self._events:
+            unit = self._prepare_query(event.embedding)
+            self._matrix.append(
+                unit, event.timestamp.timestamp(), event.recurrence_count, event.is_critical
+            )
+        self._invalidate_ann()
+
+    def _resolve_storage_path(self) -> str:
+        """Validate storage path is within base directory (prevents path traversal)."""
+        resolved_path = os.path.abspath(self.storage_path)
+        # Allow paths starting with MEMORY_STORE_BASE_DIR, /tmp, or system temp dir (for testing)
+        is_safe = (
+            resolved_path.startswith(MEMORY_STORE_BASE_DIR) or
+            resolved_path.startswith("/tmp") or
+            resolved_path.startswith(SYSTEM_TEMP_DIR)
+        )
+        if not is_safe:
+            logger.error(
+                f"⚠️  Storage path traversal attempt blocked: {self.storage_path}"
+            )
+            raise ValueError(
+                f"Storage path must be within {MEMORY_STORE_BASE_DIR}, /tmp, or system temp directory"
+            )
+        return resolved_path
+
+    def _save_pickle(self, resolved_path: str) -> None:
+        """Write the whole store as a single pickle (used when NumPy is unavailable)."""
+        os.makedirs(os.path.dirname(resolved_path), exist_ok=True)
+        with open(resolved_path, "wb") as f:
+            pickle.dump(self._events, f)
+
+    def _attach_new_segments(self, resolved_path: str) -> None:
+        """Write all events to a fresh segment directory and append to it from now on."""
+        if os.path.isfile(resolved_path):
+            # A legacy pickle occupies the path; its contents are already in memory
+            logger.info(f"Migrating legacy memory store pickle at {resolved_path} to segment format")
+            os.remove(resolved_path)
+
+        self._detach_segments()
+        segments = SegmentStore(resolved_path)
+        segments.create(self._matrix.dim)
+        segments.append_batch(
+            self._matrix.vectors,
+            self._matrix.timestamps,
+            self._matrix.recurrence,
+            self._matrix.critical,
+            [event.metadata for event in self._events],
+        )
+        for row, event in enumerate(self._events):
+            event.segment_row = row
+        self._segments = segments
+
+    def _load_segments(self, resolved_path: str) -> None:
+        """Map a segment directory and build lazily decoded events over it."""
+        self._detach_segments()
+        segments = SegmentStore(resolved_path)
+        embeddings, records = segments.open()
+
+        live = np.flatnonzero(records["deleted"] == 0)
+        if live.shape[0] != records.shape[0]:
+            embeddings = embeddings[live]
+            records = records[live]
+        self._matrix = EmbeddingMatrix.from_arrays(
+            embeddings, records["timestamp"], records["recurrence"], records["critical"].astype(bool)
+        )
+        self._events = [
+            MemoryEvent.from_segment(segments, row, epoch, recurrence, bool(critical))
+            for row, epoch, recurrence, critical in zip(
+                live.tolist(),
+                records["timestamp"].tolist(),
+                records["recurrence"].tolist(),
+                records["critical"].tolist(),
+            )
+        ]
+        self._segments = segments
+        self._timeline.rebuild(self._events, self._matrix.timestamps.tolist())
+        self._incidents = None
+        self._invalidate_ann()
+
+    def _compact_segments(self) -> None:
+        """Drop tombstoned rows from disk and renumber live events."""
+        mapping = self._segments.compact()
+        for event in self._events:
+            if event.segment_row is not None:
+                event.segment_row = int(mapping[event.segment_row])
+
+    def _detach_segments(self) -> None:
+        """Stop appending to the current segment directory."""
+        if self._segments is None:
+            return
+        # Lazily decoded events must not outlive their segment handles
+        for event in self._events:
+            event.detach()
+        self._segments.close()
+        self._segments = None
+
+    def _unindex_incidents(self, removed: List[MemoryEvent]) -> None:
+        """Remove pruned events from the incident index."""
+        for event in removed:
+            iid = event.metadata.get("incident_id")
+            bucket = self._incidents.get(iid)
+            if bucket is None:
+                continue
+            bucket[:] = [e for e in bucket if e is not event]
+            if not bucket:
+                del self._incidents[iid]
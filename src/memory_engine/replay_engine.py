@@ -5,7 +5,7 @@ Replay past incidents for analysis and debugging.
 """
 
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Iterator
 
 
 class ReplayEngine:
@@ -13,7 +13,7 @@ class ReplayEngine:
     Replay events from memory like a security flight recorder.
 
     Features:
-    - Time-range queries
+    - Time-range queries (list or streaming)
     - Event filtering
     - Chronological playback
     - Incident reconstruction
@@ -41,6 +41,19 @@ class ReplayEngine:
         """
         return self.memory.replay(start_time, end_time)
 
+    def stream_time_range(self, start_time: datetime, end_time: datetime) -> Iterator[Dict]:
+        """
+        Stream events within time range without building one list.
+
+        Args:
+            start_time: Start of replay window
+            end_time: End of replay window
+
+        Yields:
+            Events in chronological order
+        """
+        return self.memory.iter_replay(start_time, end_time)
+
     def replay_incident(self, incident_id: str) -> Dict:
         """
         Replay a specific incident by ID.
@@ -51,18 +64,12 @@ class ReplayEngine:
         Returns:
             Incident details with timeline
         """
-        events = [
-            event
-            for event in self.memory.memory
-            if event.metadata.get("incident_id") == incident_id
-        ]
+        # Chronologically ordered, via the store's incident index
+        events = self.memory.get_incident_events(incident_id)
 
         if not events:
             return {"error": "Incident not found"}
 
-        # Sort chronologically
-        events.sort(key=lambda x: x.timestamp)
-
         return {
             "incident_id": incident_id,
             "start_time": events[0].timestamp,
@@ -90,11 +97,7 @@ class ReplayEngine:
             List of similar incidents
         """
         # Get reference incident
-        ref_events = [
-            e
-            for e in self.memory.memory
-            if e.metadata.get("incident_id") == incident_id
-        ]
+        ref_events = self.memory.get_incident_events(incident_id)
 
         if not ref_events:
             return []
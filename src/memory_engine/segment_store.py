@@ -0,0 +1,348 @@
+"""
+Segment Storage for Adaptive Memory
+
+Append-only, memory-mapped on-disk format for AdaptiveMemoryStore.
+
+Layout of a segment directory:
+- manifest.json: format version and embedding dimension
+- embeddings.f32: fixed-width rows of unit-normalized float32 embeddings
+- records.bin: fixed-width per-row records (timestamp, recurrence, flags,
+  location of the row's metadata blob)
+- metadata.log: append-only log of pickled metadata blobs
+
+Rows are only ever appended. Recurrence updates rewrite the row's record in
+place and append a new metadata blob; pruning sets a tombstone flag. Dead
+rows and superseded blobs are dropped by ``compact()``.
+
+A segment directory has a single writer process at a time.
+"""
+
+import json
+import os
+import pickle
+import shutil
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+SEGMENT_FORMAT_VERSION = 1
+
+MANIFEST_FILE = "manifest.json"
+EMBEDDINGS_FILE = "embeddings.f32"
+RECORDS_FILE = "records.bin"
+METADATA_FILE = "metadata.log"
+
+RECORD_DTYPE = np.dtype(
+    [
+        ("timestamp", "<f8"),
+        ("recurrence", "<i8"),
+        ("critical", "u1"),
+        ("deleted", "u1"),
+        ("meta_offset", "<u8"),
+        ("meta_length", "<u4"),
+    ]
+)
+
+
+class SegmentStore:
+    """
+    Append-only segment files backing an AdaptiveMemoryStore.
+
+    Features:
+    - O(1) open: embeddings and records are exposed as memory maps
+    - Lazy metadata: blobs are decoded only when a row is accessed
+    - Incremental append: each write adds one row, no full rewrite
+    - Compaction: rewrites live rows only, dropping tombstones
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize segment store.
+
+        Args:
+            path: Segment directory
+        """
+        self.path = path
+        self.dim: Optional[int] = None
+        self.rows = 0
+        self.dead_rows = 0
+        self._embeddings = None
+        self._records = None
+        self._metadata = None
+        # Lazily decoded events read through the same handles used for appends
+        self._io_lock = threading.RLock()
+
+    @staticmethod
+    def exists(path: str) -> bool:
+        """Whether ``path`` holds a segment directory."""
+        return os.path.isfile(os.path.join(path, MANIFEST_FILE))
+
+    @property
+    def dead_fraction(self) -> float:
+        """Fraction of stored rows that are tombstoned."""
+        return self.dead_rows / self.rows if self.rows else 0.0
+
+    def create(self, dim: Optional[int] = None) -> None:
+        """
+        Create an empty segment directory, replacing any previous contents.
+
+        Args:
+            dim: Embedding dimension (may be set later by the first append)
+        """
+        os.makedirs(self.path, exist_ok=True)
+        for name in (EMBEDDINGS_FILE, RECORDS_FILE, METADATA_FILE):
+            file_path = os.path.join(self.path, name)
+            # Unlink rather than truncate so live memory maps of the old file stay valid
+            if os.path.exists(file_path):
+                os.remove(file_path)
+            with open(file_path, "wb"):
+                pass
+        self.dim = dim
+        self.rows = 0
+        self.dead_rows = 0
+        self._write_manifest()
+        self._open_handles()
+
+    def open(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Open an existing segment directory for reading and appending.
+
+        Returns:
+            (embeddings, records) memory maps; embeddings is copy-on-write so
+            in-memory edits never reach the file
+
+        Raises:
+            ValueError: If the manifest version or file sizes are inconsistent
+        """
+        with open(os.path.join(self.path, MANIFEST_FILE), "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("format_version") != SEGMENT_FORMAT_VERSION:
+            raise ValueError(f"Unsupported segment format: {manifest.get('format_version')}")
+        self.dim = manifest.get("dim")
+
+        records_path = os.path.join(self.path, RECORDS_FILE)
+        embeddings_path = os.path.join(self.path, EMBEDDINGS_FILE)
+        self.rows = os.path.getsize(records_path) // RECORD_DTYPE.itemsize
+        if self.rows and self.dim is None:
+            raise ValueError("Segment has rows but no embedding dimension")
+        if self.rows and os.path.getsize(embeddings_path) < self.rows * self.dim * 4:
+            raise ValueError("Embedding segment is shorter than the record segment")
+
+        if self.rows:
+            records = np.memmap(records_path, dtype=RECORD_DTYPE, mode="r", shape=(self.rows,))
+            embeddings = np.memmap(
+                embeddings_path, dtype=np.float32, mode="c", shape=(self.rows, self.dim)
+            )
+            self.dead_rows = int(np.count_nonzero(records["deleted"]))
+        else:
+            records = np.empty(0, dtype=RECORD_DTYPE)
+            embeddings = np.empty((0, self.dim or 0), dtype=np.float32)
+            self.dead_rows = 0
+
+        self._open_handles()
+        return embeddings, records
+
+    def append(
+        self,
+        unit_vector: np.ndarray,
+        timestamp: float,
+        recurrence: int,
+        critical: bool,
+        metadata: Dict[str, Any],
+    ) -> int:
+        """
+        Append one row.
+
+        Returns:
+            Segment row index of the new row
+        """
+        return self.append_batch(
+            unit_vector[np.newaxis, :],
+            np.asarray([timestamp]),
+            np.asarray([recurrence]),
+            np.asarray([critical]),
+            [metadata],
+        )
+
+    def append_batch(
+        self,
+        unit_vectors: np.ndarray,
+        timestamps: np.ndarray,
+        recurrence: np.ndarray,
+        critical: np.ndarray,
+        metadatas: List[Dict[str, Any]],
+    ) -> int:
+        """
+        Append consecutive rows.
+
+        Returns:
+            Segment row index of the first appended row
+        """
+        with self._io_lock:
+            count = unit_vectors.shape[0]
+            first_row = self.rows
+            if count == 0:
+                return first_row
+            if self.dim is None:
+                self.dim = unit_vectors.shape[1]
+                self._write_manifest()
+            if unit_vectors.shape[1] != self.dim:
+                raise ValueError("Embeddings must have the same length for cosine similarity")
+
+            records = np.zeros(count, dtype=RECORD_DTYPE)
+            records["timestamp"] = timestamps
+            records["recurrence"] = recurrence
+            records["critical"] = critical
+
+            self._metadata.seek(0, os.SEEK_END)
+            offset = self._metadata.tell()
+            for i, metadata in enumerate(metadatas):
+                blob = pickle.dumps(metadata, protocol=pickle.HIGHEST_PROTOCOL)
+                self._metadata.write(blob)
+                records["meta_offset"][i] = offset
+                records["meta_length"][i] = len(blob)
+                offset += len(blob)
+
+            self._embeddings.seek(0, os.SEEK_END)
+            self._embeddings.write(np.ascontiguousarray(unit_vectors, dtype=np.float32).tobytes())
+            self._records.seek(0, os.SEEK_END)
+            self._records.write(records.tobytes())
+            self.rows += count
+            return first_row
+
+    def update(self, row: int, recurrence: int, metadata: Dict[str, Any]) -> None:
+        """Rewrite a row's recurrence count and metadata (new blob is appended)."""
+        with self._io_lock:
+            record = self._read_record(row)
+            record["recurrence"] = recurrence
+
+            blob = pickle.dumps(metadata, protocol=pickle.HIGHEST_PROTOCOL)
+            self._metadata.seek(0, os.SEEK_END)
+            record["meta_offset"] = self._metadata.tell()
+            record["meta_length"] = len(blob)
+            self._metadata.write(blob)
+
+            self._records.seek(row * RECORD_DTYPE.itemsize)
+            self._records.write(record.tobytes())
+
+    def delete(self, rows: List[int]) -> None:
+        """Tombstone rows; their space is reclaimed by ``compact()``."""
+        with self._io_lock:
+            if not rows:
+                return
+            self._records.flush()
+            records = np.memmap(
+                os.path.join(self.path, RECORDS_FILE), dtype=RECORD_DTYPE, mode="r+", shape=(self.rows,)
+            )
+            records["deleted"][np.asarray(rows, dtype=np.int64)] = 1
+            records.flush()
+            del records
+            self.dead_rows += len(rows)
+
+    def read_metadata(self, row: int) -> Dict[str, Any]:
+        """Decode the metadata blob of a row."""
+        with self._io_lock:
+            record = self._read_record(row)
+            blob = self._read(self._metadata, int(record["meta_offset"][0]), int(record["meta_length"][0]))
+            return pickle.loads(blob)  # nosec B301 - trusted internal persistence format
+
+    def read_embedding(self, row: int) -> np.ndarray:
+        """Read the stored (unit-normalized) embedding of a row."""
+        with self._io_lock:
+            width = self.dim * 4
+            return np.frombuffer(self._read(self._embeddings, row * width, width), dtype=np.float32)
+
+    def compact(self) -> np.ndarray:
+        """
+        Rewrite the segment with live rows only.
+
+        Returns:
+            Array mapping old row index to new row index (-1 for dropped rows)
+        """
+        with self._io_lock:
+            self.flush()
+            records_path = os.path.join(self.path, RECORDS_FILE)
+            records = np.fromfile(records_path, dtype=RECORD_DTYPE, count=self.rows)
+            live = np.flatnonzero(records["deleted"] == 0)
+            mapping = np.full(self.rows, -1, dtype=np.int64)
+            mapping[live] = np.arange(live.shape[0])
+
+            staging = SegmentStore(self.path + ".compacting")
+            staging.create(self.dim)
+            if live.shape[0]:
+                embeddings = np.fromfile(
+                    os.path.join(self.path, EMBEDDINGS_FILE), dtype=np.float32, count=self.rows * self.dim
+                ).reshape(self.rows, self.dim)
+                live_records = records[live]
+                with open(os.path.join(self.path, METADATA_FILE), "rb") as f:
+                    log = f.read()
+                starts = live_records["meta_offset"].tolist()
+                lengths = live_records["meta_length"].astype(np.uint64)
+                staging._metadata.write(
+                    b"".join(log[start : start + length] for start, length in zip(starts, lengths.tolist()))
+                )
+                live_records["meta_offset"] = np.cumsum(lengths) - lengths
+                staging._embeddings.write(np.ascontiguousarray(embeddings[live]).tobytes())
+                staging._records.write(live_records.tobytes())
+            staging.close()
+
+            self.close()
+            retired = self.path + ".retired"
+            shutil.rmtree(retired, ignore_errors=True)
+            os.replace(self.path, retired)
+            os.replace(staging.path, self.path)
+            shutil.rmtree(retired, ignore_errors=True)
+
+            self.rows = int(live.shape[0])
+            self.dead_rows = 0
+            self._open_handles()
+            return mapping
+
+    def flush(self) -> None:
+        """Flush buffered appends to the operating system."""
+        with self._io_lock:
+            for handle in (self._embeddings, self._records, self._metadata):
+                if handle is not None:
+                    handle.flush()
+
+    def close(self) -> None:
+        """Flush and close file handles."""
+        with self._io_lock:
+            self.flush()
+            for name in ("_embeddings", "_records", "_metadata"):
+                handle = getattr(self, name)
+                if handle is not None:
+                    handle.close()
+                    setattr(self, name, None)
+
+    # Private helper methods
+
+    def _open_handles(self) -> None:
+        """Open all segment files for reading and in-place writes."""
+        self.close()
+        self._embeddings = open(os.path.join(self.path, EMBEDDINGS_FILE), "r+b")
+        self._records = open(os.path.join(self.path, RECORDS_FILE), "r+b")
+        self._metadata = open(os.path.join(self.path, METADATA_FILE), "r+b")
+
+    def _write_manifest(self) -> None:
+        """Atomically write the manifest."""
+        manifest_path = os.path.join(self.path, MANIFEST_FILE)
+        tmp_path = manifest_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"format_version": SEGMENT_FORMAT_VERSION, "dim": self.dim}, f)
+        os.replace(tmp_path, manifest_path)
+
+    def _read_record(self, row: int) -> np.ndarray:
+        """Read one record as a length-1 structured array."""
+        if not 0 <= row < self.rows:
+            raise IndexError(f"Segment row {row} out of range")
+        blob = self._read(self._records, row * RECORD_DTYPE.itemsize, RECORD_DTYPE.itemsize)
+        return np.frombuffer(blob, dtype=RECORD_DTYPE).copy()
+
+    @staticmethod
+    def _read(handle, offset: int, length: int) -> bytes:
+        """Read ``length`` bytes at ``offset``, seeing any buffered appends."""
+        handle.flush()
+        handle.seek(offset)
+        return handle.read(length)
@@ -0,0 +1,124 @@
+"""
+Time Index for Adaptive Memory
+
+Timestamp-ordered side index over memory events.
+"""
+
+import bisect
+import math
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+# Sort key of an indexed event: (epoch seconds, insertion sequence number)
+TimeKey = Tuple[float, float]
+
+
+class TimeIndex:
+    """
+    Events kept in timestamp order for range queries and prefix pruning.
+
+    Keys are ``(epoch, sequence)`` so events with equal timestamps keep
+    their insertion order and every key is unique, which lets streaming
+    readers resume after the last key they saw.
+
+    Features:
+    - O(1) amortized insert for in-order timestamps (bisect otherwise)
+    - O(log n + k) range slices
+    - Prefix pruning that only touches expired events
+    """
+
+    def __init__(self):
+        """Initialize an empty time index."""
+        self._keys: List[TimeKey] = []
+        self._events: List[Any] = []
+        self._seq = 0
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def insert(self, epoch: float, event: Any) -> None:
+        """Index ``event`` at ``epoch`` (seconds since the epoch)."""
+        key = (epoch, self._seq)
+        self._seq += 1
+        if not self._keys or key >= self._keys[-1]:
+            self._keys.append(key)
+            self._events.append(event)
+        else:
+            pos = bisect.bisect_right(self._keys, key)
+            self._keys.insert(pos, key)
+            self._events.insert(pos, event)
+
+    def range(self, start: float, end: float) -> List[Any]:
+        """Events with ``start <= epoch <= end`` in chronological order."""
+        lo = bisect.bisect_left(self._keys, (start, -math.inf))
+        hi = bisect.bisect_right(self._keys, (end, math.inf))
+        return self._events[lo:hi]
+
+    def range_chunk(
+        self, start: float, end: float, after: Optional[TimeKey], limit: int
+    ) -> Tuple[List[Any], Optional[TimeKey]]:
+        """
+        Next chunk of a range scan.
+
+        Args:
+            start: Range start (epoch seconds)
+            end: Range end (epoch seconds)
+            after: Key of the last event already returned (None to begin)
+            limit: Maximum number of events in the chunk
+
+        Returns:
+            (events, cursor) where cursor is passed as ``after`` next time
+        """
+        if after is None:
+            lo = bisect.bisect_left(self._keys, (start, -math.inf))
+        else:
+            lo = bisect.bisect_right(self._keys, after)
+        hi = min(bisect.bisect_right(self._keys, (end, math.inf)), lo + limit)
+        if lo >= hi:
+            return [], after
+        return self._events[lo:hi], self._keys[hi - 1]
+
+    def prune_prefix(self, cutoff: float, keep: Optional[Callable[[Any], bool]] = None) -> List[Any]:
+        """
+        Remove events with ``epoch <= cutoff``.
+
+        Args:
+            cutoff: Epoch seconds; events at or before it expire
+            keep: Optional predicate for expired events that must be retained
+
+        Returns:
+            Removed events
+        """
+        pos = bisect.bisect_right(self._keys, (cutoff, math.inf))
+        if pos == 0:
+            return []
+        if keep is None:
+            removed = self._events[:pos]
+            del self._keys[:pos]
+            del self._events[:pos]
+            return removed
+
+        kept_keys: List[TimeKey] = []
+        kept_events: List[Any] = []
+        removed = []
+        for key, event in zip(self._keys[:pos], self._events[:pos]):
+            if keep(event):
+                kept_keys.append(key)
+                kept_events.append(event)
+            else:
+                removed.append(event)
+        if removed:
+            self._keys[:pos] = kept_keys
+            self._events[:pos] = kept_events
+        return removed
+
+    def rebuild(self, events: Sequence[Any], epochs: Sequence[float]) -> None:
+        """Replace the index contents with ``events`` stamped at ``epochs``."""
+        order = sorted(range(len(events)), key=epochs.__getitem__)
+        self._keys = [(epochs[i], seq) for seq, i in enumerate(order)]
+        self._events = [events[i] for i in order]
+        self._seq = len(order)
+
+    def clear(self) -> None:
+        """Remove all events."""
+        self._keys = []
+        self._events = []
@@ -0,0 +1,291 @@
+"""
+Vector Index for Adaptive Memory
+
+Contiguous embedding storage and approximate nearest-neighbour search.
+"""
+
+from typing import List, Optional, Union
+
+import numpy as np
+
+# Constants for matrix growth
+DEFAULT_INITIAL_CAPACITY = 1024
+
+# Constants for the IVF (inverted file) approximate index
+DEFAULT_NPROBE = 8
+NLIST_FACTOR = 4
+DEFAULT_TRAIN_ITERATIONS = 8
+DEFAULT_TRAIN_SAMPLE_SIZE = 16384
+ASSIGN_CHUNK_SIZE = 8192
+
+
+class EmbeddingMatrix:
+    """
+    Contiguous, pre-normalized embedding matrix with parallel metadata arrays.
+
+    Rows are unit-length float32 vectors, so cosine similarity against a
+    normalized query is a single matrix-vector product. Storage grows in
+    amortized chunks (capacity doubles) to keep appends O(1).
+
+    Parallel arrays hold the fields needed for scoring without touching
+    Python objects: timestamp (epoch seconds), recurrence count and the
+    critical flag.
+    """
+
+    def __init__(self, dim: Optional[int] = None, initial_capacity: int = DEFAULT_INITIAL_CAPACITY):
+        """
+        Initialize embedding matrix.
+
+        Args:
+            dim: Embedding dimension (inferred from the first append if None)
+            initial_capacity: Number of rows to allocate up front
+        """
+        self.dim = dim
+        self.size = 0
+        self._capacity = max(1, initial_capacity)
+        self._vectors: Optional[np.ndarray] = None
+        self._timestamps = np.empty(self._capacity, dtype=np.float64)
+        self._recurrence = np.empty(self._capacity, dtype=np.int64)
+        self._critical = np.empty(self._capacity, dtype=bool)
+        if dim is not None:
+            self._vectors = np.empty((self._capacity, dim), dtype=np.float32)
+
+    @classmethod
+    def from_arrays(
+        cls,
+        vectors: np.ndarray,
+        timestamps: np.ndarray,
+        recurrence: np.ndarray,
+        critical: np.ndarray,
+    ) -> "EmbeddingMatrix":
+        """
+        Build a matrix over existing columns without copying ``vectors``.
+
+        ``vectors`` (e.g. a copy-on-write memory map) must already hold
+        unit-normalized float32 rows; it is reallocated on the next growth.
+        """
+        size = vectors.shape[0]
+        dim = vectors.shape[1] if vectors.ndim == 2 and vectors.shape[1] else None
+        if size == 0:
+            return cls(dim=dim)
+        matrix = cls()
+        matrix.dim = dim
+        matrix._capacity = size
+        matrix._vectors = vectors
+        matrix._timestamps = np.array(timestamps, dtype=np.float64)
+        matrix._recurrence = np.array(recurrence, dtype=np.int64)
+        matrix._critical = np.array(critical, dtype=bool)
+        matrix.size = size
+        return matrix
+
+    @property
+    def vectors(self) -> np.ndarray:
+        """View of the populated embedding rows."""
+        if self._vectors is None:
+            return np.empty((0, self.dim or 0), dtype=np.float32)
+        return self._vectors[: self.size]
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """View of the populated timestamp column (epoch seconds)."""
+        return self._timestamps[: self.size]
+
+    @property
+    def recurrence(self) -> np.ndarray:
+        """View of the populated recurrence-count column."""
+        return self._recurrence[: self.size]
+
+    @property
+    def critical(self) -> np.ndarray:
+        """View of the populated critical-flag column."""
+        return self._critical[: self.size]
+
+    @staticmethod
+    def normalize(vector: Union[List[float], np.ndarray]) -> np.ndarray:
+        """Return a unit-length float32 copy of ``vector`` (zeros stay zero)."""
+        arr = np.asarray(vector, dtype=np.float32).ravel()
+        norm = float(np.linalg.norm(arr))
+        if norm == 0.0:
+            return np.zeros_like(arr)
+        return arr / norm
+
+    def check_dim(self, vector: np.ndarray) -> None:
+        """Raise ValueError if ``vector`` does not match the matrix dimension."""
+        if self.dim is not None and vector.shape[0] != self.dim:
+            raise ValueError("Embeddings must have the same length for cosine similarity")
+
+    def append(self, unit_vector: np.ndarray, timestamp: float, recurrence: int, critical: bool) -> int:
+        """
+        Append a normalized row.
+
+        Args:
+            unit_vector: Normalized embedding (see ``normalize``)
+            timestamp: Event timestamp in epoch seconds
+            recurrence: Initial recurrence count
+            critical: Whether the event is critical
+
+        Returns:
+            Row index of the appended vector
+        """
+        if self.dim is None:
+            self.dim = unit_vector.shape[0]
+        self.check_dim(unit_vector)
+        if self._vectors is None:
+            self._vectors = np.empty((self._capacity, self.dim), dtype=np.float32)
+        if self.size == self._capacity:
+            self._grow(self._capacity * 2)
+
+        row = self.size
+        self._vectors[row] = unit_vector
+        self._timestamps[row] = timestamp
+        self._recurrence[row] = recurrence
+        self._critical[row] = critical
+        self.size += 1
+        return row
+
+    def similarities(self, unit_query: np.ndarray, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Cosine similarities of a normalized query against stored rows.
+
+        Args:
+            unit_query: Normalized query vector
+            rows: Optional subset of row indices to score
+
+        Returns:
+            Similarity array aligned with ``rows`` (or all rows)
+        """
+        self.check_dim(unit_query)
+        if rows is None:
+            return self.vectors @ unit_query
+        return self._vectors[rows] @ unit_query
+
+    def compact(self, keep_mask: np.ndarray) -> None:
+        """Drop rows where ``keep_mask`` is False, preserving order."""
+        keep = np.flatnonzero(keep_mask)
+        new_size = keep.shape[0]
+        if self._vectors is not None:
+            self._vectors[:new_size] = self._vectors[keep]
+        self._timestamps[:new_size] = self._timestamps[keep]
+        self._recurrence[:new_size] = self._recurrence[keep]
+        self._critical[:new_size] = self._critical[keep]
+        self.size = new_size
+
+    def clear(self) -> None:
+        """Remove all rows (keeps the allocated capacity and dimension)."""
+        self.size = 0
+
+    def _grow(self, new_capacity: int) -> None:
+        """Reallocate all columns with ``new_capacity`` rows."""
+        if self._vectors is not None:
+            vectors = np.empty((new_capacity, self.dim), dtype=np.float32)
+            vectors[: self.size] = self._vectors[: self.size]
+            self._vectors = vectors
+        for name in ("_timestamps", "_recurrence", "_critical"):
+            old = getattr(self, name)
+            new = np.empty(new_capacity, dtype=old.dtype)
+            new[: self.size] = old[: self.size]
+            setattr(self, name, new)
+        self._capacity = new_capacity
+
+
+class IVFIndex:
+    """
+    Inverted-file approximate nearest-neighbour index (pure NumPy).
+
+    A spherical k-means coarse quantizer partitions unit vectors into
+    ``nlist`` cells. Queries only score rows in the ``nprobe`` cells whose
+    centroids are closest, trading exactness for sub-linear search.
+    """
+
+    def __init__(self, nprobe: int = DEFAULT_NPROBE, train_iterations: int = DEFAULT_TRAIN_ITERATIONS, seed: int = 0):
+        """
+        Initialize IVF index.
+
+        Args:
+            nprobe: Number of cells scanned per query
+            train_iterations: k-means iterations used when training
+            seed: Random seed for centroid initialisation
+        """
+        if nprobe <= 0:
+            raise ValueError("nprobe must be positive")
+        self.nprobe = nprobe
+        self.train_iterations = train_iterations
+        self._rng = np.random.default_rng(seed)
+        self.centroids: Optional[np.ndarray] = None
+        self._lists: List[List[int]] = []
+        self.trained_size = 0
+
+    @property
+    def is_trained(self) -> bool:
+        """Whether centroids have been fitted."""
+        return self.centroids is not None
+
+    def train(self, vectors: np.ndarray) -> None:
+        """
+        Fit centroids on ``vectors`` and rebuild all inverted lists.
+
+        Args:
+            vectors: Normalized row matrix; row ids are positions in it
+        """
+        n = vectors.shape[0]
+        if n == 0:
+            self.reset()
+            return
+        nlist = max(1, int(NLIST_FACTOR * np.sqrt(n)))
+
+        sample_size = min(n, DEFAULT_TRAIN_SAMPLE_SIZE)
+        sample = vectors[self._rng.choice(n, size=sample_size, replace=False)]
+        centroids = sample[self._rng.choice(sample_size, size=min(nlist, sample_size), replace=False)].copy()
+
+        for _ in range(self.train_iterations):
+            assignment = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignment, sample)
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            # Empty cells keep their previous centroid
+            populated = norms[:, 0] > 0
+            centroids[populated] = sums[populated] / norms[populated]
+
+        self.centroids = centroids
+        self._lists = [[] for _ in range(centroids.shape[0])]
+        for start in range(0, n, ASSIGN_CHUNK_SIZE):
+            self.add_batch(start, vectors[start : start + ASSIGN_CHUNK_SIZE])
+        self.trained_size = n
+
+    def add(self, row: int, unit_vector: np.ndarray) -> None:
+        """Assign a new row to its nearest cell."""
+        if self.centroids is None:
+            return
+        cell = int(np.argmax(self.centroids @ unit_vector))
+        self._lists[cell].append(row)
+
+    def add_batch(self, first_row: int, vectors: np.ndarray) -> None:
+        """Assign consecutive rows starting at ``first_row`` to their nearest cells."""
+        if self.centroids is None or vectors.shape[0] == 0:
+            return
+        cells = np.argmax(vectors @ self.centroids.T, axis=1)
+        for offset, cell in enumerate(cells.tolist()):
+            self._lists[cell].append(first_row + offset)
+
+    def candidates(self, unit_query: np.ndarray) -> np.ndarray:
+        """
+        Row ids stored in the cells closest to ``unit_query``.
+
+        Returns:
+            Sorted array of candidate row indices
+        """
+        if self.centroids is None:
+            return np.empty(0, dtype=np.int64)
+        cell_scores = self.centroids @ unit_query
+        nprobe = min(self.nprobe, cell_scores.shape[0])
+        probes = np.argpartition(-cell_scores, nprobe - 1)[:nprobe]
+        rows = [np.asarray(self._lists[p], dtype=np.int64) for p in probes if self._lists[p]]
+        if not rows:
+            return np.empty(0, dtype=np.int64)
+        return np.sort(np.concatenate(rows))
+
+    def reset(self) -> None:
+        """Discard centroids and inverted lists."""
+        self.centroids = None
+        self._lists = []
+        self.trained_size = 0
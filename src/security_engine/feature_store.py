@@ -0,0 +1,277 @@
+"""
+Rolling Feature Store for Predictive Maintenance
+
+Columnar, append-only history of time-series points with rolling
+statistics computed incrementally as points arrive.
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+# Raw metric columns, in feature order
+METRIC_COLUMNS = (
+    "cpu_usage",
+    "memory_usage",
+    "network_latency",
+    "disk_io",
+    "error_rate",
+    "response_time",
+    "active_connections",
+)
+
+# Metrics that get rolling statistics
+ROLLING_METRICS = METRIC_COLUMNS[:5]
+ROLLING_WINDOWS = (3, 6)
+
+ROLLING_COLUMNS = tuple(
+    f"{metric}_rolling_{stat}_{window}"
+    for metric in ROLLING_METRICS
+    for window in ROLLING_WINDOWS
+    for stat in ("mean", "std")
+)
+
+# Full row layout: raw metrics, failure flag, rolling statistics
+TABLE_COLUMNS = METRIC_COLUMNS + ("failure_occurred",) + ROLLING_COLUMNS
+
+DEFAULT_INITIAL_CAPACITY = 1024
+DEFAULT_RETENTION = timedelta(days=30)
+
+
+def split_target(rows: np.ndarray, target: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Split ``TABLE_COLUMNS`` rows into (features, targets) for ``target``.
+
+    Features are every column except ``target``, in table order.
+    """
+    target_index = TABLE_COLUMNS.index(target)
+    feature_index = [i for i in range(len(TABLE_COLUMNS)) if i != target_index]
+    return rows[:, feature_index], rows[:, target_index].copy()
+
+
+class RollingWindow:
+    """
+    Ring buffer over the last ``size`` rows of a fixed-width vector stream.
+
+    Mean and sample standard deviation (ddof=1, as pandas ``rolling().std()``)
+    are computed over the buffered rows in O(size * width).
+    """
+
+    def __init__(self, size: int, width: int):
+        """
+        Initialize rolling window.
+
+        Args:
+            size: Number of rows in the window
+            width: Length of each row vector
+        """
+        self.size = size
+        self._ring = np.zeros((size, width))
+        self._count = 0
+        self._pos = 0
+
+    @property
+    def full(self) -> bool:
+        """Whether the window holds ``size`` rows."""
+        return self._count >= self.size
+
+    def push(self, row: np.ndarray) -> None:
+        """Add a row, evicting the oldest one once the window is full."""
+        self._ring[self._pos] = row
+        self._pos = (self._pos + 1) % self.size
+        self._count = min(self._count + 1, self.size)
+
+    def stats(self) -> Tuple[np.ndarray, np.ndarray]:
+        """(mean, std) of the buffered rows; NaN until the window is full."""
+        if not self.full:
+            nan = np.full(self._ring.shape[1], np.nan)
+            return nan, nan
+        return self._ring.mean(axis=0), self._ring.std(axis=0, ddof=1)
+
+
+class RollingFeatureStore:
+    """
+    Columnar history of time-series points with incremental rolling features.
+
+    Each appended point becomes one row of a preallocated float64 table laid
+    out as ``TABLE_COLUMNS``. Rolling means and standard deviations over the
+    3- and 6-point windows are computed from ring buffers at append time, so
+    training reads feature matrices straight out of the table.
+
+    Rows are kept in arrival order; points older than the retention period
+    are expired from the front.
+
+    Features:
+    - O(1) amortized append and expiry
+    - Training slices without DataFrame construction
+    - Prediction features from the tail of the history
+    """
+
+    def __init__(
+        self,
+        retention: Optional[timedelta] = DEFAULT_RETENTION,
+        initial_capacity: int = DEFAULT_INITIAL_CAPACITY,
+    ):
+        """
+        Initialize feature store.
+
+        Args:
+            retention: Maximum age of stored points (None keeps everything)
+            initial_capacity: Number of rows to allocate up front
+        """
+        self.retention = retention
+        self._capacity = max(1, initial_capacity)
+        self._table = np.empty((self._capacity, len(TABLE_COLUMNS)))
+        self._timestamps = np.empty(self._capacity)
+        # Live rows are [_start, _end)
+        self._start = 0
+        self._end = 0
+        self._windows = [RollingWindow(w, len(ROLLING_METRICS)) for w in ROLLING_WINDOWS]
+        self._ready_from = max(ROLLING_WINDOWS) - 1  # absolute index of first row with full windows
+        self._appended = 0
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    @property
+    def table(self) -> np.ndarray:
+        """View of the live rows (columns as ``TABLE_COLUMNS``)."""
+        return self._table[self._start:self._end]
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """View of the live rows' timestamps (epoch seconds)."""
+        return self._timestamps[self._start:self._end]
+
+    def append(self, data: Any) -> None:
+        """
+        Append one time-series point.
+
+        Args:
+            data: Object with the ``METRIC_COLUMNS`` attributes, ``timestamp``
+                and ``failure_occurred`` (e.g. TimeSeriesData)
+        """
+        if self._end == self._capacity:
+            self._make_room()
+
+        row = self._table[self._end]
+        for i, name in enumerate(METRIC_COLUMNS):
+            row[i] = getattr(data, name)
+        row[len(METRIC_COLUMNS)] = float(data.failure_occurred)
+
+        offset = len(METRIC_COLUMNS) + 1
+        metrics = row[: len(ROLLING_METRICS)]
+        stats = []
+        for window in self._windows:
+            window.push(metrics)
+            stats.append(window.stats())
+        # Interleave per metric: mean_3, std_3, mean_6, std_6 (ROLLING_COLUMNS order)
+        rolling = np.stack([s for pair in stats for s in pair], axis=1)
+        row[offset:] = rolling.ravel()
+
+        self._timestamps[self._end] = data.timestamp.timestamp()
+        self._end += 1
+        self._appended += 1
+        self._expire()
+
+    def extend(self, points: Iterable[Any]) -> None:
+        """Append several points in order."""
+        for data in points:
+            self.append(data)
+
+    def training_rows(self) -> np.ndarray:
+        """View of the live rows whose rolling windows are full."""
+        # Table positions lag absolute stream indices by the number of reclaimed rows
+        first_ready = self._ready_from - (self._appended - self._end)
+        return self._table[max(self._start, first_ready):self._end]
+
+    def training_set(self, target: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Feature matrix and targets for predicting ``target``.
+
+        Uses live rows whose rolling windows are full. Features are every
+        table column except ``target``, in ``TABLE_COLUMNS`` order.
+
+        Returns:
+            (features, targets)
+        """
+        return split_target(self.training_rows(), target)
+
+    def current_features(self, data: Any, history: int) -> np.ndarray:
+        """
+        Full feature row for a point that is not (necessarily) stored.
+
+        Rolling statistics cover the last ``history`` stored rows followed
+        by ``data``, with windows shortened to the available rows. With fewer
+        than 3 stored rows the rolling features are zero.
+
+        Args:
+            data: Point to featurize
+            history: Number of trailing stored rows to consider
+
+        Returns:
+            Row in ``TABLE_COLUMNS`` layout with ``failure_occurred`` = 0
+        """
+        row = np.zeros(len(TABLE_COLUMNS))
+        for i, name in enumerate(METRIC_COLUMNS):
+            row[i] = getattr(data, name)
+
+        recent = self.table[max(0, len(self) - history):, : len(ROLLING_METRICS)]
+        if recent.shape[0] < 3:
+            return row
+
+        window_rows = np.vstack([recent, row[np.newaxis, : len(ROLLING_METRICS)]])
+        rolling = []
+        for metric in range(len(ROLLING_METRICS)):
+            for window in ROLLING_WINDOWS:
+                values = window_rows[-min(window, window_rows.shape[0]):, metric]
+                rolling.extend([values.mean(), values.std(ddof=1)])
+        row[len(METRIC_COLUMNS) + 1:] = np.nan_to_num(rolling)
+        return row
+
+    def to_records(self, factory: Any) -> List[Any]:
+        """Rebuild live rows as ``factory(timestamp=..., <metrics>, failure_occurred=...)`` objects."""
+        records = []
+        for ts, row in zip(self.timestamps.tolist(), self.table.tolist()):
+            values = dict(zip(METRIC_COLUMNS, row))
+            values["active_connections"] = int(values["active_connections"])
+            records.append(
+                factory(
+                    timestamp=datetime.fromtimestamp(ts),
+                    failure_occurred=bool(row[len(METRIC_COLUMNS)]),
+                    **values,
+                )
+            )
+        return records
+
+    def clear(self) -> None:
+        """Remove all rows and reset the rolling windows."""
+        self._start = self._end = 0
+        self._appended = 0
+        self._windows = [RollingWindow(w, len(ROLLING_METRICS)) for w in ROLLING_WINDOWS]
+
+    # Private helper methods
+
+    def _expire(self) -> None:
+        """Drop rows older than the retention period from the front."""
+        if self.retention is None:
+            return
+        cutoff = datetime.now().timestamp() - self.retention.total_seconds()
+        while self._start < self._end and self._timestamps[self._start] <= cutoff:
+            self._start += 1
+
+    def _make_room(self) -> None:
+        """Reclaim expired rows, or double the capacity when mostly live."""
+        live = self._end - self._start
+        if self._start and live <= self._capacity // 2:
+            self._table[:live] = self._table[self._start:self._end]
+            self._timestamps[:live] = self._timestamps[self._start:self._end]
+        else:
+            self._capacity *= 2
+            table = np.empty((self._capacity, len(TABLE_COLUMNS)))
+            timestamps = np.empty(self._capacity)
+            table[:live] = self._table[self._start:self._end]
+            timestamps[:live] = self._timestamps[self._start:self._end]
+            self._table, self._timestamps = table, timestamps
+        self._start, self._end = 0, live
@@ -0,0 +1,162 @@
+"""
+Model Registry for Predictive Maintenance
+
+Versioned, atomically published model snapshots.
+
+Layout of a registry directory:
+- versions/v<NNNNNN>.pkl: one pickled ModelSnapshot per trained version
+- CURRENT: number of the version currently being served
+
+A version file is fully written before CURRENT is swapped to it, and the
+in-memory pointer is swapped last, so readers always see a complete
+snapshot: either the previous one or the new one.
+"""
+
+import logging
+import os
+import pickle
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+VERSIONS_DIR = "versions"
+CURRENT_FILE = "CURRENT"
+DEFAULT_KEEP_VERSIONS = 3
+
+
+@dataclass(frozen=True)
+class ModelSnapshot:
+    """
+    Immutable set of trained models served together.
+
+    ``models`` and ``scalers`` are keyed like the engine's failure types;
+    snapshots are never mutated after publication, so readers can hold one
+    for the duration of a prediction without locking.
+    """
+    version: int
+    models: Dict[Any, Dict[Any, Any]] = field(default_factory=dict)
+    scalers: Dict[Any, Any] = field(default_factory=dict)
+    metrics: Dict[str, Any] = field(default_factory=dict)
+    trained_at: datetime = field(default_factory=datetime.now)
+
+
+class ModelRegistry:
+    """
+    On-disk registry of model versions with an in-memory current pointer.
+
+    Features:
+    - O(1) reads of the served snapshot (``current``)
+    - Atomic publish: write-then-rename for both the version and the pointer
+    - Bounded history: only the newest ``keep_versions`` files are kept
+    """
+
+    def __init__(self, path: str, keep_versions: int = DEFAULT_KEEP_VERSIONS):
+        """
+        Initialize model registry.
+
+        Args:
+            path: Registry directory
+            keep_versions: Number of version files to retain on disk
+        """
+        if keep_versions < 1:
+            raise ValueError("keep_versions must be at least 1")
+        self.path = path
+        self.keep_versions = keep_versions
+        self._current: Optional[ModelSnapshot] = None
+        self._publish_lock = threading.Lock()
+        os.makedirs(os.path.join(self.path, VERSIONS_DIR), exist_ok=True)
+
+    @property
+    def current(self) -> Optional[ModelSnapshot]:
+        """Snapshot currently being served (None before the first publish/load)."""
+        return self._current
+
+    @property
+    def current_version(self) -> int:
+        """Version number of the served snapshot (0 if none)."""
+        snapshot = self._current
+        return snapshot.version if snapshot else 0
+
+    def versions(self) -> List[int]:
+        """Version numbers present on disk, oldest first."""
+        versions = []
+        for name in os.listdir(os.path.join(self.path, VERSIONS_DIR)):
+            if name.startswith("v") and name.endswith(".pkl"):
+                try:
+                    versions.append(int(name[1:-4]))
+                except ValueError:
+                    continue
+        return sorted(versions)
+
+    def publish(
+        self,
+        models: Dict[Any, Dict[Any, Any]],
+        scalers: Dict[Any, Any],
+        metrics: Optional[Dict[str, Any]] = None,
+    ) -> ModelSnapshot:
+        """
+        Persist a new version and make it the served snapshot.
+
+        Returns:
+            The published snapshot
+        """
+        with self._publish_lock:
+            on_disk = self.versions()
+            version = max([self.current_version] + on_disk) + 1
+            snapshot = ModelSnapshot(
+                version=version, models=models, scalers=scalers, metrics=dict(metrics or {})
+            )
+            self._atomic_write(self._version_path(version), pickle.dumps(snapshot, protocol=pickle.HIGHEST_PROTOCOL))
+            self._atomic_write(os.path.join(self.path, CURRENT_FILE), str(version).encode("ascii"))
+            self._current = snapshot
+            self._prune(on_disk + [version])
+
+        logger.info(f"Published predictive maintenance models v{version}")
+        return snapshot
+
+    def load_current(self) -> Optional[ModelSnapshot]:
+        """
+        Load the version named by CURRENT from disk and serve it.
+
+        Returns:
+            The loaded snapshot, or None if the registry is empty or unreadable
+        """
+        try:
+            with open(os.path.join(self.path, CURRENT_FILE), "r", encoding="ascii") as f:
+                version = int(f.read().strip())
+            with open(self._version_path(version), "rb") as f:
+                snapshot = pickle.load(f)  # nosec B301 - trusted internal model files
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.error(f"Failed to load model registry: {e}")
+            return None
+
+        self._current = snapshot
+        return snapshot
+
+    # Private helper methods
+
+    def _version_path(self, version: int) -> str:
+        return os.path.join(self.path, VERSIONS_DIR, f"v{version:06d}.pkl")
+
+    @staticmethod
+    def _atomic_write(path: str, payload: bytes) -> None:
+        """Write ``payload`` to a temporary file and rename it over ``path``."""
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    def _prune(self, versions: List[int]) -> None:
+        """Delete all but the newest ``keep_versions`` version files."""
+        for version in sorted(versions)[: -self.keep_versions]:
+            try:
+                os.remove(self._version_path(version))
+            except OSError:
+                pass
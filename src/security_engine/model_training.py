@@ -0,0 +1,83 @@
+"""
+Model Training for Predictive Maintenance
+
+Pure training functions run in a worker process, away from the event loop.
+
+Everything here takes and returns picklable values only (NumPy arrays,
+strings, fitted scikit-learn estimators) so it can be submitted to a
+``ProcessPoolExecutor``.
+"""
+
+import time
+from typing import Any, Dict, Sequence
+
+import numpy as np
+from sklearn.ensemble import IsolationForest, RandomForestRegressor
+from sklearn.metrics import r2_score
+from sklearn.model_selection import train_test_split
+from sklearn.preprocessing import StandardScaler
+
+from security_engine.feature_store import split_target
+
+# Minimum ready rows needed to fit models for a target
+MIN_TRAINING_ROWS = 50
+
+
+def fit_target_models(features: np.ndarray, targets: np.ndarray) -> Dict[str, Any]:
+    """
+    Fit the scaler, Random Forest regressor and Isolation Forest for one target.
+
+    Returns:
+        Dict with ``scaler``, ``random_forest``, ``isolation_forest``,
+        ``r2`` and per-model ``durations`` (seconds)
+    """
+    X_train, X_test, y_train, y_test = train_test_split(
+        features, targets, test_size=0.2, random_state=42
+    )
+
+    scaler = StandardScaler()
+    X_train_scaled = scaler.fit_transform(X_train)
+    X_test_scaled = scaler.transform(X_test)
+
+    started = time.perf_counter()
+    rf_model = RandomForestRegressor(n_estimators=100, random_state=42)
+    rf_model.fit(X_train_scaled, y_train)
+    rf_r2 = r2_score(y_test, rf_model.predict(X_test_scaled))
+    rf_duration = time.perf_counter() - started
+
+    started = time.perf_counter()
+    if_model = IsolationForest(contamination=0.1, random_state=42)
+    if_model.fit(X_train_scaled)
+    if_duration = time.perf_counter() - started
+
+    return {
+        "scaler": scaler,
+        "random_forest": rf_model,
+        "isolation_forest": if_model,
+        "r2": float(rf_r2),
+        "durations": {"random_forest": rf_duration, "isolation_forest": if_duration},
+    }
+
+
+def train_target_models(rows: np.ndarray, targets: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Fit models for each distinct target column of a training table.
+
+    Failure types that predict the same metric share one fitted model set,
+    so each target is trained once.
+
+    Args:
+        rows: Ready feature-store rows (``TABLE_COLUMNS`` layout)
+        targets: Target column names
+
+    Returns:
+        Mapping of target column to ``fit_target_models`` output; targets
+        with fewer than ``MIN_TRAINING_ROWS`` rows are omitted
+    """
+    fitted = {}
+    for target in dict.fromkeys(targets):
+        features, values = split_target(rows, target)
+        if len(features) < MIN_TRAINING_ROWS:
+            continue
+        fitted[target] = fit_target_models(features, values)
+    return fitted
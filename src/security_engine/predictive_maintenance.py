@@ -6,22 +6,18 @@ and trigger preventive recovery actions before issues escalate.
 """
 
 import numpy as np
-import pandas as pd
 from typing import Dict, List, Tuple, Optional, Any
 from datetime import datetime, timedelta
 import logging
 from dataclasses import dataclass
 from enum import Enum
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import pickle
 import os
 
 # ML imports
-from sklearn.ensemble import RandomForestRegressor, IsolationForest
-from sklearn.preprocessing import StandardScaler
-from sklearn.model_selection import train_test_split
-from sklearn.metrics import mean_squared_error, r2_score
 import torch
 import torch.nn as nn
 import torch.optim as optim
@@ -29,10 +25,16 @@ from torch.utils.data import Dataset, DataLoader
 
 # Project imports
 from memory_engine.memory_store import AdaptiveMemoryStore
+from security_engine.feature_store import RollingFeatureStore, TABLE_COLUMNS
+from security_engine.model_registry import ModelRegistry, ModelSnapshot
+from security_engine.model_training import train_target_models
+from security_engine.training_sink import MemoryMirrorPolicy, TrainingDataSink
 from core.metrics import (
     PREDICTIVE_MAINTENANCE_PREDICTIONS_TOTAL,
     PREDICTIVE_MAINTENANCE_ACCURACY,
     PREDICTIVE_MAINTENANCE_PREVENTIVE_ACTIONS_TOTAL,
+    PREDICTIVE_MAINTENANCE_MODEL_TRAINING_DURATION,
+    PREDICTIVE_MAINTENANCE_DATA_POINTS_TOTAL,
 )
 from core.error_handling import PredictiveMaintenanceError
 from core.timeout_handler import async_timeout, get_timeout_config
@@ -57,6 +59,31 @@ class FailureType(Enum):
     SERVICE_CRASH = "service_crash"
     RESOURCE_EXHAUSTION = "resource_exhaustion"
 
+# Metric each failure type's regressor predicts
+TARGET_COLUMNS = {
+    FailureType.CPU_SPIKE: "cpu_usage",
+    FailureType.MEMORY_LEAK: "memory_usage",
+    FailureType.NETWORK_LATENCY: "network_latency",
+    FailureType.DISK_IO_BURST: "disk_io",
+    FailureType.SERVICE_CRASH: "error_rate",
+    FailureType.RESOURCE_EXHAUSTION: "error_rate",
+}
+
+# Predicted metric value above which each failure type becomes likely
+FAILURE_THRESHOLDS = {
+    FailureType.CPU_SPIKE: 75.0,  # CPU usage > 75%
+    FailureType.MEMORY_LEAK: 80.0,  # Memory usage > 80%
+    FailureType.NETWORK_LATENCY: 100.0,  # Latency > 100ms
+    FailureType.DISK_IO_BURST: 200.0,  # Disk I/O > 200 ops/sec
+    FailureType.SERVICE_CRASH: 1.0,  # Error rate > 1%
+    FailureType.RESOURCE_EXHAUSTION: 1.0  # Error rate > 1%
+}
+
+# Constants for background training
+MIN_TRAINING_POINTS = 100
+DEFAULT_TRAINING_INTERVAL_SECONDS = 3600.0
+DEFAULT_RETRAIN_AFTER_POINTS = 500
+
 @dataclass
 class PredictionResult:
     """Result of a predictive maintenance analysis."""
@@ -127,23 +154,53 @@ class PredictiveMaintenanceEngine:
     - Time-series analysis for failure prediction
     - Preventive action recommendations
     - Integration with existing anomaly detection
-    - Model training and evaluation
+    - Background model training in a worker process, published through a
+      versioned model registry; predictions keep using the previous
+      version until the new one is swapped in
     """
 
-    def __init__(self, memory_store: AdaptiveMemoryStore):
+    def __init__(
+        self,
+        memory_store: AdaptiveMemoryStore,
+        training_interval: float = DEFAULT_TRAINING_INTERVAL_SECONDS,
+        retrain_after_points: int = DEFAULT_RETRAIN_AFTER_POINTS,
+        mirror_policy: Optional[MemoryMirrorPolicy] = None,
+    ):
+        """
+        Initialize predictive maintenance engine.
+
+        Args:
+            memory_store: Adaptive memory that selected training points are mirrored to
+            training_interval: Seconds between scheduled retraining checks
+            retrain_after_points: New points that trigger retraining early
+            mirror_policy: Which training points to mirror into adaptive
+                memory (default: none)
+        """
         self.memory_store = memory_store
-        self.models: Dict[FailureType, Dict[PredictionModel, Any]] = {}
-        self.scalers: Dict[FailureType, StandardScaler] = {}
         self.model_dir = "security_engine/models"
-        self.training_data: List[TimeSeriesData] = []
+        self.training_data_dir = "security_engine/training_data"
         self.prediction_history: List[PredictionResult] = []
-        
-        # Sliding window for rolling statistics (last 10 data points)
-        self.recent_data: List[TimeSeriesData] = []
+
+        # Training points are persisted to their own sink, not the anomaly memory
+        self.training_sink = TrainingDataSink(os.path.join(self.training_data_dir, "telemetry.bin"))
+        self.mirror_policy = mirror_policy or MemoryMirrorPolicy()
+        self._points_seen = 0
+
+        # Columnar training history with incremental rolling features (last 30 days)
+        self.feature_store = RollingFeatureStore(retention=timedelta(days=30))
+        # Trailing points used for rolling statistics at prediction time
         self.max_window_size = 10
 
-        # Create model directory if it doesn't exist
-        os.makedirs(self.model_dir, exist_ok=True)
+        # Versioned models; the served snapshot is swapped atomically after training
+        self.registry = ModelRegistry(self.model_dir)
+
+        # Training triggers
+        self.training_interval = training_interval
+        self.retrain_after_points = retrain_after_points
+        self._points_since_training = 0
+        self._training_lock = asyncio.Lock()
+        self._training_task: Optional[asyncio.Task] = None
+        self._scheduler_task: Optional[asyncio.Task] = None
 
         # Initialize health monitoring
         self.health_monitor = get_health_monitor()
@@ -152,23 +209,37 @@ class PredictiveMaintenanceEngine:
         # Initialize resource monitor
         self.resource_monitor = get_resource_monitor()
 
-        # Thread pool for CPU-intensive ML operations
+        # Thread pool for predictions; model fitting runs in a process pool
         self.executor = ThreadPoolExecutor(max_workers=2)
+        self._training_executor: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def models(self) -> Dict[FailureType, Dict[PredictionModel, Any]]:
+        """Models of the served registry version."""
+        snapshot = self.registry.current
+        return snapshot.models if snapshot else {}
+
+    @property
+    def scalers(self) -> Dict[FailureType, Any]:
+        """Feature scalers of the served registry version."""
+        snapshot = self.registry.current
+        return snapshot.scalers if snapshot else {}
+
+    @property
+    def training_in_progress(self) -> bool:
+        """Whether a background training run is active."""
+        return self._training_task is not None and not self._training_task.done()
 
     async def initialize(self) -> bool:
         """Initialize the predictive maintenance engine."""
         try:
-            # Load existing models
+            # Load the current model version (if any)
             await self._load_models()
 
-            # Initialize models for each failure type
-            for failure_type in FailureType:
-                self.models[failure_type] = {}
-                self.scalers[failure_type] = StandardScaler()
-
             self.health_monitor.mark_healthy("predictive_maintenance", {
                 "models_loaded": len(self.models),
-                "training_data_points": len(self.training_data)
+                "model_version": self.registry.current_version,
+                "training_data_points": len(self.feature_store)
             })
 
             logger.info("Predictive maintenance engine initialized successfully")
@@ -179,95 +250,153 @@ class PredictiveMaintenanceEngine:
             self.health_monitor.mark_failed("predictive_maintenance", str(e))
             return False
 
+    @property
+    def training_data(self) -> List[TimeSeriesData]:
+        """Retained training points, rebuilt from the feature store (O(n))."""
+        return self.feature_store.to_records(TimeSeriesData)
+
     async def add_training_data(self, data: TimeSeriesData) -> None:
         """Add new time-series data for training."""
-        self.training_data.append(data)
+        # O(1): appends a row and expires points older than 30 days
+        self.feature_store.append(data)
+        self._note_new_points(1)
+
+        # Store in memory for persistence
+        await self._store_training_data(data)
 
-        # Keep only recent data (last 30 days)
-        cutoff = datetime.now() - timedelta(days=30)
-        self.training_data = [d for d in self.training_data if d.timestamp > cutoff]
+    async def add_training_data_batch(self, data_points: List[TimeSeriesData]) -> None:
+        """Add several time-series points for training in one pass."""
+        if not data_points:
+            return
 
-        # Maintain sliding window for rolling statistics
-        self.recent_data.append(data)
-        if len(self.recent_data) > self.max_window_size:
-            self.recent_data.pop(0)
+        self.feature_store.extend(data_points)
+        self._note_new_points(len(data_points))
 
         # Store in memory for persistence
-        await self._store_training_data(data)
+        await self._store_training_data_batch(data_points)
+
+    def schedule_training(self) -> asyncio.Task:
+        """
+        Start a background training run unless one is already active.
+
+        Returns:
+            The active training task
+        """
+        if not self.training_in_progress:
+            self._training_task = asyncio.create_task(self.train_models())
+        return self._training_task
+
+    def start_training_scheduler(self) -> None:
+        """Retrain every ``training_interval`` seconds while new data arrives."""
+        if self._scheduler_task is None or self._scheduler_task.done():
+            self._scheduler_task = asyncio.create_task(self._training_scheduler_loop())
+
+    async def shutdown(self) -> None:
+        """Stop scheduled training and release the worker pools."""
+        for task in (self._scheduler_task, self._training_task):
+            if task is not None and not task.done():
+                task.cancel()
+        self._scheduler_task = None
+        self._training_task = None
+
+        if self._training_executor is not None:
+            self._training_executor.shutdown(wait=False, cancel_futures=True)
+            self._training_executor = None
+        self.executor.shutdown(wait=False)
+        self.training_sink.close()
 
     async def train_models(self) -> Dict[str, float]:
         """
         Train all predictive models using available data.
 
+        Fitting runs in a worker process; the new models are published to
+        the registry and served once complete.
+
         Returns:
             Dictionary of model performance metrics
         """
-        if len(self.training_data) < 100:  # Minimum data requirement
+        if len(self.feature_store) < MIN_TRAINING_POINTS:  # Minimum data requirement
             logger.warning("Insufficient training data for model training")
             return {"error": "insufficient_data"}
 
         performance_metrics = {}
 
-        try:
-            # Prepare data
-            df = self._prepare_training_dataframe()
-
-            for failure_type in FailureType:
-                logger.info(f"Training models for {failure_type.value}")
-
-                # Prepare features and targets
-                features, targets = self._prepare_features_and_targets(df, failure_type)
-
-                if len(features) < 50:
-                    continue
-
-                # Train different models
-                model_metrics = await self._train_models_for_failure_type(
-                    failure_type, features, targets
-                )
-
-                performance_metrics[failure_type.value] = model_metrics
-
-            # Save trained models
-            await self._save_models()
-
-            self.health_monitor.mark_healthy("predictive_maintenance", {
-                "last_training": datetime.now().isoformat(),
-                "performance_metrics": performance_metrics
-            })
-
-            logger.info("Model training completed successfully")
-            return performance_metrics
+        async with self._training_lock:
+            try:
+                # Snapshot the ready rows so appends can continue during training
+                rows = self.feature_store.training_rows().copy()
+                self._points_since_training = 0
+                PREDICTIVE_MAINTENANCE_DATA_POINTS_TOTAL.set(len(rows))
+
+                fitted = await self._run_training(rows, [TARGET_COLUMNS[ft] for ft in FailureType])
+
+                models: Dict[FailureType, Dict[PredictionModel, Any]] = {}
+                scalers: Dict[FailureType, Any] = {}
+                for failure_type in FailureType:
+                    result = fitted.get(TARGET_COLUMNS[failure_type])
+                    if result is None:
+                        continue
+
+                    models[failure_type] = {
+                        PredictionModel.RANDOM_FOREST: result["random_forest"],
+                        PredictionModel.ISOLATION_FOREST: result["isolation_forest"],
+                    }
+                    scalers[failure_type] = result["scaler"]
+                    performance_metrics[failure_type.value] = {"random_forest": result["r2"]}
+
+                    PREDICTIVE_MAINTENANCE_ACCURACY.labels(
+                        failure_type=failure_type.value, model_type=PredictionModel.RANDOM_FOREST.value
+                    ).set(result["r2"])
+                    for model_type, duration in result["durations"].items():
+                        PREDICTIVE_MAINTENANCE_MODEL_TRAINING_DURATION.labels(
+                            failure_type=failure_type.value, model_type=model_type
+                        ).observe(duration)
+                    logger.info(f"Trained models for {failure_type.value}: RF R² = {result['r2']:.3f}")
+
+                # Publish the new version; predictions switch over atomically
+                if models:
+                    self.registry.publish(models, scalers, performance_metrics)
+
+                self.health_monitor.mark_healthy("predictive_maintenance", {
+                    "last_training": datetime.now().isoformat(),
+                    "model_version": self.registry.current_version,
+                    "performance_metrics": performance_metrics
+                })
+
+                logger.info("Model training completed successfully")
+                return performance_metrics
 
-        except Exception as e:
-            logger.error(f"Model training failed: {e}")
-            self.health_monitor.mark_failed("predictive_maintenance", str(e))
-            return {"error": str(e)}
+            except Exception as e:
+                logger.error(f"Model training failed: {e}")
+                self.health_monitor.mark_failed("predictive_maintenance", str(e))
+                return {"error": str(e)}
 
     @async_timeout(seconds=15.0, operation_name="predictive_failure_prediction")
     async def predict_failures(self, current_data: TimeSeriesData) -> List[PredictionResult]:
         """
         Predict potential failures based on current system state.
 
+        All failure types are scored in one call against a single registry
+        snapshot, so a concurrent model swap never mixes versions.
+
         Returns:
             List of prediction results for potential failures
         """
-        predictions = []
+        snapshot = self.registry.current
+        if snapshot is None or not snapshot.models:
+            return []
 
         try:
-            for failure_type in FailureType:
-                if failure_type not in self.models or not self.models[failure_type]:
-                    continue
+            # Features are built on the loop (the feature store is not thread-safe)
+            row = self.feature_store.current_features(current_data, history=self.max_window_size)
+            loop = asyncio.get_running_loop()
+            predictions = await loop.run_in_executor(self.executor, self._predict_all, snapshot, row)
 
-                # Get prediction from best performing model
-                prediction = await self._predict_single_failure_type(failure_type, current_data)
-
-                if prediction and prediction.probability > 0.3:  # High confidence threshold
-                    predictions.append(prediction)
-                    PREDICTIVE_MAINTENANCE_PREDICTIONS_TOTAL.labels(
-                        failure_type=failure_type.value, 
-                        model_type=prediction.model_used.value
-                    ).inc()
+            for prediction in predictions:
+                PREDICTIVE_MAINTENANCE_PREDICTIONS_TOTAL.labels(
+                    failure_type=prediction.failure_type.value, 
+                    model_type=prediction.model_used.value
+                ).inc()
 
             # Sort by probability and confidence
             predictions.sort(key=lambda x: x.probability * x.confidence, reverse=True)
@@ -304,53 +433,50 @@ class PredictiveMaintenanceEngine:
 
         return actions_taken
 
-    async def _predict_single_failure_type(self, failure_type: FailureType, data: TimeSeriesData) -> Optional[PredictionResult]:
-        """Predict failure for a specific failure type."""
-        if failure_type not in self.models:
-            return None
+    def _predict_all(self, snapshot: ModelSnapshot, row: np.ndarray) -> List[PredictionResult]:
+        """Score every failure type in ``snapshot`` for one feature row."""
+        # Failure types served by the same fitted model (same target) share one forward pass
+        groups: Dict[Tuple[int, int, str], List[FailureType]] = {}
+        for failure_type, models in snapshot.models.items():
+            model = models.get(PredictionModel.RANDOM_FOREST)
+            scaler = snapshot.scalers.get(failure_type)
+            if model is None or scaler is None:
+                continue
+            key = (id(model), id(scaler), TARGET_COLUMNS[failure_type])
+            groups.setdefault(key, []).append(failure_type)
+
+        failure_types: List[FailureType] = []
+        predicted_values: List[float] = []
+        for (_, _, target_col), members in groups.items():
+            failure_type = members[0]
+            try:
+                # Same column layout as training, with failure_occurred = False
+                features = np.delete(row, TABLE_COLUMNS.index(target_col))[np.newaxis, :]
+                features_scaled = snapshot.scalers[failure_type].transform(features)
+                model = snapshot.models[failure_type][PredictionModel.RANDOM_FOREST]
+                predicted_value = float(model.predict(features_scaled)[0])
+            except Exception as e:
+                logger.error(f"Prediction failed for {failure_type}: {e}")
+                continue
+            failure_types.extend(members)
+            predicted_values.extend([predicted_value] * len(members))
 
-        # Use the best performing model (Random Forest as default)
-        model = self.models[failure_type].get(PredictionModel.RANDOM_FOREST)
-        if not model:
-            return None
+        if not failure_types:
+            return []
 
-        try:
-            # Prepare features
-            features = self._extract_features_from_data(data, failure_type)
-            features_scaled = self.scalers[failure_type].transform([features])
-
-            # Make prediction using regression model
-            model = self.models[failure_type].get(PredictionModel.RANDOM_FOREST)
-            if not model:
-                return None
-                
-            predicted_value = model.predict(features_scaled)[0]
-                
-            # Calculate failure probability based on predicted value vs threshold
-            # For each failure type, define what constitutes a "high" value indicating potential failure
-            thresholds = {
-                FailureType.CPU_SPIKE: 75.0,  # CPU usage > 75%
-                FailureType.MEMORY_LEAK: 80.0,  # Memory usage > 80%
-                FailureType.NETWORK_LATENCY: 100.0,  # Latency > 100ms
-                FailureType.DISK_IO_BURST: 200.0,  # Disk I/O > 200 ops/sec
-                FailureType.SERVICE_CRASH: 1.0,  # Error rate > 1%
-                FailureType.RESOURCE_EXHAUSTION: 1.0  # Error rate > 1%
-            }
-            
-            threshold = thresholds[failure_type]
-            
-            # Calculate probability as sigmoid of (predicted_value - threshold)
-            # This gives higher probability when predicted value is much higher than threshold
-            probability = 1 / (1 + np.exp(-(predicted_value - threshold) / 10))  # Sigmoid with scaling
-            
-            # Only create prediction if probability is significant (> 0.3)
-            if probability < 0.3:
-                return None
+        # Probability as sigmoid of (predicted_value - threshold), scaled
+        thresholds = np.array([FAILURE_THRESHOLDS[ft] for ft in failure_types])
+        probabilities = 1 / (1 + np.exp(-(np.array(predicted_values) - thresholds) / 10))
+
+        predictions = []
+        for failure_type, probability in zip(failure_types, probabilities.tolist()):
+            if probability <= 0.3:  # High confidence threshold
+                continue
 
             # Estimate time to failure (simplified - higher probability = sooner failure)
             time_to_failure_hours = max(1, int((1 - probability) * 24))
 
-            prediction = PredictionResult(
+            predictions.append(PredictionResult(
                 failure_type=failure_type,
                 probability=float(probability),
                 predicted_time=datetime.now() + timedelta(hours=time_to_failure_hours),
@@ -358,182 +484,40 @@ class PredictiveMaintenanceEngine:
                 features_used=['cpu_usage', 'memory_usage', 'network_latency', 'disk_io', 'error_rate'],
                 model_used=PredictionModel.RANDOM_FOREST,
                 preventive_actions=self._get_preventive_actions(failure_type)
-            )
-
-            return prediction
+            ))
+        return predictions
 
-        except Exception as e:
-            logger.error(f"Prediction failed for {failure_type}: {e}")
-            return None
-
-    async def _train_models_for_failure_type(self, failure_type: FailureType, features: np.ndarray, targets: np.ndarray) -> Dict[str, float]:
-        """Train multiple models for a specific failure type."""
-        metrics = {}
-
-        # Split data
-        X_train, X_test, y_train, y_test = train_test_split(
-            features, targets, test_size=0.2, random_state=42
-        )
-
-        # Scale features
-        self.scalers[failure_type].fit(X_train)
-        X_train_scaled = self.scalers[failure_type].transform(X_train)
-        X_test_scaled = self.scalers[failure_type].transform(X_test)
-
-        # Random Forest
-        rf_model = RandomForestRegressor(n_estimators=100, random_state=42)
-        rf_model.fit(X_train_scaled, y_train)
-        rf_pred = rf_model.predict(X_test_scaled)
-        rf_mse = mean_squared_error(y_test, rf_pred)
-        rf_r2 = r2_score(y_test, rf_pred)
-
-        self.models[failure_type][PredictionModel.RANDOM_FOREST] = rf_model
-        metrics['random_forest'] = rf_r2
-
-        # Isolation Forest for anomaly detection
-        if_model = IsolationForest(contamination=0.1, random_state=42)
-        if_model.fit(X_train_scaled)
-        self.models[failure_type][PredictionModel.ISOLATION_FOREST] = if_model
-
-        logger.info(f"Trained models for {failure_type.value}: RF R² = {rf_r2:.3f}")
-        return metrics
-
-    def _prepare_training_dataframe(self) -> pd.DataFrame:
-        """Convert training data to pandas DataFrame."""
-        data = []
-        for item in self.training_data:
-            data.append({
-                'timestamp': item.timestamp,
-                'cpu_usage': item.cpu_usage,
-                'memory_usage': item.memory_usage,
-                'network_latency': item.network_latency,
-                'disk_io': item.disk_io,
-                'error_rate': item.error_rate,
-                'response_time': item.response_time,
-                'active_connections': item.active_connections,
-                'failure_occurred': item.failure_occurred
-            })
-
-        df = pd.DataFrame(data)
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
-        df = df.sort_values('timestamp')
-        return df
-
-    def _prepare_features_and_targets(self, df: pd.DataFrame, failure_type: FailureType) -> Tuple[np.ndarray, np.ndarray]:
-        """Prepare features and targets for a specific failure type."""
-        # Create target based on failure type
-        if failure_type == FailureType.CPU_SPIKE:
-            target_col = 'cpu_usage'
-        elif failure_type == FailureType.MEMORY_LEAK:
-            target_col = 'memory_usage'
-        elif failure_type == FailureType.NETWORK_LATENCY:
-            target_col = 'network_latency'
-        elif failure_type == FailureType.DISK_IO_BURST:
-            target_col = 'disk_io'
-        else:
-            target_col = 'error_rate'
-
-        # Create rolling features
-        df_features = df.copy()
-        for col in ['cpu_usage', 'memory_usage', 'network_latency', 'disk_io', 'error_rate']:
-            df_features[f'{col}_rolling_mean_3'] = df_features[col].rolling(window=3).mean()
-            df_features[f'{col}_rolling_std_3'] = df_features[col].rolling(window=3).std()
-            df_features[f'{col}_rolling_mean_6'] = df_features[col].rolling(window=6).mean()
-            df_features[f'{col}_rolling_std_6'] = df_features[col].rolling(window=6).std()
-
-        # Drop NaN values
-        df_features = df_features.dropna()
-
-        # Features are all columns except timestamp and target
-        feature_cols = [col for col in df_features.columns if col not in ['timestamp', target_col]]
-        features = df_features[feature_cols].values
-        targets = df_features[target_col].values
-
-        logger.debug(f"Training features for {failure_type}: {len(feature_cols)} columns - {feature_cols}")
-
-        return features, targets
-
-    def _extract_features_from_data(self, data: TimeSeriesData, failure_type: FailureType) -> List[float]:
-        """Extract features from current data for prediction."""
-        # If we don't have enough recent data, use current values as approximations
-        if len(self.recent_data) < 3:
-            # Fallback: use current values for all features
-            base_features = [
-                data.cpu_usage, data.memory_usage, data.network_latency, 
-                data.disk_io, data.error_rate, data.response_time, data.active_connections
-            ]
-            # Approximate rolling stats
-            features = base_features.copy()
-            for _ in range(5):  # 5 metrics × 4 rolling stats
-                features.extend([0.0, 0.0, 0.0, 0.0])
-            return features
-        
-        # Create DataFrame from recent data + current data
-        recent_with_current = self.recent_data + [data]
-        df_recent = pd.DataFrame([{
-            'cpu_usage': d.cpu_usage,
-            'memory_usage': d.memory_usage,
-            'network_latency': d.network_latency,
-            'disk_io': d.disk_io,
-            'error_rate': d.error_rate,
-            'response_time': d.response_time,
-            'active_connections': d.active_connections
-        } for d in recent_with_current])
-        
-        # Compute rolling statistics for the last row (current data)
-        for col in ['cpu_usage', 'memory_usage', 'network_latency', 'disk_io', 'error_rate']:
-            df_recent[f'{col}_rolling_mean_3'] = df_recent[col].rolling(window=min(3, len(df_recent))).mean()
-            df_recent[f'{col}_rolling_std_3'] = df_recent[col].rolling(window=min(3, len(df_recent))).std()
-            df_recent[f'{col}_rolling_mean_6'] = df_recent[col].rolling(window=min(6, len(df_recent))).mean()
-            df_recent[f'{col}_rolling_std_6'] = df_recent[col].rolling(window=min(6, len(df_recent))).std()
-        
-        # Get features for the last row (current prediction)
-        last_row = df_recent.iloc[-1]
-        
-        # Base features (all except timestamp and target, including failure_occurred = False for prediction)
-        if failure_type == FailureType.CPU_SPIKE:
-            base_features = [
-                last_row['memory_usage'], last_row['network_latency'], last_row['disk_io'], 
-                last_row['error_rate'], last_row['response_time'], last_row['active_connections'], 0.0  # failure_occurred = False
-            ]
-        elif failure_type == FailureType.MEMORY_LEAK:
-            base_features = [
-                last_row['cpu_usage'], last_row['network_latency'], last_row['disk_io'], 
-                last_row['error_rate'], last_row['response_time'], last_row['active_connections'], 0.0
-            ]
-        elif failure_type == FailureType.NETWORK_LATENCY:
-            base_features = [
-                last_row['cpu_usage'], last_row['memory_usage'], last_row['disk_io'], 
-                last_row['error_rate'], last_row['response_time'], last_row['active_connections'], 0.0
-            ]
-        elif failure_type == FailureType.DISK_IO_BURST:
-            base_features = [
-                last_row['cpu_usage'], last_row['memory_usage'], last_row['network_latency'], 
-                last_row['error_rate'], last_row['response_time'], last_row['active_connections'], 0.0
-            ]
-        else:  # SERVICE_CRASH or RESOURCE_EXHAUSTION
-            base_features = [
-                last_row['cpu_usage'], last_row['memory_usage'], last_row['network_latency'], 
-                last_row['disk_io'], last_row['response_time'], last_row['active_connections'], 0.0
-            ]
-        
-        # Rolling features for all metrics (20 features)
-        rolling_features = []
-        for col in ['cpu_usage', 'memory_usage', 'network_latency', 'disk_io', 'error_rate']:
-            rolling_features.extend([
-                last_row[f'{col}_rolling_mean_3'],
-                last_row[f'{col}_rolling_std_3'], 
-                last_row[f'{col}_rolling_mean_6'],
-                last_row[f'{col}_rolling_std_6']
-            ])
-        
-        # Combine base and rolling features
-        features = base_features + rolling_features
-        
-        # Fill any NaN values with 0
-        features = [0.0 if pd.isna(x) else x for x in features]
-        
-        return features
+    async def _run_training(self, rows: np.ndarray, targets: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fit models for ``targets`` off the event loop."""
+        loop = asyncio.get_running_loop()
+        try:
+            if self._training_executor is None:
+                self._training_executor = ProcessPoolExecutor(max_workers=1)
+            return await loop.run_in_executor(self._training_executor, train_target_models, rows, targets)
+        except (BrokenProcessPool, OSError, NotImplementedError) as e:
+            # Process pools are unavailable in some sandboxes; a thread still keeps the loop free
+            logger.warning(f"Training process pool unavailable ({e}); training in a thread")
+            if self._training_executor is not None:
+                self._training_executor.shutdown(wait=False, cancel_futures=True)
+                self._training_executor = None
+            return await loop.run_in_executor(self.executor, train_target_models, rows, targets)
+
+    async def _training_scheduler_loop(self) -> None:
+        """Periodically retrain when new data has arrived since the last run."""
+        while True:
+            await asyncio.sleep(self.training_interval)
+            if self._points_since_training and len(self.feature_store) >= MIN_TRAINING_POINTS:
+                self.schedule_training()
+
+    def _note_new_points(self, count: int) -> None:
+        """Count new data and start retraining once enough has accumulated."""
+        self._points_since_training += count
+        if (
+            self.retrain_after_points
+            and self._points_since_training >= self.retrain_after_points
+            and len(self.feature_store) >= MIN_TRAINING_POINTS
+        ):
+            self.schedule_training()
 
     def _get_preventive_actions(self, failure_type: FailureType) -> List[str]:
         """Get preventive actions for a failure type."""
@@ -587,46 +571,61 @@ class PredictiveMaintenanceEngine:
         return actions_executed
 
     async def _load_models(self) -> None:
-        """Load trained models from disk."""
+        """Load the current model version, migrating legacy per-type files."""
         try:
+            if self.registry.load_current() is not None:
+                logger.info(f"Loaded predictive maintenance models v{self.registry.current_version}")
+                return
+
+            models, scalers = {}, {}
             for failure_type in FailureType:
                 model_path = os.path.join(self.model_dir, f"{failure_type.value}_models.pkl")
                 scaler_path = os.path.join(self.model_dir, f"{failure_type.value}_scaler.pkl")
 
-                if os.path.exists(model_path):
+                if os.path.exists(model_path) and os.path.exists(scaler_path):
                     with open(model_path, 'rb') as f:
-                        self.models[failure_type] = pickle.load(f)
-
-                if os.path.exists(scaler_path):
+                        models[failure_type] = pickle.load(f)
                     with open(scaler_path, 'rb') as f:
-                        self.scalers[failure_type] = pickle.load(f)
+                        scalers[failure_type] = pickle.load(f)
 
-            logger.info("Models loaded successfully")
+            if models:
+                self.registry.publish(models, scalers)
+                logger.info("Legacy models loaded successfully")
 
         except Exception as e:
             logger.error(f"Failed to load models: {e}")
 
-    async def _save_models(self) -> None:
-        """Save trained models to disk."""
+    async def _store_training_data(self, data: TimeSeriesData) -> None:
+        """Persist a training point to the training sink."""
+        self.training_sink.append(data)
+        self._mirror_to_memory([data])
+
+    async def _store_training_data_batch(self, data_points: List[TimeSeriesData]) -> None:
+        """Persist several training points to the training sink."""
+        self.training_sink.extend(data_points)
+        self._mirror_to_memory(data_points)
+
+    def _mirror_to_memory(self, data_points: List[TimeSeriesData]) -> None:
+        """Write the points selected by the mirror policy to adaptive memory."""
+        selected = self.mirror_policy.select(data_points, self._points_seen)
+        self._points_seen += len(data_points)
+        if not selected:
+            return
+
+        entries = [self._training_memory_entry(data) for data in selected]
         try:
-            for failure_type in FailureType:
-                if failure_type in self.models:
-                    model_path = os.path.join(self.model_dir, f"{failure_type.value}_models.pkl")
-                    scaler_path = os.path.join(self.model_dir, f"{failure_type.value}_scaler.pkl")
-
-                    with open(model_path, 'wb') as f:
-                        pickle.dump(self.models[failure_type], f)
-
-                    with open(scaler_path, 'wb') as f:
-                        pickle.dump(self.scalers[failure_type], f)
-
-            logger.info("Models saved successfully")
-
-        except Exception as e:
-            logger.error(f"Failed to save models: {e}")
+            self.memory_store.write_batch(
+                [embedding for embedding, _ in entries],
+                [metadata for _, metadata in entries],
+                [data.timestamp for data in selected],
+            )
+        except ValueError as e:
+            # e.g. the store already holds anomaly embeddings of another dimension
+            logger.warning(f"Skipped mirroring training data to memory: {e}")
 
-    async def _store_training_data(self, data: TimeSeriesData) -> None:
-        """Store training data in memory store for persistence."""
+    @staticmethod
+    def _training_memory_entry(data: TimeSeriesData) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """Embedding and metadata under which a training point is persisted."""
         # Convert to embedding (simplified)
         embedding = np.array([
             data.cpu_usage,
@@ -643,8 +642,7 @@ class PredictiveMaintenanceEngine:
             "failure_occurred": data.failure_occurred,
             "severity": 0.5 if not data.failure_occurred else 0.9
         }
-
-        self.memory_store.write(embedding, metadata, data.timestamp)
+        return embedding, metadata
 
 # Global instance
 _predictive_engine: Optional[PredictiveMaintenanceEngine] = None
@@ -0,0 +1,182 @@
+"""
+Training Data Sink for Predictive Maintenance
+
+Append-only columnar log of training telemetry, kept apart from the
+anomaly memory store.
+"""
+
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Iterable, List, Optional
+
+import numpy as np
+
+from security_engine.feature_store import METRIC_COLUMNS
+
+# On-disk record: timestamp (epoch seconds), raw metrics, failure flag
+RECORD_DTYPE = np.dtype(
+    [("timestamp", "<f8")]
+    + [(name, "<f8") for name in METRIC_COLUMNS]
+    + [("failure_occurred", "u1")]
+)
+
+DEFAULT_FLUSH_ROWS = 1024
+DEFAULT_FLUSH_INTERVAL_SECONDS = 5.0
+DEFAULT_MAX_FILE_BYTES = 256 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class MemoryMirrorPolicy:
+    """
+    Down-sampling policy for mirroring training points into adaptive memory.
+
+    The default mirrors nothing: anomalies already reach adaptive memory
+    through the detection path, and training rows would only evict them.
+    """
+    mirror_failures: bool = False
+    sample_every: int = 0  # mirror every Nth point (0 disables sampling)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any point can be mirrored."""
+        return self.mirror_failures or self.sample_every > 0
+
+    def select(self, points: List[Any], start_index: int = 0) -> List[Any]:
+        """
+        Points of a batch that should be mirrored.
+
+        Args:
+            points: Training points in arrival order
+            start_index: Stream position of ``points[0]`` (for sampling)
+        """
+        if not self.enabled:
+            return []
+        selected = []
+        for offset, data in enumerate(points):
+            if self.mirror_failures and data.failure_occurred:
+                selected.append(data)
+            elif self.sample_every > 0 and (start_index + offset) % self.sample_every == 0:
+                selected.append(data)
+        return selected
+
+
+class TrainingDataSink:
+    """
+    Buffered, append-only file of fixed-width training records.
+
+    Points are packed into a preallocated structured buffer and written
+    to disk in one call when the buffer fills or ``flush_interval`` has
+    elapsed since the last flush. When the file exceeds ``max_file_bytes``
+    it is rotated to ``<path>.1`` (one previous generation is kept).
+
+    Features:
+    - O(1) append with no similarity search or per-point thread
+    - Compact storage (one fixed-width record per point)
+    - Bounded disk usage through rotation
+    """
+
+    def __init__(
+        self,
+        path: str,
+        flush_rows: int = DEFAULT_FLUSH_ROWS,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        max_file_bytes: int = DEFAULT_MAX_FILE_BYTES,
+    ):
+        """
+        Initialize training data sink.
+
+        Args:
+            path: Record file path (parent directories are created)
+            flush_rows: Buffered rows that force a flush
+            flush_interval: Seconds after which an append flushes the buffer
+            max_file_bytes: Size at which the record file is rotated
+        """
+        if flush_rows <= 0:
+            raise ValueError("flush_rows must be positive")
+        self.path = path
+        self.flush_interval = flush_interval
+        self.max_file_bytes = max_file_bytes
+        self._buffer = np.zeros(flush_rows, dtype=RECORD_DTYPE)
+        self._count = 0
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    @property
+    def pending(self) -> int:
+        """Rows buffered but not yet written."""
+        return self._count
+
+    def append(self, data: Any) -> None:
+        """
+        Buffer one training point.
+
+        Args:
+            data: Object with ``timestamp``, the ``METRIC_COLUMNS`` attributes
+                and ``failure_occurred`` (e.g. TimeSeriesData)
+        """
+        with self._lock:
+            record = self._buffer[self._count]
+            record["timestamp"] = data.timestamp.timestamp()
+            for name in METRIC_COLUMNS:
+                record[name] = getattr(data, name)
+            record["failure_occurred"] = bool(data.failure_occurred)
+            self._count += 1
+
+            if self._count == self._buffer.shape[0] or self._flush_due():
+                self._flush_locked()
+
+    def extend(self, points: Iterable[Any]) -> None:
+        """Buffer several points in order."""
+        for data in points:
+            self.append(data)
+
+    def flush(self) -> None:
+        """Write buffered rows to disk."""
+        with self._lock:
+            self._flush_locked()
+
+    def read(self, since: Optional[float] = None) -> np.ndarray:
+        """
+        All stored rows (rotated file, current file, then buffered rows).
+
+        Args:
+            since: Optional epoch-seconds lower bound on ``timestamp``
+
+        Returns:
+            Structured array with ``RECORD_DTYPE``
+        """
+        with self._lock:
+            parts = [
+                np.fromfile(file_path, dtype=RECORD_DTYPE)
+                for file_path in (self.path + ".1", self.path)
+                if os.path.exists(file_path)
+            ]
+            parts.append(self._buffer[: self._count].copy())
+        records = np.concatenate(parts)
+        if since is not None:
+            records = records[records["timestamp"] >= since]
+        return records
+
+    def close(self) -> None:
+        """Flush buffered rows."""
+        self.flush()
+
+    # Private helper methods
+
+    def _flush_due(self) -> bool:
+        return time.monotonic() - self._last_flush >= self.flush_interval
+
+    def _flush_locked(self) -> None:
+        """Append the buffer to the record file, rotating it when too large."""
+        self._last_flush = time.monotonic()
+        if self._count == 0:
+            return
+        with open(self.path, "ab") as f:
+            f.write(self._buffer[: self._count].tobytes())
+            size = f.tell()
+        self._count = 0
+        if size >= self.max_file_bytes:
+            os.replace(self.path, self.path + ".1")
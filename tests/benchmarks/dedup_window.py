@@ -0,0 +1,70 @@
+"""
+Benchmarks for DedupWindow - message deduplication throughput.
+
+Target: 10^5 msgs/s sustained through a full window, for both the
+SwarmMessageBus key format and ReliableDelivery sequence numbers.
+"""
+
+import time
+from uuid import uuid4
+
+from astraguard.swarm.bus import DedupWindow
+
+TARGET_MSGS_PER_SEC = 100_000
+
+
+def _report(label: str, count: int, elapsed: float) -> None:
+    """Print throughput against the target."""
+    rate = count / elapsed
+    status = "✓" if rate >= TARGET_MSGS_PER_SEC else "✗"
+    print(f"{label}:")
+    print(f"  {count} inserts in {elapsed * 1000:.1f}ms")
+    print(f"  Throughput: {rate:,.0f} msgs/s (target {TARGET_MSGS_PER_SEC:,}) {status}")
+
+
+def benchmark_bus_keys(window_size: int = 1000, count: int = 200_000):
+    """Benchmark sender:message_id keys as used by SwarmMessageBus."""
+    sender = uuid4()
+    keys = [f"{sender}:{uuid4()}" for _ in range(count)]
+    window = DedupWindow(window_size)
+
+    start = time.perf_counter()
+    for key in keys:
+        window.add(key)
+    elapsed = time.perf_counter() - start
+
+    _report(f"Bus keys (window {window_size})", count, elapsed)
+    assert len(window) == window_size
+
+
+def benchmark_sequences(window_size: int = 1000, count: int = 200_000):
+    """Benchmark integer sequences with 10% duplicates, as in ReliableDelivery."""
+    seqs = [i - 5 if i % 10 == 0 else i for i in range(count)]
+    window = DedupWindow(window_size)
+
+    start = time.perf_counter()
+    duplicates = 0
+    for seq in seqs:
+        if not window.add(seq):
+            duplicates += 1
+    elapsed = time.perf_counter() - start
+
+    _report(f"Sequences (window {window_size})", count, elapsed)
+    print(f"  Duplicates rejected: {duplicates}")
+
+
+def main():
+    """Run all benchmarks."""
+    print("\n" + "=" * 60)
+    print("DEDUP WINDOW BENCHMARKS")
+    print("=" * 60)
+
+    for window_size in [1000, 100_000]:
+        benchmark_bus_keys(window_size)
+        benchmark_sequences(window_size)
+
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
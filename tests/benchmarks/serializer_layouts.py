@@ -0,0 +1,94 @@
+"""
+Benchmarks for SwarmSerializer - HealthSummary encode/decode layouts.
+
+Compares per-message roundtrip cost of:
+- JSON + schema validator rebuilt per message (previous behaviour)
+- JSON + compiled (cached) schema validator
+- JSON with sampled validation (trusted peer)
+- Fixed-layout binary (float32 and uint8 signatures)
+"""
+
+import time
+from datetime import datetime
+
+import jsonschema
+
+from astraguard.swarm.models import HealthSummary
+from astraguard.swarm.serializer import SwarmSerializer
+
+
+class UncompiledSerializer(SwarmSerializer):
+    """Serializer that rebuilds the Draft7Validator on every call."""
+
+    def validate_schema(self, data: dict, schema_type: str) -> bool:
+        schema = {
+            **self.SCHEMA["definitions"][schema_type],
+            "definitions": self.SCHEMA["definitions"],
+        }
+        jsonschema.Draft7Validator(schema).validate(data)
+        return True
+
+
+def create_summary() -> HealthSummary:
+    """Create test HealthSummary."""
+    return HealthSummary(
+        anomaly_signature=[0.5 - 0.03 * i for i in range(32)],
+        risk_score=0.75,
+        recurrence_score=5.2,
+        timestamp=datetime.utcnow(),
+        compressed_size=200,
+    )
+
+
+def _run(label: str, roundtrip, iterations: int) -> None:
+    """Time a roundtrip function and print per-message cost."""
+    roundtrip()  # warm up
+    start = time.perf_counter()
+    for _ in range(iterations):
+        roundtrip()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<32} {elapsed / iterations * 1e6:8.1f} µs/msg")
+
+
+def main(iterations: int = 5000):
+    """Run all benchmarks."""
+    print("\n" + "=" * 60)
+    print("SERIALIZER LAYOUT BENCHMARKS")
+    print("=" * 60)
+
+    summary = create_summary()
+
+    uncompiled = UncompiledSerializer(validate=True)
+    compiled = SwarmSerializer(validate=True)
+    sampled = SwarmSerializer(validate=True, trusted_sample_every=100)
+    binary = SwarmSerializer(validate=True)
+
+    def json_roundtrip(serializer, trusted=False):
+        data = serializer.serialize_health(summary, compress=False)
+        return serializer.deserialize_health(data, compressed=False, trusted=trusted)
+
+    _run("JSON + per-call schema", lambda: json_roundtrip(uncompiled), iterations)
+    _run("JSON + compiled schema", lambda: json_roundtrip(compiled), iterations)
+    _run("JSON + sampled (trusted)", lambda: json_roundtrip(sampled, True), iterations)
+    _run(
+        "Binary float32",
+        lambda: binary.deserialize_health_binary(binary.serialize_health_binary(summary)),
+        iterations,
+    )
+    _run(
+        "Binary uint8",
+        lambda: binary.deserialize_health_binary(
+            binary.serialize_health_binary(summary, quantize=True)
+        ),
+        iterations,
+    )
+
+    print("\nPayload sizes:")
+    print(f"  JSON:           {len(compiled.serialize_health(summary, compress=False))} B")
+    print(f"  Binary float32: {len(binary.serialize_health_binary(summary))} B")
+    print(f"  Binary uint8:   {len(binary.serialize_health_binary(summary, quantize=True))} B")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
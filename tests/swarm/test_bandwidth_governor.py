@@ -10,7 +10,7 @@ Issue #404: Communication protocols - bandwidth-aware messaging
 
 import pytest
 import asyncio
-from datetime import datetime, timedelta
+import time
 
 from astraguard.swarm.bandwidth_governor import (
     BandwidthGovernor,
@@ -76,7 +76,7 @@ class TestTokenBucket:
         assert available < 10.0  # Should be nearly empty
         
         # Simulate time passing
-        bucket._last_update = datetime.utcnow() - timedelta(seconds=0.5)
+        bucket._last_update = time.monotonic() - 0.5
         
         # Should have ~500 tokens after 0.5s at 1000 bytes/s
         available = bucket.tokens_available()
@@ -439,6 +439,91 @@ class TestLoadScenarios:
             # With fair queuing, others should still be able to send
 
 
+class TestEgressScheduler:
+    """Test async send() queueing instead of drop-on-throttle."""
+    
+    @pytest.mark.asyncio
+    async def test_send_immediate_when_tokens_available(self):
+        """Test send returns at once with spare bandwidth."""
+        config, agent_id = create_config()
+        governor = BandwidthGovernor(config)
+        
+        await asyncio.wait_for(
+            governor.send(create_agent_id("SAT001"), 100), timeout=0.1
+        )
+        
+        assert governor.stats.total_bytes_sent == 100
+        assert governor.stats.queued_messages == 1
+    
+    @pytest.mark.asyncio
+    async def test_send_waits_for_refill(self):
+        """Test send blocks until tokens refill rather than dropping."""
+        config, agent_id = create_config()
+        governor = BandwidthGovernor(config)
+        governor.global_bucket._tokens = 0  # 10KB/s refill → 300B in ~30ms
+        
+        start = time.monotonic()
+        await asyncio.wait_for(
+            governor.send(create_agent_id("SAT001"), 300, MessagePriority.NORMAL),
+            timeout=1.0,
+        )
+        
+        assert time.monotonic() - start >= 0.02
+        assert governor.stats.dropped_messages == 0
+        assert governor.stats.max_wait_seconds >= 0.02
+    
+    @pytest.mark.asyncio
+    async def test_priority_order(self):
+        """Test CRITICAL is released before earlier-queued NORMAL."""
+        config, agent_id = create_config()
+        governor = BandwidthGovernor(config)
+        governor.global_bucket._tokens = 0
+        order = []
+        
+        async def send(serial, priority):
+            await governor.send(create_agent_id(serial), 100, priority)
+            order.append(priority)
+        
+        normal = asyncio.create_task(send("SAT001", MessagePriority.NORMAL))
+        await asyncio.sleep(0)
+        critical = asyncio.create_task(send("SAT002", MessagePriority.CRITICAL))
+        await asyncio.sleep(0)
+        assert governor.queue_depths()["NORMAL"] == 1
+        assert governor.queue_depths()["CRITICAL"] == 1
+        
+        await asyncio.wait_for(asyncio.gather(normal, critical), timeout=1.0)
+        assert order == [MessagePriority.CRITICAL, MessagePriority.NORMAL]
+        assert governor.queue_depths() == {p.value: 0 for p in MessagePriority}
+    
+    @pytest.mark.asyncio
+    async def test_fair_queueing_across_peers(self):
+        """Test a busy peer does not starve a quiet one in the same class."""
+        config, agent_id = create_config()
+        governor = BandwidthGovernor(config)
+        governor.global_bucket._tokens = 0
+        order = []
+        
+        async def send(serial):
+            await governor.send(create_agent_id(serial), 100)
+            order.append(serial)
+        
+        tasks = [asyncio.create_task(send("SAT001")) for _ in range(4)]
+        await asyncio.sleep(0)
+        tasks.append(asyncio.create_task(send("SAT002")))
+        
+        await asyncio.wait_for(asyncio.gather(*tasks), timeout=1.0)
+        assert order.index("SAT002") <= 1
+    
+    @pytest.mark.asyncio
+    async def test_send_rejects_oversized(self):
+        """Test messages larger than any burst fail fast."""
+        config, agent_id = create_config()
+        governor = BandwidthGovernor(config)
+        
+        with pytest.raises(ValueError):
+            await governor.send(create_agent_id("SAT001"), 600)
+
+
 class TestMetricsExport:
     """Test metrics for Prometheus."""
     
@@ -458,3 +543,5 @@ class TestMetricsExport:
         assert "global_utilization" in stats_dict
         assert "congestion_level" in stats_dict
         assert "fair_share_bytes" in stats_dict
+        assert "queue_depth" in stats_dict
+        assert "average_wait_ms" in stats_dict
@@ -27,7 +27,7 @@ from astraguard.swarm.types import (
     SubscriptionID,
     MessageAck,
 )
-from astraguard.swarm.bus import SwarmMessageBus
+from astraguard.swarm.bus import SwarmMessageBus, TopicTrie, DedupWindow
 
 
 class TestSwarmMessage:
@@ -414,6 +414,118 @@ class TestSwarmMessageBus:
 
         bus.unsubscribe(sub_id)
 
+    @pytest.mark.asyncio
+    async def test_slow_callback_does_not_stall_publisher(self, bus_with_agents):
+        """Test slow async callbacks keep running after publish returns."""
+        bus, _ = bus_with_agents
+        bus.callback_wait_ms = 10
+        release = asyncio.Event()
+        fast, slow = [], []
+
+        async def slow_subscriber(msg: SwarmMessage):
+            await release.wait()
+            slow.append(msg)
+
+        def fast_subscriber(msg: SwarmMessage):
+            fast.append(msg)
+
+        bus.subscribe("health/*", slow_subscriber)
+        bus.subscribe("health/summary", fast_subscriber)
+
+        result = await asyncio.wait_for(
+            bus.publish("health/summary", b"test", qos=0), timeout=1.0
+        )
+
+        assert result is True
+        assert len(fast) == 1 and slow == []
+        assert bus.get_metrics()["callbacks_in_flight"] == 1
+
+        release.set()
+        await asyncio.sleep(0.01)
+        assert len(slow) == 1
+        assert bus.get_metrics()["callbacks_in_flight"] == 0
+
+
+class TestTopicTrie:
+    """Test suite for the subscription trie."""
+
+    FILTERS = [
+        "*", "health/*", "health/summary", "health/summary/*", "control/*",
+        "control/safe_mode", "coord/a/b", "coord/a/*", "/*", "*/*", "intent",
+    ]
+    TOPICS = [
+        "health/summary", "health/summary/x", "health/", "health", "control/safe_mode",
+        "control/peers", "coord/a/b", "coord/a/b/c", "coord/a", "/x", "*/y", "intent", "intent/x",
+    ]
+
+    def test_matches_topic_filter(self):
+        """Trie lookups agree with TopicFilter.matches, in subscription order."""
+        trie = TopicTrie()
+        subs = [SubscriptionID(topic_filter=f) for f in self.FILTERS]
+        for sub in subs:
+            trie.add(sub.topic_filter, sub)
+
+        for topic in self.TOPICS:
+            expected = [s for s in subs if TopicFilter(s.topic_filter).matches(topic)]
+            assert trie.match(topic) == expected, topic
+
+    def test_remove_prunes(self):
+        """Removed subscriptions no longer match and empty nodes are pruned."""
+        trie = TopicTrie()
+        deep = SubscriptionID(topic_filter="coord/a/b/*")
+        trie.add(deep.topic_filter, deep)
+
+        assert trie.remove(deep.topic_filter, deep) is True
+        assert trie.remove(deep.topic_filter, deep) is False
+        assert trie.match("coord/a/b/c") == []
+        assert len(trie) == 0
+        assert trie._root.children == {}
+
+    def test_bus_unsubscribe_updates_index(self):
+        """Unsubscribing removes the subscription from the bus index."""
+        config = SwarmConfig(
+            agent_id=AgentID.create("astra-v3.0", "SAT-001-A"),
+            role=SatelliteRole.PRIMARY,
+            constellation_id="astra-v3.0",
+        )
+        bus = SwarmMessageBus(config, SwarmSerializer(validate=False), latency_ms=0)
+        sub_id = bus.subscribe("health/*", lambda msg: None)
+        assert bus.subscription_index.match("health/summary") == [sub_id]
+
+        bus.unsubscribe(sub_id)
+        assert bus.subscription_index.match("health/summary") == []
+
+
+class TestDedupWindow:
+    """Test suite for the bounded deduplication window."""
+
+    def test_rejects_duplicates(self):
+        """Keys already in the window are reported as duplicates."""
+        window = DedupWindow(capacity=3)
+        assert window.add("a") is True
+        assert window.add("a") is False
+        assert "a" in window
+        assert len(window) == 1
+
+    def test_evicts_oldest_first(self):
+        """A full window forgets keys in insertion order."""
+        window = DedupWindow(capacity=3)
+        for key in ["c", "a", "b", "d"]:
+            window.add(key)
+
+        assert "c" not in window
+        assert all(key in window for key in ["a", "b", "d"])
+        assert len(window) == 3
+
+        window.add("e")
+        assert "a" not in window
+        assert window.add("c") is True
+
+    def test_invalid_capacity(self):
+        """Capacity must be positive."""
+        with pytest.raises(ValueError):
+            DedupWindow(capacity=0)
+
 
 class TestQoSLevels:
     """Test suite for QoS level validation."""
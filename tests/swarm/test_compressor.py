@@ -339,3 +339,37 @@ class TestCompressionPipeline:
         # Should achieve decent compression
         avg_ratio = 100.0 * (1.0 - total_compressed / total_original)
         assert avg_ratio > 50  # At least 50% compression on batch
+
+    def test_compress_batch_matches_single(self):
+        """Test batch frames equal per-peer compress_health output."""
+        peers = ["SAT-001", "SAT-002", "SAT-001", "SAT-003", "SAT-002"]
+        items = [
+            (
+                peer,
+                HealthSummary(
+                    anomaly_signature=[((i * 7 + j) % 19) / 40.0 - 0.2 for j in range(32)],
+                    risk_score=0.1 * i,
+                    recurrence_score=float(i),
+                    timestamp=datetime.utcnow(),
+                ),
+            )
+            for i, peer in enumerate(peers)
+        ]
+
+        batch = StateCompressor().compress_batch(items)
+        singles = {peer: StateCompressor() for peer in set(peers)}
+        assert batch == [singles[peer].compress_health(s) for peer, s in items]
+
+        restored = StateCompressor().decompress_batch(
+            [(peer, frame) for (peer, _), frame in zip(items, batch)]
+        )
+        for (_, summary), result in zip(items, restored):
+            assert abs(result.risk_score - summary.risk_score) < 0.01
+            for orig, rest in zip(summary.anomaly_signature, result.anomaly_signature):
+                assert abs(orig - rest) < 0.02
+
+    def test_empty_batch(self):
+        """Test empty batches round-trip to empty lists."""
+        compressor = StateCompressor()
+        assert compressor.compress_batch([]) == []
+        assert compressor.decompress_batch([]) == []
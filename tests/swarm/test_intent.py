@@ -17,6 +17,7 @@ from astraguard.swarm.intent_broadcaster import (
     IntentBroadcaster,
     IntentStats,
     CONFLICT_THRESHOLD,
+    INTENT_HISTORY_SIZE,
 )
 from astraguard.swarm.types import IntentMessage, PriorityEnum, SwarmTopic
 from astraguard.swarm.models import AgentID, SatelliteRole, SwarmConfig
@@ -399,6 +400,50 @@ class TestIntentStorage:
         active = broadcaster._get_active_intents()
         assert len(active) == 0
 
+    def test_history_trim_deactivates_oldest(self):
+        """Test intents trimmed from history leave the active index."""
+        config, agent_id = create_config()
+        broadcaster = IntentBroadcaster(
+            SwarmRegistry(config, agent_id), create_bus(config), StateCompressor()
+        )
+        sender = create_agent_id("SAT001")
+
+        intents = [create_intent(agent_id=sender) for _ in range(INTENT_HISTORY_SIZE + 5)]
+        for intent in intents:
+            broadcaster._store_intent(intent)
+
+        active = broadcaster._get_active_intents()
+        assert len(broadcaster.intent_history[sender]) == INTENT_HISTORY_SIZE
+        assert len(active) == INTENT_HISTORY_SIZE
+        assert all(intent not in active for intent in intents[:5])
+
+    def test_indexed_score_matches_pairwise_scan(self):
+        """Test indexed conflict scoring equals a scan of all active intents."""
+        config, agent_id = create_config()
+        broadcaster = IntentBroadcaster(
+            SwarmRegistry(config, agent_id), create_bus(config), StateCompressor()
+        )
+        now = datetime.utcnow()
+
+        for i in range(60):
+            intent = create_intent(
+                action=["attitude_adjust", "load_shed"][i % 2],
+                target_angle=(i * 37) % 360,
+                duration=10 + (i % 7) * 10,
+                agent_id=create_agent_id(f"SAT{i % 6:03d}"),
+            )
+            intent.timestamp = now - timedelta(seconds=(i * 13) % 200)
+            broadcaster._store_intent(intent)
+
+        for angle in [0.0, 44.0, 179.5, 359.0]:
+            for action in ["attitude_adjust", "load_shed"]:
+                new_intent = create_intent(action=action, target_angle=angle, duration=5)
+                expected = max(
+                    broadcaster._compute_pairwise_conflict(new_intent, known)
+                    for known in broadcaster._get_active_intents()
+                )
+                assert broadcaster._compute_conflict_score(new_intent) == expected
+
 
 class TestBroadcasterMetrics:
     """Test metrics tracking."""
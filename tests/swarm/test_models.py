@@ -443,6 +443,102 @@ class TestSwarmSerializer:
         assert stats["original_size"] == 0
         assert stats["compression_ratio"] == 0.0
 
+    def test_serializer_validator_compiled_once(self):
+        """Test schema validators are cached per type."""
+        first = SwarmSerializer._get_validator("HealthSummary")
+        assert SwarmSerializer._get_validator("HealthSummary") is first
+        with pytest.raises(ValueError):
+            SwarmSerializer._get_validator("Unknown")
+
+    @pytest.mark.parametrize("field,value", [
+        ("risk_score", 1.5),
+        ("risk_score", True),
+        ("compressed_size", 2.5),
+        ("anomaly_signature", [0.1] * 33),
+        ("anomaly_signature", ["x"] * 32),
+        ("extra", 1),
+    ])
+    def test_serializer_compiled_schema_matches_jsonschema(self, field, value):
+        """Test compiled schema checks agree with Draft7Validator."""
+        import jsonschema
+
+        serializer = SwarmSerializer(validate=True)
+        data = {
+            "anomaly_signature": [0.1] * 32,
+            "risk_score": 0.5,
+            "recurrence_score": 3.5,
+            "timestamp": datetime.utcnow().isoformat(),
+        }
+        assert serializer.validate_schema(dict(data), "HealthSummary") is True
+
+        data[field] = value
+        assert SwarmSerializer._fast_checks["HealthSummary"](data) is False
+        with pytest.raises(jsonschema.ValidationError):
+            serializer.validate_schema(data, "HealthSummary")
+
+    def test_serializer_trusted_sampling(self, monkeypatch):
+        """Test trusted peers are validated on a sample of messages."""
+        serializer = SwarmSerializer(validate=True, trusted_sample_every=3)
+        summary = HealthSummary(
+            anomaly_signature=[0.1] * 32,
+            risk_score=0.5,
+            recurrence_score=3.5,
+            timestamp=datetime.utcnow(),
+        )
+        payload = serializer.serialize_health(summary, compress=False)
+
+        calls = []
+        monkeypatch.setattr(
+            serializer, "validate_schema", lambda data, schema_type: calls.append(schema_type)
+        )
+        for _ in range(6):
+            serializer.deserialize_health(payload, compressed=False, trusted=True)
+        assert len(calls) == 2
+
+        serializer.deserialize_health(payload, compressed=False)
+        assert len(calls) == 3
+
+    def test_serializer_binary_roundtrip(self):
+        """Test fixed-layout binary HealthSummary codec."""
+        serializer = SwarmSerializer(validate=True)
+        original = HealthSummary(
+            anomaly_signature=[0.5 - 0.03 * i for i in range(32)],
+            risk_score=0.75,
+            recurrence_score=5.25,
+            timestamp=datetime(2026, 1, 2, 3, 4, 5, 678901),
+            compressed_size=200,
+        )
+
+        full = serializer.serialize_health_binary(original)
+        quantized = serializer.serialize_health_binary(original, quantize=True)
+        assert len(full) == 149
+        assert len(quantized) == 53
+
+        for data, tolerance in [(full, 1e-6), (quantized, 0.005)]:
+            restored = serializer.deserialize_health_binary(data)
+            assert restored.timestamp == original.timestamp
+            assert restored.risk_score == original.risk_score
+            assert restored.recurrence_score == original.recurrence_score
+            assert restored.compressed_size == original.compressed_size
+            for orig, rest in zip(original.anomaly_signature, restored.anomaly_signature):
+                assert abs(orig - rest) < tolerance
+
+    def test_serializer_binary_rejects_malformed(self):
+        """Test binary codec rejects truncated or foreign frames."""
+        serializer = SwarmSerializer()
+        summary = HealthSummary(
+            anomaly_signature=[0.1] * 32,
+            risk_score=0.5,
+            recurrence_score=3.5,
+            timestamp=datetime.utcnow(),
+        )
+        data = serializer.serialize_health_binary(summary)
+
+        with pytest.raises(ValueError):
+            serializer.deserialize_health_binary(data[:-4])
+        with pytest.raises(ValueError):
+            serializer.deserialize_health_binary(b"X" + data[1:])
+
 
 class TestPerformance:
     """Performance tests for serialization."""
@@ -287,6 +287,19 @@ class TestDeduplication:
         # Window should be ~1000
         assert len(delivery.received_seqs) <= 1100
 
+    def test_sequence_window_evicts_oldest(self):
+        """Test dedup window expires the oldest sequences first."""
+        config, agent_id = create_config()
+        bus = create_bus(config)
+
+        delivery = ReliableDelivery(bus, agent_id)
+
+        for i in range(1001):
+            delivery.mark_received(i)
+
+        assert delivery.mark_received(0) is True
+        assert delivery.mark_received(1000) is False
+
 
 class TestAdaptiveRetry:
     """Test adaptive retry with exponential backoff."""
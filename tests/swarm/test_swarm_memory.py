@@ -283,6 +283,30 @@ class TestPeerSelection:
 
         assert len(peers) <= 2
 
+    def test_get_nearest_peers_cached_until_rssi_changes(self, swarm_memory, mock_registry, peer_ids):
+        """Test nearest-peer ordering is reused and invalidated by RSSI updates."""
+        mock_registry.get_alive_peers.return_value = peer_ids[:4]
+        swarm_memory.update_peer_rssi(peer_ids[0], -80.0)
+        swarm_memory.update_peer_rssi(peer_ids[1], -50.0)
+
+        first = swarm_memory._get_nearest_peers()
+        assert first[0] == peer_ids[1]
+        assert swarm_memory._get_nearest_peers() == first
+
+        swarm_memory.update_peer_rssi(peer_ids[3], -40.0)
+        assert swarm_memory._get_nearest_peers()[0] == peer_ids[3]
+
+    def test_get_nearest_peers_invalidated_by_alive_set(self, swarm_memory, mock_registry, peer_ids):
+        """Test a change in alive peers recomputes the ordering."""
+        swarm_memory.update_peer_rssi(peer_ids[0], -50.0)
+        mock_registry.get_alive_peers.return_value = peer_ids[:3]
+        assert swarm_memory._get_nearest_peers()[0] == peer_ids[0]
+
+        mock_registry.get_alive_peers.return_value = peer_ids[1:4]
+        peers = swarm_memory._get_nearest_peers()
+        assert peer_ids[0] not in peers
+        assert peers == peer_ids[1:4]
+
 
 # Test: Peer Replication
 
@@ -339,6 +363,58 @@ class TestPeerReplication:
 
         assert swarm_memory.metrics.replication_failures > 0
 
+    @pytest.mark.asyncio
+    async def test_burst_coalesced_into_one_batch_per_peer(self, swarm_memory, mock_bus, peer_ids, mock_registry):
+        """Test a burst of puts is sent as one frame per peer, not one per pattern."""
+        mock_registry.get_alive_peers.return_value = peer_ids[:3]
+        swarm_memory._running = True
+
+        for i in range(5):
+            await swarm_memory.put(f"pattern-{i:03d}", create_test_pattern(f"pattern-{i:03d}"))
+        # Re-putting a queued key replaces it instead of sending it twice
+        await swarm_memory.put("pattern-000", create_test_pattern("pattern-000", risk_score=0.9))
+        await swarm_memory.stop()
+
+        assert mock_bus.publish.call_count == 3
+        receivers = {call.kwargs["receiver"] for call in mock_bus.publish.call_args_list}
+        assert receivers == set(peer_ids[:3])
+        assert swarm_memory.metrics.replication_batches == 3
+        assert swarm_memory.metrics.replication_count == 15
+        assert len(swarm_memory.peer_caches[peer_ids[0]].pattern_ids) == 5
+
+    @pytest.mark.asyncio
+    async def test_batch_split_at_size_threshold(self, swarm_memory, mock_bus, peer_ids, mock_registry):
+        """Test a queue larger than the batch limit is split across frames."""
+        mock_registry.get_alive_peers.return_value = [peer_ids[0]]
+        pattern = create_test_pattern("pattern-000")
+        per_batch = swarm_memory.REPLICATION_BATCH_MAX_BYTES // swarm_memory._estimate_pattern_size(pattern)
+
+        for i in range(per_batch + 1):
+            swarm_memory._enqueue_replication(f"pattern-{i:03d}", pattern)
+        assert swarm_memory._flush_event.is_set()
+        await swarm_memory._flush_replication()
+
+        assert mock_bus.publish.call_count == 2
+        assert swarm_memory.metrics.replication_count == per_batch + 1
+
+    @pytest.mark.asyncio
+    async def test_batch_frame_roundtrip(self, swarm_memory, mock_bus, peer_ids, mock_registry, tmp_path):
+        """Test a peer can apply a batched replication frame."""
+        mock_registry.get_alive_peers.return_value = [peer_ids[0]]
+        await swarm_memory._replicate_to_peers("pattern-001", create_test_pattern("pattern-001"))
+        frame = mock_bus.publish.call_args.args[1]
+
+        peer_memory = SwarmAdaptiveMemory(
+            local_path=str(tmp_path / "peer.pkl"),
+            registry=mock_registry,
+            bus=mock_bus,
+            compressor=MagicMock(spec=StateCompressor),
+        )
+        await peer_memory._handle_replication(frame)
+
+        assert "pattern-001" in peer_memory._local_pattern_cache
+        assert peer_memory._local_pattern_cache["pattern-001"].risk_score == 0.8
+
 
 # Test: Bandwidth-Aware Eviction
 
@@ -6,6 +6,9 @@ import pickle
 from unittest.mock import patch, MagicMock, AsyncMock
 from anomaly.anomaly_detector import (
     detect_anomaly,
+    detect_anomaly_batch,
+    detect_anomaly_heuristic_arrays,
+    HeuristicThresholds,
     _detect_anomaly_heuristic,
     load_model,
     _MODEL,
@@ -123,6 +126,41 @@ class TestAnomalyDetector:
                 assert is_anomalous
                 assert score == 0.8
 
+    @pytest.mark.asyncio
+    @patch('anomaly.anomaly_detector._MODEL_LOADED', True)
+    @patch('anomaly.anomaly_detector._MODEL')
+    @patch('anomaly.anomaly_detector._USING_HEURISTIC_MODE', False)
+    async def test_detect_anomaly_batch_single_model_call(self, mock_model):
+        """Batch detection scores valid points with one model call, in order."""
+        mock_model.predict.return_value = [1, 0]
+        mock_model.score_samples.return_value = [0.8, 1.7]
+
+        batch = [
+            {"voltage": 8.0, "temperature": 25.0, "gyro": -0.5, "current": 1.0, "wheel_speed": 10.0},
+            {"voltage": "invalid", "temperature": 25.0, "gyro": 0.0},
+            {"voltage": 7.5, "temperature": 30.0, "gyro": 0.1, "current": 1.0, "wheel_speed": 10.0},
+        ]
+
+        with patch('anomaly.anomaly_detector.get_resource_monitor') as mock_rm_get:
+            mock_monitor = MagicMock()
+            mock_monitor.check_resource_health.return_value = {'overall': 'healthy'}
+            mock_rm_get.return_value = mock_monitor
+
+            results = await detect_anomaly_batch(batch)
+
+        mock_model.predict.assert_called_once_with([[8.0, 25.0, 0.5], [7.5, 30.0, 0.1]])
+        mock_monitor.check_resource_health.assert_called_once()
+        assert len(results) == 3
+        assert results[0] == (True, 0.8)
+        assert results[2] == (False, 1.0)
+        # Invalid point falls back to the heuristic, like detect_anomaly
+        assert results[1][0] is True
+
+    @pytest.mark.asyncio
+    async def test_detect_anomaly_batch_empty(self):
+        """Empty batches return no results."""
+        assert await detect_anomaly_batch([]) == []
+
     @pytest.mark.asyncio
     async def test_detect_anomaly_resource_critical(self):
         """Test anomaly detection uses heuristic when resources are critical."""
@@ -189,6 +227,49 @@ class TestAnomalyDetector:
         assert score > 0.5  # Combined score should be high
         assert is_anomalous
 
+    def test_heuristic_arrays_match_scalar(self):
+        """Array heuristic matches the scalar heuristic exactly."""
+        import numpy as np
+        rng = np.random.default_rng(5)
+        n = 2000
+        voltage = rng.uniform(6.0, 10.0, n)
+        temperature = rng.uniform(20.0, 50.0, n)
+        gyro = rng.uniform(-0.2, 0.2, n)
+        noise = rng.uniform(0.0, 0.1, n)
+
+        def reference(v, t, g, e):
+            # Rule-by-rule scalar scoring the array version must reproduce
+            score = 0.0
+            if v < 7.0 or v > 9.0:
+                score += 0.4
+            if t > 40.0:
+                score += 0.3
+            if abs(g) > 0.1:
+                score += 0.3
+            score += e
+            return score > 0.5, min(score, 1.0)
+
+        expected = [reference(*row) for row in zip(voltage, temperature, gyro, noise)]
+        flags, scores = detect_anomaly_heuristic_arrays(voltage, temperature, gyro, noise=noise)
+        assert list(zip(flags.tolist(), scores.tolist())) == expected
+
+        # The scalar API is a wrapper over the same rules
+        with patch('anomaly.anomaly_detector.random.uniform', return_value=noise[0]):
+            scalar = _detect_anomaly_heuristic({"voltage": voltage[0], "temperature": temperature[0], "gyro": gyro[0]})
+        assert scalar == expected[0]
+
+    def test_heuristic_thresholds_from_config(self, tmp_path):
+        """Heuristic thresholds load from the config file."""
+        config = tmp_path / "thresholds.yaml"
+        config.write_text("heuristic:\n  temperature_max: 30.0\n  anomaly_threshold: 0.2\n")
+        thresholds = HeuristicThresholds.from_config(str(config))
+
+        assert thresholds.temperature_max == 30.0
+        assert thresholds.voltage_min == HeuristicThresholds().voltage_min
+        flags, scores = detect_anomaly_heuristic_arrays([8.0], [35.0], [0.0], thresholds, noise=[0.0])
+        assert flags.tolist() == [True]
+        assert scores.tolist() == [0.3]
+
     @pytest.mark.asyncio
     async def test_detect_anomaly_validation_error(self):
         """Test anomaly detection handles validation errors."""
@@ -167,6 +167,25 @@ class TestBatchEndpoints:
         assert data["anomalies_detected"] >= 1
         assert len(data["results"]) == 3
 
+    def test_batch_preserves_order(self, client):
+        """Batch results line up with the submitted points."""
+        points = [
+            {"voltage": 8.0, "temperature": 25.0, "gyro": 0.01},
+            {"voltage": 6.5, "temperature": 25.0, "gyro": 0.01},
+            {"voltage": 8.0, "temperature": 50.0, "gyro": 0.01},
+            {"voltage": 8.0, "temperature": 25.0, "gyro": 0.01},
+        ] * 25
+        response = client.post("/api/v1/telemetry/batch", json={"telemetry": points})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_processed"] == len(points)
+        assert data["anomalies_detected"] == sum(r["is_anomaly"] for r in data["results"])
+        for point, result in zip(points, data["results"]):
+            if point["voltage"] < 7.0 and result["is_anomaly"]:
+                assert result["anomaly_type"] == "power_fault"
+            if not result["is_anomaly"]:
+                assert result["anomaly_type"] == "normal"
+
     def test_batch_empty_validation(self, client):
         """Test batch validation with empty list."""
         batch = {"telemetry": []}
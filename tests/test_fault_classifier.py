@@ -0,0 +1,83 @@
+"""
+Tests for the rule-based fault classifier.
+"""
+
+import random
+
+import numpy as np
+
+from classifier.fault_classifier import (
+    FaultThresholds,
+    classify,
+    classify_arrays,
+    classify_batch,
+    classify_structured,
+    set_fault_thresholds,
+)
+
+
+class TestClassifyBatch:
+    """Batch classification must match the scalar classifier"""
+
+    def test_matches_scalar_classify(self):
+        rng = random.Random(7)
+        records = [
+            {
+                "voltage": rng.uniform(6.0, 9.0),
+                "temperature": rng.uniform(10.0, 45.0),
+                "gyro": rng.uniform(-0.2, 0.2),
+            }
+            for _ in range(500)
+        ]
+        # Boundary values and missing keys use the same defaults
+        records += [
+            {"voltage": 7.3, "temperature": 32.0, "gyro": 0.05},
+            {"voltage": 7.29, "temperature": 50.0, "gyro": 1.0},
+            {"temperature": 33.0},
+            {},
+        ]
+
+        assert classify_batch(records) == [classify(r) for r in records]
+
+    def test_empty_batch(self):
+        assert classify_batch([]) == []
+
+
+class TestClassifyArrays:
+    """Array-native classification and configurable thresholds"""
+
+    def test_columns_and_structured_match_scalar(self):
+        rng = np.random.default_rng(3)
+        telemetry = np.zeros(1000, dtype=[("voltage", "f8"), ("temperature", "f8"), ("gyro", "f8")])
+        telemetry["voltage"] = rng.uniform(6.0, 9.0, 1000)
+        telemetry["temperature"] = rng.uniform(10.0, 45.0, 1000)
+        telemetry["gyro"] = rng.uniform(-0.2, 0.2, 1000)
+
+        expected = [
+            classify({"voltage": v, "temperature": t, "gyro": g})
+            for v, t, g in telemetry.tolist()
+        ]
+        labels = classify_arrays(telemetry["voltage"], telemetry["temperature"], telemetry["gyro"])
+        assert labels.tolist() == expected
+        assert classify_structured(telemetry).tolist() == expected
+
+    def test_structured_missing_fields_use_defaults(self):
+        telemetry = np.array([(33.0,), (20.0,)], dtype=[("temperature", "f8")])
+        assert classify_structured(telemetry).tolist() == ["thermal_fault", "normal"]
+
+    def test_thresholds_from_config(self, tmp_path):
+        config = tmp_path / "thresholds.yaml"
+        config.write_text("classifier:\n  voltage_min: 7.6\n")
+        thresholds = FaultThresholds.from_config(str(config))
+
+        assert thresholds == FaultThresholds(voltage_min=7.6)
+        assert classify_arrays([7.5], [25.0], [0.0], thresholds).tolist() == ["power_fault"]
+        assert classify_arrays([7.5], [25.0], [0.0]).tolist() == ["normal"]
+
+    def test_active_thresholds_override(self):
+        try:
+            set_fault_thresholds(FaultThresholds(temperature_max=20.0))
+            assert classify({"temperature": 25.0}) == "thermal_fault"
+        finally:
+            set_fault_thresholds(None)
+        assert classify({"temperature": 25.0}) == "normal"
@@ -0,0 +1,125 @@
+"""
+Tests for the predictive-maintenance rolling feature store.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from security_engine.feature_store import (
+    METRIC_COLUMNS,
+    ROLLING_METRICS,
+    TABLE_COLUMNS,
+    RollingFeatureStore,
+)
+
+
+@dataclass
+class Point:
+    """Minimal stand-in for TimeSeriesData"""
+    timestamp: datetime
+    cpu_usage: float
+    memory_usage: float
+    network_latency: float
+    disk_io: float
+    error_rate: float
+    response_time: float
+    active_connections: int
+    failure_occurred: bool = False
+
+
+def make_points(n, start=None, seed=0):
+    rng = np.random.default_rng(seed)
+    start = start or datetime.now() - timedelta(days=1)
+    return [
+        Point(
+            timestamp=start + timedelta(seconds=i),
+            cpu_usage=float(rng.normal(45, 10)),
+            memory_usage=float(rng.normal(60, 15)),
+            network_latency=float(rng.normal(50, 20)),
+            disk_io=float(rng.normal(100, 30)),
+            error_rate=float(rng.normal(0.1, 0.05)),
+            response_time=float(rng.normal(200, 50)),
+            active_connections=int(rng.integers(10, 50)),
+            failure_occurred=bool(rng.random() < 0.1),
+        )
+        for i in range(n)
+    ]
+
+
+def pandas_training_set(points, target):
+    """Reference: the DataFrame pipeline the feature store replaces"""
+    df = pd.DataFrame([
+        {**{c: getattr(p, c) for c in METRIC_COLUMNS}, "failure_occurred": p.failure_occurred}
+        for p in points
+    ])
+    for col in ROLLING_METRICS:
+        df[f"{col}_rolling_mean_3"] = df[col].rolling(window=3).mean()
+        df[f"{col}_rolling_std_3"] = df[col].rolling(window=3).std()
+        df[f"{col}_rolling_mean_6"] = df[col].rolling(window=6).mean()
+        df[f"{col}_rolling_std_6"] = df[col].rolling(window=6).std()
+    df = df.dropna()
+    feature_cols = [c for c in df.columns if c != target]
+    assert feature_cols == [c for c in TABLE_COLUMNS if c != target]
+    return df[feature_cols].values.astype(float), df[target].values
+
+
+class TestRollingFeatureStore:
+
+    @pytest.mark.parametrize("target", ["cpu_usage", "disk_io", "error_rate"])
+    def test_training_set_matches_pandas(self, target):
+        points = make_points(300)
+        store = RollingFeatureStore(initial_capacity=16)
+        store.extend(points)
+
+        features, targets = store.training_set(target)
+        expected_features, expected_targets = pandas_training_set(points, target)
+
+        np.testing.assert_allclose(features, expected_features, rtol=1e-9, atol=1e-9)
+        np.testing.assert_allclose(targets, expected_targets)
+
+    def test_retention_expires_old_points(self):
+        old = make_points(50, start=datetime.now() - timedelta(days=40))
+        recent = make_points(20, seed=1)
+        store = RollingFeatureStore(retention=timedelta(days=30), initial_capacity=8)
+        store.extend(old + recent)
+
+        assert len(store) == 20
+        assert store.timestamps[0] == pytest.approx(recent[0].timestamp.timestamp())
+        features, _ = store.training_set("cpu_usage")
+        assert features.shape == (20, len(TABLE_COLUMNS) - 1)
+
+    def test_current_features_use_trailing_window(self):
+        points = make_points(12)
+        store = RollingFeatureStore()
+        store.extend(points)
+        current = make_points(1, seed=9)[0]
+
+        row = store.current_features(current, history=10)
+
+        cpu = np.array([p.cpu_usage for p in points[-10:]] + [current.cpu_usage])
+        mean_3, std_3, mean_6, std_6 = row[len(METRIC_COLUMNS) + 1:len(METRIC_COLUMNS) + 5]
+        assert mean_3 == pytest.approx(cpu[-3:].mean())
+        assert std_3 == pytest.approx(cpu[-3:].std(ddof=1))
+        assert mean_6 == pytest.approx(cpu[-6:].mean())
+        assert std_6 == pytest.approx(cpu[-6:].std(ddof=1))
+        assert row[TABLE_COLUMNS.index("failure_occurred")] == 0.0
+
+    def test_current_features_without_history(self):
+        store = RollingFeatureStore()
+        store.extend(make_points(2))
+        row = store.current_features(make_points(1, seed=3)[0], history=10)
+        assert not row[len(METRIC_COLUMNS):].any()
+
+    def test_to_records_round_trip(self):
+        points = make_points(5)
+        store = RollingFeatureStore()
+        store.extend(points)
+
+        records = store.to_records(Point)
+        assert [r.cpu_usage for r in records] == [p.cpu_usage for p in points]
+        assert [r.failure_occurred for r in records] == [p.failure_occurred for p in points]
+        assert isinstance(records[0].active_connections, int)
@@ -190,6 +190,193 @@ class TestAdaptiveMemoryStore:
             self.memory.storage_path = original_path
             os.unlink(corrupted_path)
 
+    def test_retrieve_matches_scalar_scoring(self):
+        """Test batched retrieval scores match the per-event formula"""
+        embeddings = [np.random.rand(384) for _ in range(20)]
+        for i, embedding in enumerate(embeddings):
+            self.memory.write(embedding, {'type': f'event_{i}'},
+                              timestamp=datetime.now() - timedelta(hours=i))
+
+        query = np.random.rand(384)
+        results = self.memory.retrieve(query, top_k=5)
+
+        expected = []
+        for event in self.memory.memory:
+            score = (
+                0.5 * self.memory._cosine_similarity(query, event.embedding)
+                + 0.3 * self.memory._temporal_weight(event)
+                + 0.2 * (1 + 0.3 * np.log(1 + event.recurrence_count))
+            )
+            expected.append((score, event.metadata['type']))
+        expected.sort(reverse=True, key=lambda x: x[0])
+
+        assert [r[1]['type'] for r in results] == [e[1] for e in expected[:5]]
+        for (score, _, _), (expected_score, _) in zip(results, expected):
+            assert score == pytest.approx(expected_score, abs=1e-5)
+
+    def test_index_stays_aligned_after_prune(self):
+        """Test embedding matrix rows follow events through pruning"""
+        old_time = datetime.now() - timedelta(hours=48)
+        for i in range(10):
+            timestamp = old_time if i % 2 else datetime.now()
+            self.memory.write(np.random.rand(384), {'type': f'event_{i}'}, timestamp=timestamp)
+
+        self.memory.prune(max_age_hours=24, keep_critical=False)
+
+        assert len(self.memory.memory) == 5
+        assert self.memory._matrix.size == 5
+        top = self.memory.retrieve(self.memory.memory[2].embedding, top_k=1)
+        assert top[0][1]['type'] == self.memory.memory[2].metadata['type']
+
+    def test_approximate_index_above_threshold(self):
+        """Test IVF index is used above ann_threshold and still detects recurrence"""
+        memory = AdaptiveMemoryStore(max_capacity=1000, ann_threshold=200, ann_background=False)
+        for i in range(300):
+            memory.write(np.random.randn(64), {'type': f'event_{i}'})
+
+        assert memory._ann is not None
+        target = memory.memory[150]
+        memory.write(target.embedding, target.metadata)
+
+        assert len(memory.memory) == 300
+        assert target.recurrence_count == 2
+        assert memory.retrieve(target.embedding, top_k=1)[0][1]['type'] == 'event_150'
+
+    def test_dimension_mismatch_rejected(self):
+        """Test embeddings of a different dimension are rejected"""
+        self.memory.write(np.random.rand(384), {'type': 'event'})
+        with pytest.raises(ValueError):
+            self.memory.write(np.random.rand(128), {'type': 'event'})
+
+    def test_write_batch_matches_sequential_writes(self):
+        """Test write_batch stores events like repeated write calls"""
+        embeddings = [np.random.rand(384) for _ in range(4)]
+        embeddings.append(embeddings[1])  # recurs against an earlier batch item
+        metadatas = [{'type': f'event_{i}'} for i in range(5)]
+        timestamps = [datetime.now() - timedelta(minutes=5 - i) for i in range(5)]
+
+        self.memory.write_batch(embeddings, metadatas, timestamps)
+
+        assert len(self.memory.memory) == 4
+        assert [e.metadata['type'] for e in self.memory.memory] == [f'event_{i}' for i in range(4)]
+        assert self.memory.memory[1].recurrence_count == 2
+
+        # Nothing is written when any item is invalid
+        with pytest.raises(ValueError):
+            self.memory.write_batch([np.random.rand(384), np.random.rand(128)], [{}, {}])
+        assert len(self.memory.memory) == 4
+
+    def test_save_load_roundtrip_segments(self, tmp_path):
+        """Test segment persistence round-trips events, recurrence and appends"""
+        self.memory.storage_path = str(tmp_path / 'store')
+        embeddings = [np.random.rand(384) for _ in range(5)]
+        for i, embedding in enumerate(embeddings):
+            self.memory.write(embedding, {'type': f'event_{i}', 'critical': i == 0})
+        self.memory.save()
+
+        # Writes after the first save are appended incrementally
+        self.memory.write(embeddings[2], {'type': 'event_2'})
+        self.memory.write(np.random.rand(384), {'type': 'event_5'})
+        self.memory.save()
+
+        restored = AdaptiveMemoryStore(decay_lambda=0.1, max_capacity=100)
+        restored.storage_path = self.memory.storage_path
+        assert restored.load() is True
+
+        assert [e.metadata['type'] for e in restored.memory] == [f'event_{i}' for i in range(6)]
+        assert restored.memory[2].recurrence_count == 2
+        assert 'last_seen' in restored.memory[2].metadata
+        assert restored.memory[0].is_critical
+        top = restored.retrieve(embeddings[3], top_k=1)
+        assert top[0][1]['type'] == 'event_3'
+
+    def test_prune_compacts_segments(self, tmp_path):
+        """Test pruned events are dropped from disk by compaction"""
+        self.memory.storage_path = str(tmp_path / 'store')
+        old_time = datetime.now() - timedelta(hours=48)
+        for i in range(10):
+            timestamp = old_time if i < 8 else datetime.now()
+            self.memory.write(np.random.rand(384), {'type': f'event_{i}'}, timestamp=timestamp)
+        self.memory.save()
+
+        assert self.memory.prune(max_age_hours=24, keep_critical=False) == 8
+        self.memory.save()
+
+        assert self.memory._segments.rows == 2
+        restored = AdaptiveMemoryStore(decay_lambda=0.1, max_capacity=100)
+        restored.storage_path = self.memory.storage_path
+        restored.load()
+        assert [e.metadata['type'] for e in restored.memory] == ['event_8', 'event_9']
+
+    def test_load_legacy_pickle(self, tmp_path):
+        """Test stores pickled by earlier releases still load and migrate"""
+        import pickle
+        events = [MemoryEvent(np.random.rand(384), {'type': f'event_{i}'}, datetime.now())
+                  for i in range(3)]
+        base_path = str(tmp_path / 'store')
+        with open(base_path + '.pkl', 'wb') as f:
+            pickle.dump(events, f)
+
+        self.memory.storage_path = base_path
+        assert self.memory.load() is True
+        assert [e.metadata['type'] for e in self.memory.memory] == ['event_0', 'event_1', 'event_2']
+
+        self.memory.save()
+        assert os.path.isdir(base_path)
+
+    def test_replay_orders_out_of_order_writes(self):
+        """Test replay returns chronological order regardless of write order"""
+        now = datetime.now()
+        for hours in (3, 1, 2, 0):
+            self.memory.write(np.random.rand(384), {'hours_ago': hours},
+                              timestamp=now - timedelta(hours=hours))
+
+        events = self.memory.replay(now - timedelta(hours=2), now)
+
+        assert [e['hours_ago'] for e in events] == [2, 1, 0]
+
+    def test_iter_replay_streams_in_chunks(self):
+        """Test streaming replay matches list replay across chunk boundaries"""
+        now = datetime.now()
+        for i in range(25):
+            self.memory.write(np.random.rand(384), {'index': i},
+                              timestamp=now - timedelta(minutes=25 - i))
+
+        start, end = now - timedelta(minutes=20), now
+        streamed = list(self.memory.iter_replay(start, end, chunk_size=4))
+
+        assert streamed == self.memory.replay(start, end)
+        assert [e['index'] for e in streamed] == list(range(5, 25))
+
+    def test_get_incident_events_tracks_writes_and_prunes(self):
+        """Test incident lookups follow new writes and pruning"""
+        now = datetime.now()
+        self.memory.write(np.random.rand(384), {'incident_id': 'inc-1', 'step': 1},
+                          timestamp=now - timedelta(hours=48))
+        self.memory.write(np.random.rand(384), {'incident_id': 'inc-2'})
+        assert len(self.memory.get_incident_events('inc-1')) == 1
+
+        self.memory.write(np.random.rand(384), {'incident_id': 'inc-1', 'step': 2})
+        assert [e.metadata['step'] for e in self.memory.get_incident_events('inc-1')] == [1, 2]
+
+        self.memory.prune(max_age_hours=24, keep_critical=False)
+        assert [e.metadata['step'] for e in self.memory.get_incident_events('inc-1')] == [2]
+        assert self.memory.get_incident_events('missing') == []
+
+    def test_replay_engine_incident_timeline(self):
+        """Test ReplayEngine reconstructs an incident via the incident index"""
+        from memory_engine.replay_engine import ReplayEngine
+
+        now = datetime.now()
+        for minutes in (5, 10, 1):
+            self.memory.write(np.random.rand(384), {'incident_id': 'inc-7', 'minutes': minutes},
+                              timestamp=now - timedelta(minutes=minutes))
+
+        incident = ReplayEngine(self.memory).replay_incident('inc-7')
+
+        assert incident['event_count'] == 3
+        assert [e['metadata']['minutes'] for e in incident['timeline']] == [10, 5, 1]
+
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -0,0 +1,79 @@
+"""
+Tests for the predictive-maintenance model registry and training worker.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pytest
+
+from security_engine.feature_store import TABLE_COLUMNS
+from security_engine.model_registry import CURRENT_FILE, ModelRegistry
+from security_engine.model_training import MIN_TRAINING_ROWS, train_target_models
+
+
+def make_rows(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.normal(50, 10, size=(n, len(TABLE_COLUMNS)))
+
+
+class TestModelRegistry:
+
+    def test_publish_swaps_current_and_persists(self, tmp_path):
+        registry = ModelRegistry(str(tmp_path))
+        assert registry.current is None
+
+        first = registry.publish({"a": {"m": 1}}, {"a": "s1"})
+        second = registry.publish({"a": {"m": 2}}, {"a": "s2"}, {"a": 0.9})
+
+        assert (first.version, second.version) == (1, 2)
+        assert registry.current is second
+        assert (tmp_path / CURRENT_FILE).read_text() == "2"
+
+        reloaded = ModelRegistry(str(tmp_path))
+        snapshot = reloaded.load_current()
+        assert snapshot.version == 2
+        assert snapshot.models == {"a": {"m": 2}}
+        assert snapshot.metrics == {"a": 0.9}
+
+    def test_previous_snapshot_unaffected_by_publish(self, tmp_path):
+        registry = ModelRegistry(str(tmp_path))
+        registry.publish({"a": {"m": 1}}, {})
+        held = registry.current
+        registry.publish({"a": {"m": 2}}, {})
+        assert held.models == {"a": {"m": 1}}
+
+    def test_old_versions_are_pruned(self, tmp_path):
+        registry = ModelRegistry(str(tmp_path), keep_versions=2)
+        for i in range(5):
+            registry.publish({"a": {"m": i}}, {})
+        assert registry.versions() == [4, 5]
+        assert not any(name.endswith(".tmp") for name in os.listdir(tmp_path / "versions"))
+
+    def test_empty_registry_loads_nothing(self, tmp_path):
+        assert ModelRegistry(str(tmp_path)).load_current() is None
+
+    def test_invalid_keep_versions(self, tmp_path):
+        with pytest.raises(ValueError):
+            ModelRegistry(str(tmp_path), keep_versions=0)
+
+
+class TestTrainTargetModels:
+
+    def test_trains_each_target_once(self):
+        fitted = train_target_models(make_rows(120), ["cpu_usage", "error_rate", "error_rate"])
+
+        assert set(fitted) == {"cpu_usage", "error_rate"}
+        result = fitted["cpu_usage"]
+        features = np.delete(make_rows(120), TABLE_COLUMNS.index("cpu_usage"), axis=1)
+        assert result["random_forest"].predict(result["scaler"].transform(features[:3])).shape == (3,)
+        assert set(result["durations"]) == {"random_forest", "isolation_forest"}
+
+    def test_skips_targets_with_too_few_rows(self):
+        assert train_target_models(make_rows(MIN_TRAINING_ROWS - 1), ["cpu_usage"]) == {}
+
+    def test_runs_in_process_pool(self):
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            fitted = pool.submit(train_target_models, make_rows(80), ["disk_io"]).result(timeout=120)
+        assert "disk_io" in fitted
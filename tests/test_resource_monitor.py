@@ -10,6 +10,7 @@ Validates:
 
 import pytest
 import psutil
+import time
 from unittest.mock import Mock, patch
 from datetime import datetime, timedelta
 from core.resource_monitor import (
@@ -254,6 +255,90 @@ class TestResourceMonitor:
         assert metrics.memory_percent == 0.0
 
 
+class TestResourceSampler:
+    """Test cached snapshots and the background sampler"""
+
+    def _patched_psutil(self, cpu=50.0):
+        return (
+            patch('psutil.cpu_percent', return_value=cpu),
+            patch('psutil.virtual_memory', return_value=Mock(percent=50.0, available=1024*1024*1024)),
+            patch('psutil.disk_usage', return_value=Mock(percent=50.0)),
+        )
+
+    def test_cpu_sampling_is_non_blocking(self):
+        """CPU usage is read with interval=None (no sleep)"""
+        monitor = ResourceMonitor()
+        with patch('psutil.cpu_percent', return_value=10.0) as mock_cpu, \
+             patch('psutil.virtual_memory', return_value=Mock(percent=50.0, available=1024*1024*1024)), \
+             patch('psutil.disk_usage', return_value=Mock(percent=50.0)):
+            monitor.get_current_metrics()
+
+        for call in mock_cpu.call_args_list:
+            assert call.kwargs.get('interval') is None
+
+    def test_latest_metrics_cached_within_staleness(self):
+        """Fresh snapshots are served from cache without sampling"""
+        monitor = ResourceMonitor(max_staleness=60.0)
+        cpu, mem, disk = self._patched_psutil(cpu=40.0)
+        with cpu, mem, disk:
+            first = monitor.get_latest_metrics()
+
+        with patch('psutil.cpu_percent', side_effect=AssertionError("sampled")):
+            assert monitor.get_latest_metrics() is first
+            assert monitor.check_resource_health()['cpu'] == 'healthy'
+
+    def test_stale_snapshot_is_refreshed(self):
+        """Snapshots older than max_staleness trigger an inline sample"""
+        monitor = ResourceMonitor(max_staleness=0.0)
+        cpu, mem, disk = self._patched_psutil(cpu=40.0)
+        with cpu, mem, disk:
+            monitor.get_latest_metrics()
+        cpu, mem, disk = self._patched_psutil(cpu=95.0)
+        with cpu, mem, disk:
+            time.sleep(0.001)
+            assert monitor.get_latest_metrics().cpu_percent == 95.0
+
+    def test_background_sampler_refreshes_snapshot(self):
+        """The sampler thread fills history until stopped"""
+        monitor = ResourceMonitor(sample_interval=0.01, history_size=1000)
+        monitor.start_sampler()
+        try:
+            assert monitor.sampler_running
+            deadline = time.time() + 2.0
+            while len(monitor.get_history()) < 3 and time.time() < deadline:
+                time.sleep(0.01)
+        finally:
+            monitor.stop_sampler(timeout=1.0)
+
+        assert len(monitor.get_history()) >= 3
+        assert not monitor.sampler_running
+
+    def test_history_expires_old_entries(self):
+        """Entries outside the time window are dropped from the ring buffer"""
+        monitor = ResourceMonitor(history_size=10)
+        old = ResourceMetrics(
+            cpu_percent=1.0,
+            memory_percent=1.0,
+            memory_available_mb=1.0,
+            disk_usage_percent=1.0,
+            process_memory_mb=1.0,
+            timestamp=datetime.now() - timedelta(hours=2)
+        )
+        monitor._metrics_history.append(old)
+        cpu, mem, disk = self._patched_psutil()
+        with cpu, mem, disk:
+            monitor.get_current_metrics()
+
+        history = monitor.get_history()
+        assert len(history) == 1
+        assert history[0]['cpu_percent'] == 50.0
+
+    def test_invalid_sample_interval(self):
+        """Non-positive sample intervals are rejected"""
+        with pytest.raises(ValueError):
+            ResourceMonitor(sample_interval=0)
+
+
 class TestResourceMonitorSingleton:
     """Test resource monitor singleton"""
     
@@ -11,12 +11,15 @@ Validates:
 import pytest
 import asyncio
 import time
+import threading
 from core.timeout_handler import (
     with_timeout,
     async_timeout,
     TimeoutContext,
     TimeoutError as CustomTimeoutError,
     get_timeout_config,
+    get_timeout_metrics,
+    reset_timeout_metrics,
 )
 
 
@@ -72,6 +75,71 @@ class TestTimeoutDecorator:
             assert e.start_time is not None
 
 
+class TestTimeoutFastPath:
+    """Test inline deadline mode, pool reuse and overhead metrics"""
+
+    def setup_method(self):
+        reset_timeout_metrics()
+
+    def test_inline_runs_on_calling_thread(self):
+        """Test inline mode does not hand off to another thread"""
+        @with_timeout(seconds=1.0, inline=True)
+        def operation():
+            return threading.get_ident()
+
+        assert operation() == threading.get_ident()
+
+    def test_inline_deadline_exceeded(self):
+        """Test inline mode raises TimeoutError once the deadline is exceeded"""
+        @with_timeout(seconds=0.05, operation_name="short_op", inline=True)
+        def operation():
+            time.sleep(0.1)
+
+        with pytest.raises(CustomTimeoutError) as exc_info:
+            operation()
+
+        assert exc_info.value.operation == "short_op"
+        assert get_timeout_metrics()["short_op"]["timeouts"] == 1
+
+    def test_inline_preserves_exception(self):
+        """Test inline mode surfaces the function's own exception"""
+        @with_timeout(seconds=1.0, inline=True)
+        def operation():
+            raise ValueError("inline error")
+
+        with pytest.raises(ValueError):
+            operation()
+
+    def test_nested_call_runs_inline_on_worker(self):
+        """Test nested decorated calls reuse the outer worker thread"""
+        @with_timeout(seconds=1.0)
+        def inner():
+            return threading.get_ident()
+
+        @with_timeout(seconds=2.0)
+        def outer():
+            return threading.get_ident(), inner()
+
+        outer_thread, inner_thread = outer()
+        assert outer_thread == inner_thread
+        assert outer_thread != threading.get_ident()
+
+    def test_metrics_track_calls_and_overhead(self):
+        """Test per-operation metrics are recorded"""
+        @with_timeout(seconds=1.0, operation_name="metered_op")
+        def operation():
+            return 42
+
+        for _ in range(5):
+            assert operation() == 42
+
+        stats = get_timeout_metrics()["metered_op"]
+        assert stats["calls"] == 5
+        assert stats["timeouts"] == 0
+        assert stats["avg_overhead_seconds"] >= 0.0
+        assert stats["max_overhead_seconds"] >= stats["avg_overhead_seconds"]
+
+
 class TestAsyncTimeout:
     """Test asynchronous timeout decorator"""
     
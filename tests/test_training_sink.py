@@ -0,0 +1,95 @@
+"""
+Tests for the predictive-maintenance training data sink and mirror policy.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from security_engine.training_sink import (
+    RECORD_DTYPE,
+    MemoryMirrorPolicy,
+    TrainingDataSink,
+)
+
+
+@dataclass
+class Point:
+    """Minimal stand-in for TimeSeriesData"""
+    timestamp: datetime
+    cpu_usage: float = 40.0
+    memory_usage: float = 50.0
+    network_latency: float = 20.0
+    disk_io: float = 100.0
+    error_rate: float = 0.1
+    response_time: float = 200.0
+    active_connections: int = 10
+    failure_occurred: bool = False
+
+
+def make_points(n, failures=()):
+    start = datetime(2024, 1, 1)
+    return [
+        Point(timestamp=start + timedelta(seconds=i), cpu_usage=float(i), failure_occurred=i in failures)
+        for i in range(n)
+    ]
+
+
+class TestTrainingDataSink:
+
+    def test_flushes_when_buffer_fills(self, tmp_path):
+        path = tmp_path / "sink" / "telemetry.bin"
+        sink = TrainingDataSink(str(path), flush_rows=4, flush_interval=3600)
+        sink.extend(make_points(6))
+
+        assert path.stat().st_size == 4 * RECORD_DTYPE.itemsize
+        assert sink.pending == 2
+        records = sink.read()
+        np.testing.assert_array_equal(records["cpu_usage"], np.arange(6, dtype=float))
+
+    def test_flushes_after_interval(self, tmp_path):
+        path = tmp_path / "telemetry.bin"
+        sink = TrainingDataSink(str(path), flush_rows=100, flush_interval=0)
+        sink.append(make_points(1)[0])
+        assert sink.pending == 0
+        assert path.stat().st_size == RECORD_DTYPE.itemsize
+
+    def test_read_filters_and_round_trips(self, tmp_path):
+        sink = TrainingDataSink(str(tmp_path / "telemetry.bin"), flush_rows=3)
+        points = make_points(5, failures={2})
+        sink.extend(points)
+        sink.close()
+
+        records = sink.read(since=points[2].timestamp.timestamp())
+        assert records.shape == (3,)
+        assert records["failure_occurred"].tolist() == [1, 0, 0]
+        assert records["timestamp"][0] == pytest.approx(points[2].timestamp.timestamp())
+
+    def test_rotates_large_files(self, tmp_path):
+        path = tmp_path / "telemetry.bin"
+        sink = TrainingDataSink(str(path), flush_rows=2, max_file_bytes=4 * RECORD_DTYPE.itemsize)
+        sink.extend(make_points(10))
+
+        assert (tmp_path / "telemetry.bin.1").exists()
+        # Only the newest rotated generation and the current file are kept
+        assert sink.read()["cpu_usage"].tolist() == [4.0, 5.0, 6.0, 7.0, 8.0, 9.0]
+
+    def test_invalid_flush_rows(self, tmp_path):
+        with pytest.raises(ValueError):
+            TrainingDataSink(str(tmp_path / "telemetry.bin"), flush_rows=0)
+
+
+class TestMemoryMirrorPolicy:
+
+    def test_default_mirrors_nothing(self):
+        policy = MemoryMirrorPolicy()
+        assert not policy.enabled
+        assert policy.select(make_points(5, failures={1})) == []
+
+    def test_failures_and_sampling(self):
+        policy = MemoryMirrorPolicy(mirror_failures=True, sample_every=4)
+        points = make_points(10, failures={3})
+        selected = policy.select(points[2:], start_index=2)
+        assert [p.cpu_usage for p in selected] == [3.0, 4.0, 8.0]